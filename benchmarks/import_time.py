@@ -0,0 +1,72 @@
+"""
+Benchmark: financial_advisor import time
+
+Measures, in fresh interpreters, how long it takes to import the
+financial_advisor package and, with --build, to build root_agent (which
+needs google-adk and Google Cloud credentials).
+
+The package is imported as a top-level package from src/, the way adk web
+loads it, so the framework modules in src/__init__.py are not timed.
+
+Usage:
+    python benchmarks/import_time.py [--runs 10] [--build]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+IMPORT_SNIPPET = "import financial_advisor"
+BUILD_SNIPPET = "import financial_advisor as fa; fa.root_agent"
+
+TIMER = (
+    "import time; _start = time.perf_counter(); {snippet}; "
+    "print(time.perf_counter() - _start)"
+)
+
+
+def measure(snippet: str, runs: int) -> list:
+    """Run a snippet in fresh interpreters and return its durations in seconds."""
+    durations = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-c", TIMER.format(snippet=snippet)],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+        durations.append(float(completed.stdout.strip().splitlines()[-1]))
+    return durations
+
+
+def report(label: str, durations: list):
+    """Print the median and spread of a set of timings."""
+    print(
+        f"{label:<10} median {statistics.median(durations) * 1000:8.2f} ms  "
+        f"min {min(durations) * 1000:8.2f} ms  max {max(durations) * 1000:8.2f} ms"
+    )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="interpreters per measurement")
+    parser.add_argument("--build", action="store_true", help="also time building root_agent")
+    args = parser.parse_args()
+
+    report("import", measure(IMPORT_SNIPPET, args.runs))
+    if args.build:
+        try:
+            report("build", measure(BUILD_SNIPPET, args.runs))
+        except RuntimeError as e:
+            print(f"build      failed: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,14 @@ Agent Framework
 A flexible framework for creating and managing AI agents.
 """
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, blocking
 from .example_agent import ExampleAgent
-from .agent_manager import AgentManager
+from .agent_manager import AgentManager, AgentTimeoutError, TaskCancelledError, TaskRejectedError
+from .result_cache import ResultCache
+from .scheduling import Priority
+from .rate_limit import RateLimiter
+from .registry import register_agent_class, resolve_agent_class
+from .resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
 
 __version__ = "0.1.0"
 __author__ = "Your Name"
@@ -15,5 +20,17 @@ __email__ = "your.email@example.com"
 __all__ = [
     "BaseAgent",
     "ExampleAgent", 
-    "AgentManager"
+    "AgentManager",
+    "AgentTimeoutError",
+    "TaskCancelledError",
+    "TaskRejectedError",
+    "ResultCache",
+    "Priority",
+    "RateLimiter",
+    "RetryPolicy",
+    "register_agent_class",
+    "resolve_agent_class",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "blocking"
 ]
\ No newline at end of file
@@ -7,12 +7,77 @@ including lifecycle management, coordination, and monitoring.
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import time
+import uuid
+from typing import AsyncIterator, Awaitable, Dict, List, Any, Optional, Tuple
+import yaml
 from src.base_agent import BaseAgent
+from src.metrics import MetricsRegistry
+from src.process_executor import ProcessAgentExecutor
+from src.rate_limit import RateLimiter
+from src.registry import resolve_agent_class
+from src.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from src.thread_executor import ThreadPoolDispatcher, call_in_new_loop
+from src.result_cache import ResultCache, make_cache_key
+from src.scheduling import FairQueue, Priority
 
 logger = logging.getLogger(__name__)
 
 
+class AgentTimeoutError(asyncio.TimeoutError):
+    """Raised when an agent does not finish processing before its deadline."""
+    
+    def __init__(self, agent_name: str, timeout: float):
+        """
+        Initialize the timeout error.
+        
+        Args:
+            agent_name: Name of the agent that timed out
+            timeout: Deadline in seconds that was exceeded
+        """
+        super().__init__(f"Agent {agent_name} timed out after {timeout}s")
+        self.agent_name = agent_name
+        self.timeout = timeout
+
+
+class TaskRejectedError(RuntimeError):
+    """Raised when a task is refused or dropped because the manager is overloaded."""
+    
+    def __init__(self, agent_name: str, reason: str):
+        """
+        Initialize the rejection error.
+        
+        Args:
+            agent_name: Name of the agent the task was for
+            reason: "rejected" when refused at submit, "shed" when dropped
+                from the queue to admit newer work
+        """
+        super().__init__(f"Task for agent {agent_name} {reason}: manager overloaded")
+        self.agent_name = agent_name
+        self.reason = reason
+
+
+OVERFLOW_POLICIES = ("block", "reject", "shed_oldest")
+
+# Seconds between checks while waiting for a removed agent's calls to finish
+DRAIN_POLL_INTERVAL = 0.05
+
+
+class TaskCancelledError(RuntimeError):
+    """Raised by get_result for a queued task dropped by stop(drain=False)."""
+    
+    def __init__(self, task_id: str):
+        """
+        Initialize the cancellation error.
+        
+        Args:
+            task_id: Id returned by submit
+        """
+        super().__init__(f"Task {task_id} was cancelled by stop")
+        self.task_id = task_id
+
+
 class AgentManager:
     """
     Manages multiple agents and their interactions.
@@ -21,21 +86,366 @@ class AgentManager:
     task distribution, and monitoring.
     """
     
-    def __init__(self, name: str = "AgentManager"):
+    def __init__(
+        self,
+        name: str = "AgentManager",
+        max_concurrent_tasks: int = 10,
+        task_timeout: Optional[float] = None,
+        result_cache: Optional[ResultCache] = None,
+        coalesce_requests: bool = False,
+        max_process_workers: Optional[int] = None,
+        max_blocking_workers: int = 4,
+        max_queue_size: int = 0,
+        overflow_policy: str = "block",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[Dict[str, Any]] = None,
+        result_ttl: Optional[float] = 300.0
+    ):
         """
         Initialize the Agent Manager.
         
         Args:
             name: Name of the manager instance
+            max_concurrent_tasks: Number of workers draining the task queue.
+                Direct process_with_agent calls do not count against it.
+            task_timeout: Default deadline in seconds for agent.process calls,
+                or None to wait indefinitely
+            result_cache: Cache consulted before calling agent.process.
+                Agents with "cache": False in their config bypass it.
+            coalesce_requests: Share one in-flight agent.process call
+                between concurrent identical requests to the same agent
+                with the same deadline. Agents with "coalesce": False in
+                their config bypass it.
+            max_process_workers: Size of the process pool used by agents
+                configured with "executor": "process" (defaults to CPU count)
+            max_blocking_workers: Size of the thread pool used by blocking
+                agents and blocking agent methods
+            max_queue_size: Maximum number of queued tasks, or 0 for no limit
+            overflow_policy: What submit does when the queue is full:
+                "block" waits for space, "reject" raises TaskRejectedError
+                and "shed_oldest" drops the oldest task of the least
+                important queued priority class. Direct process_with_agent
+                and process_with_all_agents calls are not subject to it.
+            rate_limiter: Limiter every agent call waits on, keyed by agent
+                name and by the agent's "model" config
+            retry_policy: Policy for retrying failed agent calls. Agents
+                with "retry": False in their config are not retried.
+            circuit_breaker: CircuitBreaker settings applied to every agent,
+                or None to disable breakers. An agent's "circuit_breaker"
+                config overrides them, and False disables its breaker.
+            result_ttl: Seconds a finished task's result is kept for
+                get_result before it is discarded, or None to keep every
+                result until it is collected
         """
+        if max_concurrent_tasks < 1:
+            raise ValueError("max_concurrent_tasks must be at least 1")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow_policy must be one of {OVERFLOW_POLICIES}, got {overflow_policy!r}"
+            )
+        
         self.name = name
         self.agents: Dict[str, BaseAgent] = {}
+        self._agent_specs: Dict[str, Dict[str, Any]] = {}
+        self.config_path: Optional[str] = None
+        self._config_specs: Dict[str, Dict[str, Any]] = {}
+        self._config_version: Optional[Tuple[int, int]] = None
+        self._config_watcher: Optional[asyncio.Task] = None
         self.is_running = False
-        self.task_queue = asyncio.Queue()
-        self.results = {}
+        self.max_concurrent_tasks = max_concurrent_tasks
+        self.task_timeout = task_timeout
+        self.result_cache = result_cache
+        self.coalesce_requests = coalesce_requests
+        self._in_flight: Dict[
+            Tuple[Tuple[str, str, str], Optional[float]], asyncio.Future
+        ] = {}
+        self.metrics = MetricsRegistry()
+        self.max_process_workers = max_process_workers
+        self._process_executor: Optional[ProcessAgentExecutor] = None
+        self.thread_dispatcher = ThreadPoolDispatcher(max_blocking_workers)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.retries = 0
+        self.overflow_policy = overflow_policy
+        self.task_queue = FairQueue(max_queue_size)
+        self.rejected_tasks = 0
+        self.shed_tasks = 0
+        self._busy_workers = 0
+        self.results: Dict[str, asyncio.Future] = {}
+        self.result_ttl = result_ttl
+        self.expired_results = 0
+        self._workers: List[asyncio.Task] = []
         
         logger.info(f"Initialized AgentManager: {self.name}")
     
+    @classmethod
+    def from_config(cls, filepath: str, **overrides: Any) -> 'AgentManager':
+        """
+        Create a manager from a YAML file such as config/agents.yaml.
+        
+        The "manager" section supplies constructor arguments. Each entry
+        under "agents" names a class (registered name or dotted path) and
+        a config merged over "default_agent_config". Agents are registered
+        lazily: nothing is imported or constructed until an agent is first
+        used.
+        
+        Args:
+            filepath: Path to the YAML configuration file
+            **overrides: Constructor arguments taking precedence over the
+                file, e.g. a result_cache or rate_limiter
+            
+        Returns:
+            New AgentManager instance
+        """
+        version = _file_version(filepath)
+        kwargs, specs = _read_config_file(filepath)
+        kwargs.update(overrides)
+        manager = cls(**kwargs)
+        
+        for agent_name, spec in specs.items():
+            manager.register_lazy_agent(
+                agent_name, spec["class"], spec["config"], autostart=spec["autostart"]
+            )
+        manager.config_path = filepath
+        manager._config_specs = specs
+        manager._config_version = version
+        
+        logger.info(f"Loaded {len(specs)} agent definitions from {filepath}")
+        return manager
+    
+    async def reload_config(
+        self,
+        filepath: Optional[str] = None,
+        drain_timeout: float = 30.0
+    ) -> Dict[str, List[str]]:
+        """
+        Apply changes to the agents section of the config file.
+        
+        The file is parsed in full before anything changes, so a broken
+        file leaves the running configuration untouched. The diff is then
+        applied without yielding to the event loop: changed configs are
+        swapped into running agents, new agents are registered lazily and
+        removed agents stop receiving calls. Removed agents are stopped
+        once their in-flight calls finish or drain_timeout passes. Only
+        agents that came from the file are touched; the manager section
+        needs a restart to take effect.
+        
+        Args:
+            filepath: Config file, defaults to the one the manager was
+                loaded from
+            drain_timeout: Maximum seconds to wait for removed agents'
+                in-flight calls
+            
+        Returns:
+            Dictionary with the "added", "updated" and "removed" agent names
+        """
+        filepath = filepath or self.config_path
+        if filepath is None:
+            raise ValueError("No config file to reload")
+        
+        version = _file_version(filepath)
+        _, specs = _read_config_file(filepath)
+        
+        changes: Dict[str, List[str]] = {"added": [], "updated": [], "removed": []}
+        removed_agents: List[BaseAgent] = []
+        for agent_name, old_spec in self._config_specs.items():
+            new_spec = specs.get(agent_name)
+            if new_spec is None or new_spec["class"] != old_spec["class"]:
+                agent = self._detach_agent(agent_name)
+                if agent is not None:
+                    removed_agents.append(agent)
+                changes["removed"].append(agent_name)
+        
+        for agent_name, new_spec in specs.items():
+            old_spec = self._config_specs.get(agent_name)
+            if old_spec is None or new_spec["class"] != old_spec["class"]:
+                if self.register_lazy_agent(
+                    agent_name, new_spec["class"], new_spec["config"],
+                    autostart=new_spec["autostart"]
+                ):
+                    changes["added"].append(agent_name)
+            elif new_spec != old_spec:
+                self._update_agent_config(agent_name, new_spec)
+                changes["updated"].append(agent_name)
+        
+        self.config_path = filepath
+        self._config_specs = specs
+        self._config_version = version
+        logger.info(
+            f"Reloaded {filepath}: {len(changes['added'])} added, "
+            f"{len(changes['updated'])} updated, {len(changes['removed'])} removed"
+        )
+        
+        if removed_agents:
+            await asyncio.gather(*(
+                self._drain_agent(agent, drain_timeout) for agent in removed_agents
+            ))
+        return changes
+    
+    def start_config_watch(self, interval: float = 1.0) -> asyncio.Task:
+        """
+        Reload the config file whenever its modification time changes.
+        
+        Reload errors are logged and the previous configuration stays in
+        effect until the file is fixed.
+        
+        Args:
+            interval: Seconds between checks of the file
+            
+        Returns:
+            The watcher task
+        """
+        if self.config_path is None:
+            raise ValueError("No config file to watch")
+        if self._config_watcher is None or self._config_watcher.done():
+            self._config_watcher = asyncio.ensure_future(self._watch_config(interval))
+        return self._config_watcher
+    
+    async def stop_config_watch(self):
+        """Stop watching the config file."""
+        if self._config_watcher is not None:
+            self._config_watcher.cancel()
+            await asyncio.gather(self._config_watcher, return_exceptions=True)
+            self._config_watcher = None
+    
+    async def _watch_config(self, interval: float):
+        """Poll the config file and reload it when it changes."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if _file_version(self.config_path) != self._config_version:
+                    await self.reload_config()
+            except Exception as e:
+                logger.error(f"Failed to reload {self.config_path}: {e}")
+                # Do not retry the same broken file on every poll
+                try:
+                    self._config_version = _file_version(self.config_path)
+                except OSError:
+                    pass
+    
+    def _update_agent_config(self, agent_name: str, spec: Dict[str, Any]):
+        """Swap a new config into a lazy or running agent."""
+        if agent_name in self._agent_specs:
+            self._agent_specs[agent_name].update(
+                config=spec["config"], autostart=spec["autostart"]
+            )
+            return
+        
+        agent = self.agents.get(agent_name)
+        if agent is None:
+            return
+        if agent.config.get("circuit_breaker") != spec["config"].get("circuit_breaker"):
+            self.circuit_breakers.pop(agent_name, None)
+        agent.update_config(spec["config"])
+        if self.result_cache is not None:
+            self.result_cache.invalidate(agent_name)
+    
+    def _detach_agent(self, agent_name: str) -> Optional[BaseAgent]:
+        """
+        Remove an agent from the manager without stopping it.
+        
+        Returns:
+            The running agent, or None if it was never constructed
+        """
+        if self._agent_specs.pop(agent_name, None) is not None:
+            return None
+        
+        agent = self.agents.pop(agent_name, None)
+        self.circuit_breakers.pop(agent_name, None)
+        if self.result_cache is not None:
+            self.result_cache.invalidate(agent_name)
+        return agent
+    
+    async def _drain_agent(self, agent: BaseAgent, timeout: float):
+        """
+        Wait for a detached agent's in-flight calls, then stop it.
+        
+        Calls are counted on the agent instance, so a replacement registered
+        under the same name does not hold up the drain.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        while agent.calls_in_flight > 0 and loop.time() < deadline:
+            await asyncio.sleep(DRAIN_POLL_INTERVAL)
+        
+        if agent.calls_in_flight > 0:
+            logger.warning(
+                f"Stopping agent {agent.name} with {agent.calls_in_flight} "
+                f"calls still running"
+            )
+        if agent.is_active:
+            agent.stop()
+        if agent.thread_dispatcher is self.thread_dispatcher:
+            agent.thread_dispatcher = None
+        logger.info(f"Removed agent: {agent.name}")
+    
+    def register_lazy_agent(
+        self,
+        agent_name: str,
+        class_name: str,
+        config: Optional[Dict[str, Any]] = None,
+        autostart: bool = True
+    ) -> bool:
+        """
+        Register an agent to be constructed on first use.
+        
+        Args:
+            agent_name: Name of the agent
+            class_name: Registered class name or dotted import path
+            config: Configuration passed to the agent's constructor
+            autostart: Start the agent as soon as it is constructed
+            
+        Returns:
+            True if successful, False if agent name already exists
+        """
+        if agent_name in self.agents or agent_name in self._agent_specs:
+            logger.warning(f"Agent {agent_name} already registered")
+            return False
+        
+        self._agent_specs[agent_name] = {
+            "class": class_name,
+            "config": config or {},
+            "autostart": autostart
+        }
+        return True
+    
+    def _get_agent(self, agent_name: str) -> BaseAgent:
+        """
+        Return a registered agent, constructing it if it is still lazy.
+        
+        Raises:
+            KeyError: If agent not found
+        """
+        agent = self.agents.get(agent_name)
+        if agent is not None:
+            return agent
+        
+        spec = self._agent_specs.get(agent_name)
+        if spec is None:
+            raise KeyError(f"Agent {agent_name} not found")
+        
+        agent_class = resolve_agent_class(spec["class"])
+        agent = agent_class(agent_name, dict(spec["config"]))
+        del self._agent_specs[agent_name]
+        self.register_agent(agent)
+        if spec["autostart"]:
+            agent.start()
+        return agent
+    
+    def _materialize_autostart_agents(self):
+        """Construct every lazy agent that would be active once built."""
+        for agent_name in [
+            name for name, spec in self._agent_specs.items() if spec["autostart"]
+        ]:
+            self._get_agent(agent_name)
+    
+    def _has_agent(self, agent_name: str) -> bool:
+        """True if the agent is registered, constructed or not."""
+        return agent_name in self.agents or agent_name in self._agent_specs
+    
     def register_agent(self, agent: BaseAgent) -> bool:
         """
         Register an agent with the manager.
@@ -46,11 +456,13 @@ class AgentManager:
         Returns:
             True if successful, False if agent name already exists
         """
-        if agent.name in self.agents:
+        if self._has_agent(agent.name):
             logger.warning(f"Agent {agent.name} already registered")
             return False
         
         self.agents[agent.name] = agent
+        if agent.thread_dispatcher is None:
+            agent.thread_dispatcher = self.thread_dispatcher
         logger.info(f"Registered agent: {agent.name}")
         return True
     
@@ -64,6 +476,9 @@ class AgentManager:
         Returns:
             True if successful, False if agent not found
         """
+        if self._agent_specs.pop(agent_name, None) is not None:
+            logger.info(f"Unregistered agent: {agent_name}")
+            return True
         if agent_name not in self.agents:
             logger.warning(f"Agent {agent_name} not found")
             return False
@@ -72,8 +487,11 @@ class AgentManager:
         agent = self.agents[agent_name]
         if agent.is_active:
             agent.stop()
+        if agent.thread_dispatcher is self.thread_dispatcher:
+            agent.thread_dispatcher = None
         
         del self.agents[agent_name]
+        self.circuit_breakers.pop(agent_name, None)
         logger.info(f"Unregistered agent: {agent_name}")
         return True
     
@@ -87,11 +505,11 @@ class AgentManager:
         Returns:
             True if successful, False if agent not found
         """
-        if agent_name not in self.agents:
+        if not self._has_agent(agent_name):
             logger.error(f"Agent {agent_name} not found")
             return False
         
-        self.agents[agent_name].start()
+        self._get_agent(agent_name).start()
         return True
     
     def stop_agent(self, agent_name: str) -> bool:
@@ -104,6 +522,10 @@ class AgentManager:
         Returns:
             True if successful, False if agent not found
         """
+        if agent_name in self._agent_specs:
+            # Not constructed yet; just keep it from starting when it is
+            self._agent_specs[agent_name]["autostart"] = False
+            return True
         if agent_name not in self.agents:
             logger.error(f"Agent {agent_name} not found")
             return False
@@ -112,24 +534,40 @@ class AgentManager:
         return True
     
     def start_all_agents(self):
-        """Start all registered agents."""
+        """Start all registered agents, including lazy ones once built."""
         for agent in self.agents.values():
             agent.start()
+        for spec in self._agent_specs.values():
+            spec["autostart"] = True
         logger.info("Started all agents")
     
     def stop_all_agents(self):
         """Stop all registered agents."""
         for agent in self.agents.values():
             agent.stop()
+        for spec in self._agent_specs.values():
+            spec["autostart"] = False
         logger.info("Stopped all agents")
     
-    async def process_with_agent(self, agent_name: str, input_data: Any) -> Any:
+    async def process_with_agent(
+        self,
+        agent_name: str,
+        input_data: Any,
+        timeout: Optional[float] = None
+    ) -> Any:
         """
         Process data with a specific agent.
         
+        The call runs immediately rather than through the task queue, so it
+        is not ordered by priority or shared between tenants by weight; use
+        submit for work that should be scheduled that way. For the same
+        reason max_queue_size and overflow_policy never reject or shed it.
+        
         Args:
             agent_name: Name of the agent to use
             input_data: Data to process
+            timeout: Deadline in seconds, overriding the agent's "timeout"
+                config and the manager's task_timeout
             
         Returns:
             Processed result
@@ -137,32 +575,84 @@ class AgentManager:
         Raises:
             KeyError: If agent not found
             RuntimeError: If agent is not active
+            AgentTimeoutError: If the agent does not finish in time
+            CircuitOpenError: If the agent's circuit breaker is open
         """
-        if agent_name not in self.agents:
-            raise KeyError(f"Agent {agent_name} not found")
+        agent = self._get_agent(agent_name)
+        if not agent.is_active:
+            raise RuntimeError(f"Agent {agent_name} is not active")
         
-        agent = self.agents[agent_name]
+        return await self._dispatch(agent, input_data, timeout)
+    
+    async def process_batch_with_agent(
+        self,
+        agent_name: str,
+        inputs: List[Any],
+        timeout: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Process a batch of inputs with a specific agent.
+        
+        The whole batch is handed to agent.process_batch, on the same
+        executor process_with_agent would use, so agents can amortize
+        per-call overhead. The deadline covers the entire batch. The batch
+        passes the agent's circuit breaker and retry policy like a single
+        call, and takes one rate limit token per input.
+        
+        Args:
+            agent_name: Name of the agent to use
+            inputs: Data items to process
+            timeout: Deadline in seconds, overriding the agent's "timeout"
+                config and the manager's task_timeout
+            
+        Returns:
+            List of processed results, one per input
+            
+        Raises:
+            KeyError: If agent not found
+            RuntimeError: If agent is not active
+            AgentTimeoutError: If the batch does not finish in time
+            CircuitOpenError: If the agent's circuit breaker is open
+        """
+        agent = self._get_agent(agent_name)
         if not agent.is_active:
             raise RuntimeError(f"Agent {agent_name} is not active")
         
-        return await agent.process(input_data)
+        inputs = list(inputs)
+        if not inputs:
+            return []
+        
+        return await self._invoke(agent, inputs, timeout, method="process_batch")
     
-    async def process_with_all_agents(self, input_data: Any) -> Dict[str, Any]:
+    async def process_with_all_agents(
+        self,
+        input_data: Any,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Process data with all active agents.
         
+        Agents that fail or miss their deadline do not hold up the others;
+        their exception (an AgentTimeoutError for timeouts) is returned in
+        place of a result. Like process_with_agent, the calls bypass the
+        task queue, its priority and fairness scheduling and its overflow
+        policy.
+        
         Args:
             input_data: Data to process
+            timeout: Deadline in seconds applied to every agent, overriding
+                per-agent and manager defaults
             
         Returns:
             Dictionary mapping agent names to their results
         """
+        self._materialize_autostart_agents()
         tasks = []
         active_agents = []
         
         for agent_name, agent in self.agents.items():
             if agent.is_active:
-                tasks.append(agent.process(input_data))
+                tasks.append(self._dispatch(agent, input_data, timeout))
                 active_agents.append(agent_name)
         
         if not tasks:
@@ -176,6 +666,570 @@ class AgentManager:
             for agent_name, result in zip(active_agents, results)
         }
     
+    async def stream_with_all_agents(
+        self,
+        input_data: Any,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Process data with all active agents, yielding results as they finish.
+        
+        Unlike process_with_all_agents, the first pair is available as soon
+        as the fastest agent completes. Failed agents yield their exception
+        in place of a result. Closing the generator early cancels agents
+        that are still running.
+        
+        Args:
+            input_data: Data to process
+            timeout: Deadline in seconds applied to every agent, overriding
+                per-agent and manager defaults
+            
+        Yields:
+            (agent_name, result) pairs in completion order
+        """
+        self._materialize_autostart_agents()
+        tasks = {
+            asyncio.ensure_future(self._dispatch(agent, input_data, timeout)): agent_name
+            for agent_name, agent in self.agents.items()
+            if agent.is_active
+        }
+        
+        if not tasks:
+            logger.warning("No active agents found")
+            return
+        
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.cancelled():
+                        result = asyncio.CancelledError()
+                    else:
+                        result = task.exception() or task.result()
+                    yield tasks[task], result
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def _resolve_timeout(
+        self,
+        agent: BaseAgent,
+        timeout: Optional[float]
+    ) -> Optional[float]:
+        """Pick the call, agent or manager deadline, in that order."""
+        if timeout is not None:
+            return timeout
+        agent_timeout = agent.config.get("timeout")
+        if agent_timeout is not None:
+            return agent_timeout
+        return self.task_timeout
+    
+    async def _dispatch(
+        self,
+        agent: BaseAgent,
+        input_data: Any,
+        timeout: Optional[float]
+    ) -> Any:
+        """
+        Serve a call from the result cache or an identical in-flight call,
+        invoking the agent only when neither applies.
+        """
+        use_cache = (
+            self.result_cache is not None and agent.config.get("cache", True)
+        )
+        coalesce = self.coalesce_requests and agent.config.get("coalesce", True)
+        if not use_cache and not coalesce:
+            return await self._invoke(agent, input_data, timeout)
+        
+        key = make_cache_key(agent, input_data)
+        if use_cache:
+            hit, result = self.result_cache.lookup(key)
+            if hit:
+                return result
+        
+        if not coalesce:
+            result = await self._invoke(agent, input_data, timeout)
+            self.result_cache.store(key, result)
+            return result
+        
+        # Only callers with the same deadline share a call, so nobody waits
+        # longer, or fails sooner, than their own deadline allows
+        flight_key = (key, self._resolve_timeout(agent, timeout))
+        task = self._in_flight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._invoke_and_store(agent, input_data, timeout, key, use_cache)
+            )
+            self._in_flight[flight_key] = task
+            task.add_done_callback(
+                lambda done: self._forget_in_flight(flight_key, done)
+            )
+        
+        # Shield the shared call so one waiter giving up does not cancel it
+        # for the others
+        return await asyncio.shield(task)
+    
+    async def _invoke_and_store(
+        self,
+        agent: BaseAgent,
+        input_data: Any,
+        timeout: Optional[float],
+        key: Tuple[str, str, str],
+        use_cache: bool
+    ) -> Any:
+        """Invoke the agent and cache the result when caching applies."""
+        result = await self._invoke(agent, input_data, timeout)
+        if use_cache:
+            self.result_cache.store(key, result)
+        return result
+    
+    def _forget_in_flight(
+        self,
+        key: Tuple[Tuple[str, str, str], Optional[float]],
+        task: asyncio.Future
+    ):
+        """Remove a finished shared call from the in-flight table."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Waiters receive any exception through their shield; mark it as
+        # retrieved so it is not also logged as unhandled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _invoke(
+        self,
+        agent: BaseAgent,
+        input_data: Any,
+        timeout: Optional[float],
+        method: str = "process"
+    ) -> Any:
+        """
+        Call the agent through its circuit breaker, retrying per the
+        retry policy.
+        
+        The resolved deadline bounds the whole call: each attempt gets only
+        the time that is left, and no retry is made once a backoff would
+        use up the rest. The breaker is consulted before every attempt, so
+        retries stop as soon as the circuit opens.
+        
+        Raises:
+            AgentTimeoutError: If the deadline passes
+            CircuitOpenError: If the agent's circuit breaker is open
+        """
+        breaker = self._breaker_for(agent)
+        policy = self.retry_policy if agent.config.get("retry", True) else None
+        deadline = self._resolve_timeout(agent, timeout)
+        loop = asyncio.get_event_loop()
+        expires = None if deadline is None else loop.time() + deadline
+        attempt = 1
+        agent.calls_in_flight += 1
+        try:
+            while True:
+                if breaker is not None and not breaker.allow():
+                    raise CircuitOpenError(agent.name, breaker.retry_after())
+                remaining = deadline
+                if expires is not None and attempt > 1:
+                    remaining = expires - loop.time()
+                try:
+                    result = await self._attempt(agent, input_data, remaining, method)
+                except asyncio.CancelledError:
+                    if breaker is not None:
+                        breaker.release()
+                    raise
+                except Exception as e:
+                    if breaker is not None:
+                        breaker.record_failure()
+                    if policy is None or not policy.should_retry(e, attempt):
+                        raise
+                    delay = policy.backoff(attempt)
+                    if expires is not None and loop.time() + delay >= expires:
+                        raise
+                    self.retries += 1
+                    logger.warning(
+                        f"Agent {agent.name} attempt {attempt} failed ({e!r}), "
+                        f"retrying in {delay:.3f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                else:
+                    if breaker is not None:
+                        breaker.record_success()
+                    return result
+        finally:
+            agent.calls_in_flight -= 1
+    
+    def _breaker_for(self, agent: BaseAgent) -> Optional[CircuitBreaker]:
+        """Return the agent's circuit breaker, creating it on first use."""
+        breaker = self.circuit_breakers.get(agent.name)
+        if breaker is not None:
+            return breaker
+        
+        settings = agent.config.get("circuit_breaker", self.circuit_breaker)
+        if settings is None or settings is False:
+            return None
+        if settings is True:
+            settings = self.circuit_breaker or {}
+        
+        breaker = CircuitBreaker(**settings)
+        self.circuit_breakers[agent.name] = breaker
+        return breaker
+    
+    async def _attempt(
+        self,
+        agent: BaseAgent,
+        input_data: Any,
+        timeout: Optional[float],
+        method: str = "process"
+    ) -> Any:
+        """
+        Run agent.process, or agent.process_batch for a list of inputs,
+        once under the resolved deadline.
+        """
+        coro = self._on_executor(agent, method, input_data)
+        if self.rate_limiter is not None:
+            cost = len(input_data) if method == "process_batch" else 1
+            coro = self._after_rate_limit(agent, coro, cost)
+        
+        return await self._with_deadline(agent, coro, timeout)
+    
+    def _on_executor(self, agent: BaseAgent, method: str, payload: Any) -> Awaitable[Any]:
+        """
+        Build the call of an agent coroutine method on the agent's executor.
+        
+        The agent's "executor" config selects where it runs: "process" for
+        the process pool, "thread" (the default for blocking agents) for the
+        thread pool, anything else for the event loop.
+        """
+        default = "thread" if agent.runs_blocking else "async"
+        executor = agent.config.get("executor", default)
+        if executor == "process":
+            if self._process_executor is None:
+                self._process_executor = ProcessAgentExecutor(self.max_process_workers)
+            return self._process_executor.run(agent, payload, method)
+        if executor == "thread":
+            return self.thread_dispatcher.run(
+                call_in_new_loop, getattr(agent, method), payload
+            )
+        return getattr(agent, method)(payload)
+    
+    async def _after_rate_limit(
+        self,
+        agent: BaseAgent,
+        coro: Awaitable[Any],
+        cost: int = 1
+    ) -> Any:
+        """Wait for the agent's rate limits, then await the call."""
+        try:
+            await self.rate_limiter.acquire(
+                *self.rate_limiter.keys_for(agent.name, agent.config.get("model")),
+                cost=cost
+            )
+        except BaseException:
+            coro.close()
+            raise
+        return await coro
+    
+    async def _with_deadline(
+        self,
+        agent: BaseAgent,
+        coro: Awaitable[Any],
+        timeout: Optional[float]
+    ) -> Any:
+        """
+        Await an agent coroutine, cancelling it if it exceeds its deadline.
+        
+        Every call is recorded in the agent's metrics.
+        
+        Raises:
+            AgentTimeoutError: If the agent does not finish in time
+        """
+        deadline = self._resolve_timeout(agent, timeout)
+        metrics = self.metrics.for_agent(agent.name)
+        outcome = "error"
+        
+        metrics.start()
+        started = time.perf_counter()
+        try:
+            if deadline is None:
+                result = await coro
+            else:
+                try:
+                    result = await asyncio.wait_for(coro, deadline)
+                except asyncio.TimeoutError:
+                    outcome = "timeout"
+                    logger.warning(f"Agent {agent.name} timed out after {deadline}s")
+                    raise AgentTimeoutError(agent.name, deadline) from None
+            outcome = "ok"
+            return result
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            metrics.finish(time.perf_counter() - started, outcome)
+    
+    async def start(self):
+        """
+        Start the worker pool that drains the task queue.
+        
+        Tasks submitted before the pool is started stay queued until
+        workers are available.
+        """
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        self._workers = [
+            asyncio.ensure_future(self._worker())
+            for _ in range(self.max_concurrent_tasks)
+        ]
+        logger.info(
+            f"Started {len(self._workers)} workers for manager: {self.name}"
+        )
+    
+    async def stop(self, drain: bool = True):
+        """
+        Stop the worker pool.
+        
+        Args:
+            drain: Wait for queued tasks to finish before stopping. When
+                False, queued and running tasks are cancelled.
+        """
+        if not self.is_running:
+            return
+        
+        if drain:
+            await self.task_queue.join()
+        
+        self.is_running = False
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        
+        # Anything still queued or interrupted mid-flight will never run
+        while not self.task_queue.empty():
+            self.task_queue.get_nowait()
+            self.task_queue.task_done()
+        for task_id, future in self.results.items():
+            if not future.done():
+                future.set_exception(TaskCancelledError(task_id))
+        
+        logger.info(f"Stopped workers for manager: {self.name}")
+    
+    async def submit(
+        self,
+        agent_name: str,
+        input_data: Any,
+        priority: int = Priority.NORMAL,
+        tenant: Optional[str] = None
+    ) -> str:
+        """
+        Queue data for processing by a specific agent.
+        
+        Workers always take higher priority tasks first. Within a priority,
+        tasks are shared fairly between tenants (or agents, when no tenant
+        is given) according to the weights set with set_weight. When the
+        queue is full the manager's overflow_policy applies.
+        
+        Args:
+            agent_name: Name of the agent to use
+            input_data: Data to process
+            priority: Priority class, e.g. Priority.INTERACTIVE
+            tenant: Flow to account the task to, defaults to the agent name
+            
+        Returns:
+            Task id that can be passed to get_result
+            
+        Raises:
+            KeyError: If agent not found
+            TaskRejectedError: If the queue is full and the overflow policy
+                refuses the task
+        """
+        if not self._has_agent(agent_name):
+            raise KeyError(f"Agent {agent_name} not found")
+        
+        if self.task_queue.full() and self.overflow_policy != "block":
+            self._make_room(agent_name, priority)
+        
+        task_id = uuid.uuid4().hex
+        future = asyncio.get_event_loop().create_future()
+        self.results[task_id] = future
+        try:
+            await self.task_queue.put(
+                (task_id, agent_name, input_data, future),
+                priority=priority,
+                flow=tenant or agent_name
+            )
+        except BaseException:
+            # A put cancelled while blocked on a full queue never enqueued
+            # the task, and its id was never handed out
+            del self.results[task_id]
+            future.cancel()
+            raise
+        future.add_done_callback(lambda done: self._expire_later(task_id, done))
+        return task_id
+    
+    def _expire_later(self, task_id: str, future: asyncio.Future):
+        """Schedule the removal of a finished result nobody collected."""
+        if self.result_ttl is not None:
+            asyncio.get_event_loop().call_later(
+                self.result_ttl, self._expire_result, task_id, future
+            )
+    
+    def _expire_result(self, task_id: str, future: asyncio.Future):
+        """Discard an uncollected result whose time to live has passed."""
+        if self.results.get(task_id) is not future:
+            return
+        del self.results[task_id]
+        self.expired_results += 1
+        # Nobody will look at the outcome; keep asyncio from logging it
+        if not future.cancelled():
+            future.exception()
+    
+    def _make_room(self, agent_name: str, priority: int):
+        """
+        Apply the reject or shed_oldest policy to a full queue.
+        
+        Raises:
+            TaskRejectedError: If no room can be made for the new task
+        """
+        if self.overflow_policy == "shed_oldest":
+            shed = self.task_queue.pop_oldest(min_priority=priority)
+            if shed is not None:
+                _, shed_agent, _, shed_future = shed
+                if not shed_future.done():
+                    shed_future.set_exception(TaskRejectedError(shed_agent, "shed"))
+                self.shed_tasks += 1
+                logger.warning(f"Shed queued task for agent {shed_agent}")
+                return
+        
+        self.rejected_tasks += 1
+        raise TaskRejectedError(agent_name, "rejected")
+    
+    def get_load(self) -> Dict[str, Any]:
+        """
+        Get the manager's current load.
+        
+        load_factor is queued plus running tasks per worker; above 1.0 work
+        is waiting for a worker. Callers can check overloaded before
+        submitting to back off early.
+        
+        Returns:
+            Load signal dictionary
+        """
+        queued = self.task_queue.qsize()
+        max_queue_size = self.task_queue.maxsize
+        return {
+            "queued_tasks": queued,
+            "max_queue_size": max_queue_size,
+            "busy_workers": self._busy_workers,
+            "load_factor": (queued + self._busy_workers) / self.max_concurrent_tasks,
+            "queue_utilization": queued / max_queue_size if max_queue_size else None,
+            "overloaded": self.task_queue.full(),
+            "rejected_tasks": self.rejected_tasks,
+            "shed_tasks": self.shed_tasks
+        }
+    
+    @property
+    def is_overloaded(self) -> bool:
+        """True when the task queue is full."""
+        return self.task_queue.full()
+    
+    def set_weight(self, flow: str, weight: float):
+        """
+        Set the share of workers a tenant or agent receives under load.
+        
+        Args:
+            flow: Tenant name, or agent name for tasks without a tenant
+            weight: Positive weight relative to other flows (default 1.0)
+        """
+        self.task_queue.set_weight(flow, weight)
+    
+    async def get_result(self, task_id: str, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the result of a submitted task.
+        
+        Args:
+            task_id: Id returned by submit
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            Processed result
+            
+        Raises:
+            KeyError: If the task id is unknown, already collected or
+                expired after result_ttl
+            asyncio.TimeoutError: If the result is not ready in time
+            TaskCancelledError: If stop(drain=False) dropped the task
+        """
+        if task_id not in self.results:
+            raise KeyError(f"Task {task_id} not found")
+        
+        future = self.results[task_id]
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            if future.done():
+                self.results.pop(task_id, None)
+    
+    async def run_task(
+        self,
+        agent_name: str,
+        input_data: Any,
+        priority: int = Priority.NORMAL,
+        tenant: Optional[str] = None
+    ) -> Any:
+        """
+        Submit a task and wait for its result.
+        
+        Args:
+            agent_name: Name of the agent to use
+            input_data: Data to process
+            priority: Priority class, e.g. Priority.INTERACTIVE
+            tenant: Flow to account the task to, defaults to the agent name
+            
+        Returns:
+            Processed result
+        """
+        task_id = await self.submit(agent_name, input_data, priority, tenant)
+        return await self.get_result(task_id)
+    
+    async def _worker(self):
+        """Process queued tasks until cancelled."""
+        while True:
+            task_id, agent_name, input_data, future = await self.task_queue.get()
+            try:
+                if future.done():
+                    continue
+                self._busy_workers += 1
+                try:
+                    result = await self.process_with_agent(agent_name, input_data)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+                finally:
+                    self._busy_workers -= 1
+            finally:
+                self.task_queue.task_done()
+    
+    def shutdown_executors(self, wait: bool = True):
+        """
+        Stop the worker pools used for out-of-loop agents.
+        
+        Args:
+            wait: Block until running calls have finished
+        """
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=wait)
+            self._process_executor = None
+        self.thread_dispatcher.shutdown(wait=wait)
+    
     def get_agent_status(self, agent_name: str) -> Optional[Dict[str, Any]]:
         """
         Get status of a specific agent.
@@ -186,10 +1240,18 @@ class AgentManager:
         Returns:
             Agent status dictionary or None if not found
         """
+        if agent_name in self._agent_specs:
+            return self._pending_status(agent_name)
         if agent_name not in self.agents:
             return None
         
-        return self.agents[agent_name].get_status()
+        status = self.agents[agent_name].get_status()
+        if self.result_cache is not None:
+            status["cache"] = self.result_cache.stats(agent_name)
+        breaker = self.circuit_breakers.get(agent_name)
+        if breaker is not None:
+            status["circuit"] = breaker.stats()
+        return status
     
     def get_all_agent_status(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -198,10 +1260,25 @@ class AgentManager:
         Returns:
             Dictionary mapping agent names to their status
         """
-        return {
+        status = {
             name: agent.get_status() 
             for name, agent in self.agents.items()
         }
+        for name in self._agent_specs:
+            status[name] = self._pending_status(name)
+        return status
+    
+    def _pending_status(self, agent_name: str) -> Dict[str, Any]:
+        """Status of an agent that has not been constructed yet."""
+        spec = self._agent_specs[agent_name]
+        return {
+            "name": agent_name,
+            "active": False,
+            "config": spec["config"],
+            "history_length": 0,
+            "class": spec["class"],
+            "instantiated": False
+        }
     
     def get_active_agents(self) -> List[str]:
         """
@@ -224,8 +1301,69 @@ class AgentManager:
         """
         return {
             "name": self.name,
-            "total_agents": len(self.agents),
+            "total_agents": len(self.agents) + len(self._agent_specs),
+            "pending_agents": len(self._agent_specs),
             "active_agents": len(self.get_active_agents()),
             "running": self.is_running,
-            "agent_names": list(self.agents.keys())
-        }
\ No newline at end of file
+            "max_concurrent_tasks": self.max_concurrent_tasks,
+            "queued_tasks": self.task_queue.qsize(),
+            "load": self.get_load(),
+            "pending_results": len(self.results),
+            "expired_results": self.expired_results,
+            "in_flight_requests": len(self._in_flight),
+            "agent_names": list(self.agents.keys()) + list(self._agent_specs.keys()),
+            "metrics": self.metrics.snapshot(),
+            "thread_pool": self.thread_dispatcher.stats(),
+            "rate_limits": self.rate_limiter.stats() if self.rate_limiter else {},
+            "retries": self.retries,
+            "circuits": {
+                name: breaker.stats()
+                for name, breaker in self.circuit_breakers.items()
+            }
+        }
+    
+    def export_prometheus(self) -> str:
+        """
+        Export per-agent call metrics and thread pool usage for Prometheus.
+        
+        Returns:
+            Metrics in the Prometheus text exposition format
+        """
+        return self.metrics.to_prometheus() + self.thread_dispatcher.to_prometheus()
+
+
+def _file_version(filepath: str) -> Tuple[int, int]:
+    """Return the file's modification time and size, used to detect edits."""
+    stat = os.stat(filepath)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_config_file(filepath: str) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Parse an agents YAML file.
+    
+    Returns:
+        Manager constructor arguments, and agent specs keyed by name with
+        "class", "config" (merged over default_agent_config) and "autostart"
+        
+    Raises:
+        ValueError: If an agent has no class
+    """
+    with open(filepath, 'r') as f:
+        data = yaml.safe_load(f) or {}
+    
+    defaults = data.get("default_agent_config") or {}
+    specs: Dict[str, Dict[str, Any]] = {}
+    for agent_name, spec in (data.get("agents") or {}).items():
+        spec = spec or {}
+        if "class" not in spec:
+            raise ValueError(f"Agent {agent_name} has no class in {filepath}")
+        config = dict(defaults)
+        config.update(spec.get("config") or {})
+        specs[agent_name] = {
+            "class": spec["class"],
+            "config": config,
+            "autostart": spec.get("autostart", True)
+        }
+    
+    return dict(data.get("manager") or {}), specs
@@ -5,35 +5,92 @@ This module provides the base class for all agents in the system.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import functools
 import json
 import logging
+import os
+
+from src.history import DEFAULT_HISTORY_SIZE, HistoryBuffer, HistoryEntry
+from src.history_journal import HistoryJournal
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def blocking(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Mark a synchronous agent method as blocking.
+    
+    The decorated method becomes a coroutine that runs the original body
+    through the agent's run_blocking, i.e. on a pool thread instead of the
+    event loop.
+    
+    Args:
+        func: Synchronous method to wrap
+        
+    Returns:
+        Async method to be awaited by callers
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        return await self.run_blocking(func, self, *args, **kwargs)
+    
+    wrapper.blocking = True
+    return wrapper
+
+
 class BaseAgent(ABC):
     """
     Abstract base class for all agents.
     
     This class provides the common interface and functionality
     that all agents should implement.
+    
+    Subclasses whose process method blocks (for example by calling a
+    synchronous SDK) should set runs_blocking = True, or set "executor":
+    "thread" in their config, so AgentManager runs them on its thread pool.
+    Individual blocking helper methods use the @blocking decorator instead.
     """
     
+    runs_blocking = False
+    
+    # Defaults merged under the config given to update_config
+    DEFAULT_CONFIG: Dict[str, Any] = {}
+    
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the agent.
         
         Args:
             name (str): The name of the agent
-            config (dict, optional): Configuration parameters for the agent
+            config (dict, optional): Configuration parameters for the agent.
+                "history_size" sets how many history entries are retained and
+                "history_payload" ("full", "length" or "hash") how much of
+                each input and output they keep. "history_journal" names a
+                directory for a persistent on-disk copy of every entry.
         """
         self.name = name
         self.config = config or {}
         self.is_active = False
-        self.history = []
+        self.history = HistoryBuffer(
+            self.config.get("history_size", DEFAULT_HISTORY_SIZE)
+        )
+        self.journal: Optional[HistoryJournal] = None
+        # Thread pool for blocking work, assigned by AgentManager
+        self.thread_dispatcher = None
+        # Calls AgentManager has started on this instance and not finished,
+        # including time spent in retry backoff
+        self.calls_in_flight = 0
+        
+        journal_dir = self.config.get("history_journal")
+        if journal_dir:
+            self.journal = HistoryJournal(
+                os.path.join(journal_dir, self.name),
+                batch_size=self.config.get("history_journal_batch_size", 100)
+            )
         
         logger.info(f"Initialized agent: {self.name}")
     
@@ -50,6 +107,44 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def process_batch(self, inputs: List[Any]) -> List[Any]:
+        """
+        Process a batch of inputs and return results in the same order.
+        
+        The default implementation runs process concurrently for every
+        input. Agents with fixed per-call costs (connection setup, model
+        warm-up, simulated delays) should override this to pay those
+        costs once per batch.
+        
+        Args:
+            inputs: The data items to process
+            
+        Returns:
+            List of processed results, one per input
+        """
+        return list(await asyncio.gather(*(self.process(item) for item in inputs)))
+    
+    async def run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable without blocking the event loop.
+        
+        Uses the manager's bounded thread pool when the agent is registered
+        with one, and the event loop's default executor otherwise.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The callable's result
+        """
+        if self.thread_dispatcher is not None:
+            return await self.thread_dispatcher.run(func, *args, **kwargs)
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+    
     def start(self):
         """Start the agent."""
         self.is_active = True
@@ -58,8 +153,27 @@ class BaseAgent(ABC):
     def stop(self):
         """Stop the agent."""
         self.is_active = False
+        if self.journal is not None:
+            self.journal.flush(wait=False)
         logger.info(f"Agent {self.name} stopped")
     
+    def update_config(self, config: Dict[str, Any]):
+        """
+        Replace the agent's configuration while it keeps running.
+        
+        The new dictionary, merged over DEFAULT_CONFIG, is swapped in as a
+        whole, so a call never sees a mix of old and new values within one
+        lookup. Settings read only at construction ("history_size",
+        "history_journal") keep their original effect.
+        
+        Args:
+            config: The new configuration
+        """
+        merged = dict(self.DEFAULT_CONFIG)
+        merged.update(config)
+        self.config = merged
+        logger.info(f"Agent {self.name} config updated")
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get the current status of the agent.
@@ -78,17 +192,73 @@ class BaseAgent(ABC):
         """
         Add an entry to the agent's history.
         
+        Entries of the form {"input", "output", "timestamp"} are stored as
+        compact HistoryEntry records, summarized according to the
+        "history_payload" config. Once the history is full the oldest entry
+        is discarded.
+        
         Args:
             entry: Dictionary containing the history entry
         """
+        if HistoryEntry.accepts(entry):
+            entry = HistoryEntry.from_dict(
+                entry, self.config.get("history_payload", "full")
+            )
         self.history.append(entry)
         
-        # Keep history size manageable
-        if len(self.history) > 1000:
-            self.history = self.history[-500:]  # Keep last 500 entries
+        if self.journal is not None:
+            self.journal.append(entry)
+    
+    def query_history(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read journaled history entries within a wall-clock time range.
+        
+        Blocks on file I/O; use aquery_history from event-loop code.
+        
+        Args:
+            start: Earliest time.time() value to include
+            end: Latest time.time() value to include
+            
+        Returns:
+            List of {"ts", "entry"} records in the order they were added
+            
+        Raises:
+            RuntimeError: If no history journal is configured
+        """
+        if self.journal is None:
+            raise RuntimeError(f"Agent {self.name} has no history journal")
+        
+        return self.journal.query(start, end)
+    
+    async def aquery_history(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read journaled history entries without blocking the event loop.
+        
+        Args:
+            start: Earliest time.time() value to include
+            end: Latest time.time() value to include
+            
+        Returns:
+            List of {"ts", "entry"} records in the order they were added
+            
+        Raises:
+            RuntimeError: If no history journal is configured
+        """
+        if self.journal is None:
+            raise RuntimeError(f"Agent {self.name} has no history journal")
+        
+        return await self.journal.aquery(start, end)
     
     def clear_history(self):
-        """Clear the agent's history."""
+        """Clear the agent's in-memory history; the journal is kept."""
         self.history.clear()
         logger.info(f"Cleared history for agent: {self.name}")
     
@@ -109,6 +279,15 @@ class BaseAgent(ABC):
         
         logger.info(f"Saved config for {self.name} to {filepath}")
     
+    async def save_config_async(self, filepath: str):
+        """
+        Save the agent's configuration without blocking the event loop.
+        
+        Args:
+            filepath: Path to save the configuration
+        """
+        await self.run_blocking(self.save_config, filepath)
+    
     @classmethod
     def load_config(cls, filepath: str) -> 'BaseAgent':
         """
@@ -123,4 +302,18 @@ class BaseAgent(ABC):
         with open(filepath, 'r') as f:
             config_data = json.load(f)
         
-        return cls(config_data["name"], config_data["config"])
\ No newline at end of file
+        return cls(config_data["name"], config_data["config"])
+    
+    @classmethod
+    async def load_config_async(cls, filepath: str) -> 'BaseAgent':
+        """
+        Load an agent configuration without blocking the event loop.
+        
+        Args:
+            filepath: Path to the configuration file
+            
+        Returns:
+            Configured agent instance
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, cls.load_config, filepath)
\ No newline at end of file
@@ -5,10 +5,12 @@ This module demonstrates how to create a simple agent using the BaseAgent class.
 """
 
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, List
 from src.base_agent import BaseAgent
+from src.registry import register_agent_class
 
 
+@register_agent_class
 class ExampleAgent(BaseAgent):
     """
     A simple example agent that processes text input.
@@ -17,6 +19,12 @@ class ExampleAgent(BaseAgent):
     logging, and state management.
     """
     
+    DEFAULT_CONFIG = {
+        "processing_delay": 0.1,  # Simulated processing delay
+        "max_length": 1000,       # Maximum input length
+        "prefix": "Processed: "   # Prefix for output
+    }
+    
     def __init__(self, name: str = "ExampleAgent", config: Dict[str, Any] = None):
         """
         Initialize the Example Agent.
@@ -25,11 +33,7 @@ class ExampleAgent(BaseAgent):
             name: Name of the agent (default: "ExampleAgent")
             config: Configuration dictionary
         """
-        default_config = {
-            "processing_delay": 0.1,  # Simulated processing delay
-            "max_length": 1000,       # Maximum input length
-            "prefix": "Processed: "   # Prefix for output
-        }
+        default_config = dict(self.DEFAULT_CONFIG)
         
         # Merge with provided config
         if config:
@@ -50,19 +54,47 @@ class ExampleAgent(BaseAgent):
         if not self.is_active:
             raise RuntimeError(f"Agent {self.name} is not active")
         
-        # Convert input to string
+        text_input = self._prepare_input(input_data)
+        
+        # Simulate processing delay
+        delay = self.config.get("processing_delay", 0.1)
+        await asyncio.sleep(delay)
+        
+        return self._finish(text_input)
+    
+    async def process_batch(self, inputs: List[Any]) -> List[str]:
+        """
+        Process a batch of inputs, paying the processing delay once.
+        
+        Args:
+            inputs: Inputs to process (each will be converted to string)
+            
+        Returns:
+            Processed strings with prefix, in input order
+        """
+        if not self.is_active:
+            raise RuntimeError(f"Agent {self.name} is not active")
+        
+        text_inputs = [self._prepare_input(item) for item in inputs]
+        
+        # Simulate processing delay for the whole batch
+        delay = self.config.get("processing_delay", 0.1)
+        await asyncio.sleep(delay)
+        
+        return [self._finish(text_input) for text_input in text_inputs]
+    
+    def _prepare_input(self, input_data: Any) -> str:
+        """Convert input to string and apply the length limit."""
         text_input = str(input_data)
         
-        # Check length limit
         max_length = self.config.get("max_length", 1000)
         if len(text_input) > max_length:
             text_input = text_input[:max_length] + "..."
         
-        # Simulate processing delay
-        delay = self.config.get("processing_delay", 0.1)
-        await asyncio.sleep(delay)
-        
-        # Add prefix
+        return text_input
+    
+    def _finish(self, text_input: str) -> str:
+        """Add the prefix and record the result in history."""
         prefix = self.config.get("prefix", "Processed: ")
         result = f"{prefix}{text_input}"
         
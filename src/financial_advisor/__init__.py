@@ -12,15 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Financial coordinator: provide reasonable investment strategies"""
+"""Financial coordinator: provide reasonable investment strategies
 
+Importing the package has no side effects. The agents are built on first
+access to ``root_agent`` (or by calling the ``create_*`` builders), and
+only then are google.adk imported and the Google Cloud settings resolved.
+"""
+
+import importlib
 import os
 
-import google.auth
+_environment_configured = False
+
+
+def configure_environment():
+    """Fill in the Vertex AI settings, asking google.auth for the project
+    only when GOOGLE_CLOUD_PROJECT is not already set."""
+    global _environment_configured
+    if _environment_configured:
+        return
+
+    if "GOOGLE_CLOUD_PROJECT" not in os.environ:
+        import google.auth
+
+        _, project_id = google.auth.default()
+        if project_id:
+            os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
+    os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "global")
+    os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
+    _environment_configured = True
 
-_, project_id = google.auth.default()
-os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
-os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "global")
-os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 
-from . import agent
+def __getattr__(name):
+    if name == "agent":
+        return importlib.import_module(".agent", __name__)
+    if name == "root_agent":
+        return __getattr__("agent").root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,36 +14,75 @@
 
 """Financial coordinator: provide reasonable investment strategies."""
 
-from google.adk.agents import LlmAgent
-from google.adk.tools.agent_tool import AgentTool
-
-from . import prompt
-from .sub_agents.data_analyst import data_analyst_agent
-from .sub_agents.execution_analyst import execution_analyst_agent
-from .sub_agents.risk_analyst import risk_analyst_agent
-from .sub_agents.trading_analyst import trading_analyst_agent
-
-
-MODEL = "gemini-1.5-pro"
-
-
-financial_coordinator = LlmAgent(
-    name="financial_coordinator",
-    model=MODEL,
-    description=(
-        "guide users through a structured process to receive financial "
-        "advice by orchestrating a series of expert subagents. help them "
-        "analyze a market ticker, develop trading strategies, define "
-        "execution plans, and evaluate the overall risk."
-    ),
-    instruction=prompt.FINANCIAL_COORDINATOR_PROMPT,
-    output_key="financial_coordinator_output",
-    tools=[
-        AgentTool(agent=data_analyst_agent),
-        AgentTool(agent=trading_analyst_agent),
-        AgentTool(agent=execution_analyst_agent),
-        AgentTool(agent=risk_analyst_agent),
-    ],
-)
-
-root_agent = financial_coordinator
+import os
+
+from . import configure_environment, prompt
+from .model_routing import router
+from .rate_limits import before_model_callback
+from .sub_agents.data_analyst import create_data_analyst_agent
+from .sub_agents.execution_analyst import create_execution_analyst_agent
+from .sub_agents.risk_analyst import create_risk_analyst_agent
+from .sub_agents.trading_analyst import create_trading_analyst_agent
+
+
+def create_financial_coordinator(search_backend=None):
+    """Build a new coordinator together with its own set of sub-agents.
+
+    Args:
+        search_backend: Search for the data analyst, see
+            create_data_analyst_agent. Defaults to google_search.
+    """
+    configure_environment()
+    from google.adk.agents import LlmAgent
+    from google.adk.tools.agent_tool import AgentTool
+
+    return LlmAgent(
+        name="financial_coordinator",
+        model=router.primary_model("financial_coordinator"),
+        description=(
+            "guide users through a structured process to receive financial "
+            "advice by orchestrating a series of expert subagents. help them "
+            "analyze a market ticker, develop trading strategies, define "
+            "execution plans, and evaluate the overall risk."
+        ),
+        instruction=prompt.FINANCIAL_COORDINATOR_PROMPT,
+        before_model_callback=[
+            router.before_model_callback,
+            before_model_callback,
+            router.start_latency_clock,
+        ],
+        after_model_callback=router.after_model_callback,
+        on_model_error_callback=router.on_model_error_callback,
+        output_key="financial_coordinator_output",
+        tools=[
+            AgentTool(agent=create_data_analyst_agent(search_backend)),
+            AgentTool(agent=create_trading_analyst_agent()),
+            AgentTool(agent=create_execution_analyst_agent()),
+            AgentTool(agent=create_risk_analyst_agent()),
+        ],
+    )
+
+
+def __getattr__(name):
+    if name == "financial_coordinator":
+        from .search_cache import search_backend_from_env
+
+        agent = globals()[name] = create_financial_coordinator(search_backend_from_env())
+        return agent
+    if name == "root_agent":
+        # FINANCIAL_ADVISOR_MODE=pipeline serves the DAG pipeline instead
+        # of the conversational coordinator
+        if os.environ.get("FINANCIAL_ADVISOR_MODE", "coordinator") == "pipeline":
+            from .pipeline import create_pipeline_agent
+            from .search_cache import search_backend_from_env
+            from .state_cache import state_store_from_env
+
+            agent = create_pipeline_agent(
+                state_store=state_store_from_env(),
+                search_backend=search_backend_from_env(),
+            )
+        else:
+            agent = __getattr__("financial_coordinator")
+        globals()[name] = agent
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
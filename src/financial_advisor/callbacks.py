@@ -0,0 +1,33 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for attaching ADK callbacks to agents that may already have some"""
+
+from typing import Any, Callable
+
+
+def add_callback(agent: Any, field: str, callback: Callable, first: bool = False):
+    """Add a callback to an agent's callback field without replacing it.
+
+    ADK runs a list of callbacks in order until one returns a value, so an
+    existing callback stays first unless first is set, e.g. for a callback
+    that reshapes the request the others should see.
+    """
+    existing = getattr(agent, field, None)
+    if existing is None:
+        setattr(agent, field, callback)
+    elif isinstance(existing, list):
+        existing.insert(0 if first else len(existing), callback)
+    else:
+        setattr(agent, field, [callback, existing] if first else [existing, callback])
@@ -0,0 +1,225 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Model routing for the financial_advisor agents by cost/latency tier"""
+
+import os
+import statistics
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+# Model behind each tier; override with FINANCIAL_ADVISOR_<TIER>_MODEL
+DEFAULT_TIERS = {
+    "fast": "gemini-1.5-flash",
+    "strong": "gemini-1.5-pro",
+}
+
+# Tier per agent; override with FINANCIAL_ADVISOR_<AGENT_NAME>_TIER.
+# Dialog turns are cheap to get right, the analyses are not.
+DEFAULT_AGENT_TIERS = {
+    "financial_coordinator": "fast",
+    "data_analyst_agent": "strong",
+    "trading_analyst_agent": "strong",
+    "execution_analyst_agent": "strong",
+    "risk_analyst_agent": "strong",
+}
+
+# Tier used while a tier is breaching its latency SLO
+DEFAULT_FALLBACKS = {"strong": "fast"}
+
+# Median seconds per model call (time to first chunk when streaming);
+# override with FINANCIAL_ADVISOR_<TIER>_SLO_SECONDS
+DEFAULT_LATENCY_SLO = {"fast": 10.0, "strong": 45.0}
+
+STUB_MODEL_PREFIX = "stub"
+
+
+class ModelRouter:
+    """Picks the model for each agent call.
+
+    Every agent has a tier. Call latencies are tracked per tier; when the
+    median of the last `window` calls exceeds the tier's SLO, calls for
+    that tier go to its fallback tier for `cooldown` seconds.
+
+    before_model_callback routes a call and start_latency_clock starts
+    timing it, so callbacks that only wait (rate limits) go between the
+    two: [router.before_model_callback, ..., router.start_latency_clock].
+    """
+
+    def __init__(
+        self,
+        tiers: Optional[Dict[str, str]] = None,
+        agent_tiers: Optional[Dict[str, str]] = None,
+        default_tier: str = "strong",
+        fallbacks: Optional[Dict[str, str]] = None,
+        latency_slo: Optional[Dict[str, float]] = None,
+        window: int = 10,
+        cooldown: float = 300.0,
+        max_pending: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.tiers = dict(DEFAULT_TIERS if tiers is None else tiers)
+        self.agent_tiers = dict(DEFAULT_AGENT_TIERS if agent_tiers is None else agent_tiers)
+        self.default_tier = default_tier
+        self.fallbacks = dict(DEFAULT_FALLBACKS if fallbacks is None else fallbacks)
+        self.latency_slo = dict(DEFAULT_LATENCY_SLO if latency_slo is None else latency_slo)
+        self.window = window
+        self.cooldown = cooldown
+        self._clock = clock
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._degraded_until: Dict[str, float] = {}
+        self.max_pending = max_pending
+        # (invocation, agent) -> (start time once the clock runs, tier)
+        self._pending: Dict[Tuple[str, str], Tuple[Optional[float], str]] = {}
+        self.fallback_calls = 0
+
+        for tier in list(self.agent_tiers.values()) + [default_tier]:
+            if tier not in self.tiers:
+                raise ValueError(f"Unknown model tier {tier!r}")
+
+    @classmethod
+    def from_env(cls, environ: Optional[Dict[str, str]] = None, **kwargs: Any) -> "ModelRouter":
+        """Build a router with tiers, agent tiers and SLOs read from the environment."""
+        environ = os.environ if environ is None else environ
+        tiers = dict(DEFAULT_TIERS)
+        latency_slo = dict(DEFAULT_LATENCY_SLO)
+        for tier in tiers:
+            prefix = f"FINANCIAL_ADVISOR_{tier.upper()}"
+            tiers[tier] = environ.get(f"{prefix}_MODEL", tiers[tier])
+            if f"{prefix}_SLO_SECONDS" in environ:
+                latency_slo[tier] = float(environ[f"{prefix}_SLO_SECONDS"])
+        agent_tiers = {
+            agent_name: environ.get(f"FINANCIAL_ADVISOR_{agent_name.upper()}_TIER", tier)
+            for agent_name, tier in DEFAULT_AGENT_TIERS.items()
+        }
+        return cls(tiers, agent_tiers, latency_slo=latency_slo, **kwargs)
+
+    def tier_for(self, agent_name: str) -> str:
+        """Return the tier an agent's next call should use."""
+        tier = self.agent_tiers.get(agent_name, self.default_tier)
+        fallback = self.fallbacks.get(tier)
+        if fallback and self._degraded_until.get(tier, 0.0) > self._clock():
+            return fallback
+        return tier
+
+    def model_for(self, agent_name: str) -> str:
+        """Return the model an agent's next call should use."""
+        return self._model(self.tier_for(agent_name))
+
+    def primary_model(self, agent_name: str) -> str:
+        """Return the model of an agent's configured tier, ignoring fallbacks."""
+        return self._model(self.agent_tiers.get(agent_name, self.default_tier))
+
+    def _model(self, tier: str) -> str:
+        model = self.tiers[tier]
+        if model.startswith(STUB_MODEL_PREFIX):
+            register_stub_llm()
+        return model
+
+    def record_latency(self, tier: str, seconds: float):
+        """Record a call's latency and degrade the tier if it breaches its SLO."""
+        samples = self._latencies.setdefault(tier, deque(maxlen=self.window))
+        samples.append(seconds)
+        slo = self.latency_slo.get(tier)
+        if slo is None or len(samples) < samples.maxlen or tier not in self.fallbacks:
+            return
+        if statistics.median(samples) > slo:
+            self._degraded_until[tier] = self._clock() + self.cooldown
+            samples.clear()
+
+    def before_model_callback(self, callback_context, llm_request):
+        agent_name = callback_context.agent_name
+        tier = self.tier_for(agent_name)
+        if tier != self.agent_tiers.get(agent_name, self.default_tier):
+            self.fallback_calls += 1
+        llm_request.model = self.model_for(agent_name)
+        self._pending[(callback_context.invocation_id, agent_name)] = (None, tier)
+        # Cancelled calls run neither the after nor the error callback
+        while len(self._pending) > self.max_pending:
+            del self._pending[next(iter(self._pending))]
+        return None
+
+    def start_latency_clock(self, callback_context, llm_request):
+        key = (callback_context.invocation_id, callback_context.agent_name)
+        pending = self._pending.get(key)
+        if pending is not None:
+            self._pending[key] = (self._clock(), pending[1])
+        return None
+
+    def after_model_callback(self, callback_context, llm_response):
+        # Streaming calls report every chunk; the first one is the latency
+        started = self._pending.pop((callback_context.invocation_id, callback_context.agent_name), None)
+        if started is not None and started[0] is not None:
+            self.record_latency(started[1], self._clock() - started[0])
+        return None
+
+    def on_model_error_callback(self, callback_context, llm_request, error):
+        self._pending.pop((callback_context.invocation_id, callback_context.agent_name), None)
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        now = self._clock()
+        return {
+            "tiers": dict(self.tiers),
+            "degraded": sorted(tier for tier, until in self._degraded_until.items() if until > now),
+            "fallback_calls": self.fallback_calls,
+            "median_latency": {
+                tier: statistics.median(samples)
+                for tier, samples in self._latencies.items() if samples
+            },
+        }
+
+
+_stub_llm_class = None
+
+
+def register_stub_llm():
+    """Register a local model answering any "stub..." model name.
+
+    The stub needs no network or credentials and echoes the last user
+    message, which makes whole agent runs usable in tests. Set for example
+    FINANCIAL_ADVISOR_STRONG_MODEL=stub-strong to use it.
+    """
+    global _stub_llm_class
+    if _stub_llm_class is not None:
+        return _stub_llm_class
+
+    from google.adk.models import BaseLlm, LlmResponse
+    from google.adk.models.registry import LLMRegistry
+    from google.genai import types
+
+    class StubLlm(BaseLlm):
+        @classmethod
+        def supported_models(cls):
+            return [rf"{STUB_MODEL_PREFIX}.*"]
+
+        async def generate_content_async(self, llm_request, stream=False):
+            prompt_text = ""
+            for content in reversed(llm_request.contents or []):
+                texts = [part.text for part in content.parts or [] if part.text]
+                if texts:
+                    prompt_text = "".join(texts)
+                    break
+            yield LlmResponse(content=types.Content(
+                role="model",
+                parts=[types.Part(text=f"[{llm_request.model or self.model}] {prompt_text}")],
+            ))
+
+    LLMRegistry.register(StubLlm)
+    _stub_llm_class = StubLlm
+    return StubLlm
+
+
+router = ModelRouter.from_env()
@@ -0,0 +1,247 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""DAG pipeline mode: run the analysts as a fixed workflow instead of
+through coordinator turns"""
+
+import functools
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .callbacks import add_callback
+from .state_cache import StateSnapshotStore, attach_state_cache
+from .sub_agents.data_analyst import create_data_analyst_agent
+from .sub_agents.execution_analyst import create_execution_analyst_agent
+from .sub_agents.risk_analyst import create_risk_analyst_agent
+from .sub_agents.trading_analyst import create_trading_analyst_agent
+
+
+class Step(NamedTuple):
+    """One pipeline step: an agent builder, the state key it writes and
+    the state keys it reads."""
+
+    name: str
+    build: Callable[[], Any]
+    output_key: str
+    inputs: Tuple[str, ...]
+
+
+# The inputs mirror what each analyst prompt asks for
+STEPS = (
+    Step(
+        "data_analyst",
+        create_data_analyst_agent,
+        "market_data_analysis_output",
+        ("provided_ticker",),
+    ),
+    Step(
+        "trading_analyst",
+        create_trading_analyst_agent,
+        "proposed_trading_strategies_output",
+        ("market_data_analysis_output", "user_risk_attitude", "user_investment_period"),
+    ),
+    Step(
+        "execution_analyst",
+        create_execution_analyst_agent,
+        "execution_plan_output",
+        (
+            "proposed_trading_strategies_output",
+            "user_risk_attitude",
+            "user_investment_period",
+            "user_execution_preferences",
+        ),
+    ),
+    Step(
+        "risk_analyst",
+        create_risk_analyst_agent,
+        "final_risk_assessment_output",
+        (
+            "proposed_trading_strategies_output",
+            "execution_plan_output",
+            "user_risk_attitude",
+            "user_investment_period",
+            "user_execution_preferences",
+        ),
+    ),
+)
+
+
+def external_inputs(steps: Iterable[Step] = STEPS) -> List[str]:
+    """Return the state keys the pipeline reads but no step writes.
+
+    These must be in session state (or the user message) before it runs.
+    """
+    steps = list(steps)
+    produced = {step.output_key for step in steps}
+    needed: List[str] = []
+    for step in steps:
+        for key in step.inputs:
+            if key not in produced and key not in needed:
+                needed.append(key)
+    return needed
+
+
+def plan_stages(steps: Iterable[Step] = STEPS) -> List[List[Step]]:
+    """Group steps into stages that can run concurrently.
+
+    Each stage holds every step whose inputs are all written by earlier
+    stages, so steps in one stage are independent of each other. Steps
+    keep their declaration order within a stage.
+
+    Raises:
+        ValueError: If two steps write the same key or the dependencies
+            contain a cycle.
+    """
+    steps = list(steps)
+    writers: Dict[str, Step] = {}
+    for step in steps:
+        if step.output_key in writers:
+            raise ValueError(
+                f"Steps {writers[step.output_key].name} and {step.name} "
+                f"both write {step.output_key}"
+            )
+        writers[step.output_key] = step
+
+    available: Set[str] = set()
+    remaining = steps
+    stages: List[List[Step]] = []
+    while remaining:
+        ready = [
+            step for step in remaining
+            if all(key in available or key not in writers for key in step.inputs)
+        ]
+        if not ready:
+            names = ", ".join(step.name for step in remaining)
+            raise ValueError(f"Dependency cycle between steps: {names}")
+        stages.append(ready)
+        available.update(step.output_key for step in ready)
+        remaining = [step for step in remaining if step not in ready]
+    return stages
+
+
+def inject_state_inputs(agent: Any, inputs: Iterable[str], max_chars: Optional[int] = None):
+    """Append a step's inputs, read from session state, to its instruction.
+
+    The analyst prompts name their inputs without templating them, and a
+    workflow has no user turn in which to ask for them, so each step is
+    given their current values when it runs. With max_chars, long text
+    inputs are shortened by profiling.compact_state first.
+    """
+    base = agent.instruction
+    inputs = tuple(inputs)
+
+    def instruction(context) -> str:
+        values = {key: context.state.get(key) for key in inputs}
+        if max_chars is not None:
+            # Imported here since profiling imports this module
+            from .profiling import compact_state
+
+            values = compact_state(values, keys=inputs, max_chars=max_chars)
+        sections = [
+            base,
+            "Inputs for this run, already provided; do not ask the user for them:",
+        ]
+        for key in inputs:
+            value = values[key]
+            if value is None or value == "":
+                value = "(not provided; state the assumption you make instead)"
+            sections.append(f"{key}:\n{value}")
+        return "\n\n".join(sections)
+
+    agent.instruction = instruction
+    return agent
+
+
+def drop_upstream_reply(callback_context, llm_request):
+    """Drop the previous step's reply that opens a downstream step's request.
+
+    With include_contents="none" a request starts at the latest turn, which
+    for a step after the first stage is the previous step's reply. Its
+    output is already in the step's instruction (see inject_state_inputs),
+    so only the step's own tool calls and responses are kept.
+    """
+    contents = llm_request.contents
+    if contents and contents[0].role == "user" and not any(
+        part.function_response for part in contents[0].parts or []
+    ):
+        del contents[0]
+    return None
+
+
+def create_pipeline_agent(
+    steps: Iterable[Step] = STEPS,
+    name: str = "financial_pipeline",
+    state_store: Optional[StateSnapshotStore] = None,
+    search_backend: Any = None,
+    max_input_chars: Optional[int] = None,
+):
+    """Build a workflow agent that runs the steps stage by stage.
+
+    Stages run in order in a SequentialAgent; a stage with several steps
+    runs them concurrently in a ParallelAgent. Every call builds fresh
+    sub-agents, since an ADK agent can only have one parent, and gives
+    each its step inputs from session state (see inject_state_inputs),
+    so the state passed to a new session reaches the analysts. Steps do
+    not see the conversation history, so each upstream output reaches a
+    step once, through its instruction. With a
+    state_store, steps whose output is already stored for the session's
+    inputs are skipped and their stored output is used instead. A
+    search_backend is given to the data analyst step (see
+    create_data_analyst_agent). With max_input_chars, long upstream
+    outputs are compacted to that size before a step receives them.
+    """
+    from google.adk.agents import ParallelAgent, SequentialAgent
+
+    steps = list(steps)
+    if search_backend is not None:
+        steps = [
+            step._replace(build=functools.partial(step.build, search_backend=search_backend))
+            if step.build is create_data_analyst_agent else step
+            for step in steps
+        ]
+
+    produced = {step.output_key for step in steps}
+    stages = []
+    for index, stage in enumerate(plan_stages(steps)):
+        agents = []
+        for step in stage:
+            agent = inject_state_inputs(step.build(), step.inputs, max_input_chars)
+            agent.include_contents = "none"
+            if any(key in produced for key in step.inputs):
+                add_callback(agent, "before_model_callback", drop_upstream_reply, first=True)
+            agents.append(agent)
+        if state_store is not None:
+            for agent in agents:
+                attach_state_cache(agent, state_store)
+        if len(agents) == 1:
+            stages.append(agents[0])
+        else:
+            stages.append(
+                ParallelAgent(name=f"{name}_stage_{index}", sub_agents=agents)
+            )
+
+    return SequentialAgent(
+        name=name,
+        description=(
+            "run the market data, trading, execution and risk analyses as "
+            "a single workflow, concurrently where their inputs allow."
+        ),
+        sub_agents=stages,
+    )
+
+
+def __getattr__(name):
+    if name == "pipeline_agent":
+        agent = globals()[name] = create_pipeline_agent()
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,229 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Token budget profiling for the financial_advisor prompts and state"""
+
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from . import prompt
+from .callbacks import add_callback
+from .pipeline import STEPS
+from .sub_agents.data_analyst import prompt as data_analyst_prompt
+from .sub_agents.execution_analyst import prompt as execution_analyst_prompt
+from .sub_agents.risk_analyst import prompt as risk_analyst_prompt
+from .sub_agents.trading_analyst import prompt as trading_analyst_prompt
+
+# Rough English average for Gemini-style tokenizers
+CHARS_PER_TOKEN = 4
+
+INSTRUCTIONS = {
+    "financial_coordinator": prompt.FINANCIAL_COORDINATOR_PROMPT,
+    "data_analyst_agent": data_analyst_prompt.DATA_ANALYST_PROMPT,
+    "trading_analyst_agent": trading_analyst_prompt.TRADING_ANALYST_PROMPT,
+    "execution_analyst_agent": execution_analyst_prompt.EXECUTION_ANALYST_PROMPT,
+    "risk_analyst_agent": risk_analyst_prompt.RISK_ANALYST_PROMPT,
+}
+
+# State keys each agent receives; the coordinator sees all of them
+STATE_INPUTS = {f"{step.name}_agent": step.inputs for step in STEPS}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without calling a tokenizer."""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def compact_text(text: str, max_chars: int = 1200) -> str:
+    """Shorten a markdown report to its headings and leading lines.
+
+    Headings, bold labels and bullet points are kept in order until
+    max_chars is reached; texts already within the limit are unchanged.
+    """
+    if len(text) <= max_chars:
+        return text
+
+    kept: List[str] = []
+    size = 0
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or (kept and not stripped.startswith(("#", "**", "-", "*"))):
+            continue
+        if size + len(stripped) + 1 > max_chars:
+            if not kept:
+                kept.append(stripped[:max_chars])
+            break
+        kept.append(stripped)
+        size += len(stripped) + 1
+    kept.append(f"[compacted from {len(text)} characters]")
+    return "\n".join(kept)
+
+
+def compact_state(
+    state: Dict[str, Any],
+    keys: Optional[Iterable[str]] = None,
+    max_chars: int = 1200,
+) -> Dict[str, Any]:
+    """Return a copy of state with long text values compacted.
+
+    Args:
+        state: Session state
+        keys: Keys to compact, defaults to every upstream output
+        max_chars: Size each compacted value is cut down to
+    """
+    if keys is None:
+        keys = [step.output_key for step in STEPS]
+    compacted = dict(state)
+    for key in keys:
+        value = compacted.get(key)
+        if isinstance(value, str):
+            compacted[key] = compact_text(value, max_chars)
+    return compacted
+
+
+def budget_report(
+    state: Dict[str, Any],
+    compact: bool = False,
+    max_chars: int = 1200,
+) -> List[Dict[str, Any]]:
+    """Estimate each agent's per-call instruction and state tokens.
+
+    Args:
+        state: Session state the agents would receive
+        compact: Measure the state as compact_state would pass it on
+        max_chars: Compaction size, when compact is set
+
+    Returns:
+        One row per agent, largest total first
+    """
+    if compact:
+        state = compact_state(state, max_chars=max_chars)
+
+    rows = []
+    for agent_name, instruction in INSTRUCTIONS.items():
+        keys = STATE_INPUTS.get(agent_name, list(state))
+        state_tokens = {
+            key: estimate_tokens(str(state[key])) for key in keys if key in state
+        }
+        instruction_tokens = estimate_tokens(instruction)
+        rows.append({
+            "agent": agent_name,
+            "instruction_tokens": instruction_tokens,
+            "state_tokens": sum(state_tokens.values()),
+            "state_breakdown": state_tokens,
+            "total_tokens": instruction_tokens + sum(state_tokens.values()),
+        })
+    rows.sort(key=lambda row: row["total_tokens"], reverse=True)
+    return rows
+
+
+def format_report(rows: List[Dict[str, Any]]) -> str:
+    """Render budget_report rows as a text table."""
+    lines = [f"{'agent':<26}{'instruction':>12}{'state':>10}{'total':>10}"]
+    for row in rows:
+        lines.append(
+            f"{row['agent']:<26}{row['instruction_tokens']:>12}"
+            f"{row['state_tokens']:>10}{row['total_tokens']:>10}"
+        )
+    return "\n".join(lines)
+
+
+def _text_of(value: Any) -> str:
+    """Collect the text of a string, Content, Part or list of them."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return "\n".join(_text_of(item) for item in value)
+    parts = getattr(value, "parts", None)
+    if parts is not None:
+        return _text_of(parts)
+    return getattr(value, "text", None) or ""
+
+
+class TokenProfiler:
+    """Records the instruction and context tokens of every model call."""
+
+    def __init__(
+        self,
+        compact: bool = False,
+        max_chars: int = 1200,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+    ):
+        """
+        Args:
+            compact: Compact long text in earlier conversation turns before
+                the request is sent. Pipeline steps see no conversation
+                history; their inputs are compacted with
+                create_pipeline_agent(max_input_chars=...) instead.
+            max_chars: Size long texts are compacted to
+            count_tokens: Token counter, e.g. a real tokenizer
+        """
+        self.compact = compact
+        self.max_chars = max_chars
+        self.count_tokens = count_tokens
+        self.calls: Dict[str, Dict[str, int]] = {}
+
+    def before_model_callback(self, callback_context, llm_request):
+        contents = llm_request.contents or []
+        if self.compact:
+            # The last content is the current turn; only history is shortened
+            for content in contents[:-1]:
+                for part in getattr(content, "parts", None) or []:
+                    if getattr(part, "text", None):
+                        part.text = compact_text(part.text, self.max_chars)
+
+        config = getattr(llm_request, "config", None)
+        instruction = self.count_tokens(_text_of(getattr(config, "system_instruction", None)))
+        context = self.count_tokens(_text_of(contents))
+        record = self.calls.setdefault(callback_context.agent_name, {
+            "calls": 0, "instruction_tokens": 0, "context_tokens": 0, "max_call_tokens": 0,
+        })
+        record["calls"] += 1
+        record["instruction_tokens"] += instruction
+        record["context_tokens"] += context
+        record["max_call_tokens"] = max(record["max_call_tokens"], instruction + context)
+        return None
+
+    def attach(self, agent):
+        """Profile an agent and, recursively, its sub-agents and agent tools.
+
+        Workflow agents such as SequentialAgent make no model calls of
+        their own, so only their sub-agents are profiled.
+        """
+        if hasattr(agent, "before_model_callback"):
+            add_callback(agent, "before_model_callback", self.before_model_callback)
+        for sub_agent in getattr(agent, "sub_agents", None) or []:
+            self.attach(sub_agent)
+        for tool in getattr(agent, "tools", None) or []:
+            if getattr(tool, "agent", None) is not None:
+                self.attach(tool.agent)
+        return agent
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Per-agent totals and averages, largest total first."""
+        rows = []
+        for agent_name, record in self.calls.items():
+            total = record["instruction_tokens"] + record["context_tokens"]
+            rows.append(dict(
+                record,
+                agent=agent_name,
+                total_tokens=total,
+                average_call_tokens=total / record["calls"],
+            ))
+        rows.sort(key=lambda row: row["total_tokens"], reverse=True)
+        return rows
@@ -0,0 +1,85 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared rate limits for the financial_advisor model calls
+
+Model calls go through the framework's RateLimiter, keyed by the calling
+agent and by the model the request was routed to. The framework is imported
+as ``rate_limit`` when the package is loaded as a top-level package (e.g. by
+``adk web`` run from ``src``).
+"""
+
+import os
+from typing import Any, Dict, Mapping, Optional
+
+try:
+    from src.rate_limit import RateLimiter, model_rate_limit_callback
+except ImportError:
+    from rate_limit import RateLimiter, model_rate_limit_callback
+
+
+def _rate_from_env(
+    name: str, default: Optional[str], environ: Mapping[str, str]
+) -> Optional[float]:
+    value = environ.get(name, default)
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+    if not number > 0:
+        raise ValueError(f"{name} must be positive, got {value!r}")
+    return number
+
+
+def limiter_from_env(environ: Optional[Mapping[str, str]] = None) -> RateLimiter:
+    """
+    Build the package's limiter from environment variables.
+
+    FINANCIAL_ADVISOR_MODEL_RPM (default 60) and FINANCIAL_ADVISOR_MODEL_BURST
+    (default 5) limit each upstream model, shared by every agent; size them
+    to the project's quota. FINANCIAL_ADVISOR_AGENT_RPM and
+    FINANCIAL_ADVISOR_AGENT_BURST additionally limit each agent, and are
+    unset by default.
+
+    Raises:
+        ValueError: If a setting is not a positive number, or a burst is
+            below one call
+    """
+    environ = os.environ if environ is None else environ
+    limiter = RateLimiter()
+    for kind, default_rpm, default_burst in (
+        ("model", "60", "5"),
+        ("agent", None, None),
+    ):
+        prefix = f"FINANCIAL_ADVISOR_{kind.upper()}"
+        rpm = _rate_from_env(f"{prefix}_RPM", default_rpm, environ)
+        burst = _rate_from_env(f"{prefix}_BURST", default_burst, environ)
+        if burst is not None and burst < 1:
+            raise ValueError(f"{prefix}_BURST must be at least 1, got {burst}")
+        if rpm is not None:
+            limiter.set_default_limit(kind, rpm / 60, burst)
+    return limiter
+
+
+limiter = limiter_from_env()
+
+# Waits for the calling agent's and the routed model's quota
+before_model_callback = model_rate_limit_callback(limiter)
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Return per-agent and per-model call counts and queue waits."""
+    return limiter.stats()
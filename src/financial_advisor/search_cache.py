@@ -0,0 +1,263 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Persistent search-result cache for the data analyst's web searches"""
+
+import asyncio
+import importlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Seconds a cached result stays fresh, by query category. Filings do not
+# change once published; news goes stale within the hour.
+DEFAULT_FRESHNESS = {
+    "filings": 7 * 24 * 3600,
+    "analyst": 12 * 3600,
+    "news": 3600,
+    "general": 6 * 3600,
+}
+
+_CATEGORY_PATTERNS = (
+    ("filings", re.compile(r"\b(sec|edgar|filing|filings|10-k|10-q|8-k|form 4|13f|s-1|proxy)\b")),
+    ("analyst", re.compile(r"\b(analyst|analysts|rating|ratings|price target|upgrade|downgrade|consensus)\b")),
+    ("news", re.compile(r"\b(news|today|latest|breaking|headline|headlines|this week)\b")),
+)
+
+# Cache file used by search_backend_from_env unless
+# FINANCIAL_ADVISOR_SEARCH_CACHE names another file (or ":memory:")
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "financial_advisor", "search_cache.db"
+)
+
+
+def classify_query(query: str) -> str:
+    """Return the freshness category of a search query."""
+    lowered = query.lower()
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(lowered):
+            return category
+    return "general"
+
+
+def normalize_query(query: str) -> str:
+    """Fold case and whitespace so trivially different queries share an entry."""
+    return " ".join(query.lower().split())
+
+
+class SearchBackend(ABC):
+    """Source of web search results.
+
+    Subclasses implement search(query) and return a list of result dicts
+    (for example with "title", "url" and "snippet").
+    """
+
+    @abstractmethod
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        pass
+
+
+class FakeSearchBackend(SearchBackend):
+    """Local backend for tests: canned results and a record of queries."""
+
+    def __init__(self, results: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        self.results = results or {}
+        self.queries: List[str] = []
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        self.queries.append(query)
+        if query in self.results:
+            return self.results[query]
+        return [{
+            "title": f"Result for {query}",
+            "url": f"https://example.com/search?q={normalize_query(query).replace(' ', '+')}",
+            "snippet": f"Canned result for {query}.",
+        }]
+
+
+class SearchCache:
+    """SQLite-backed store of search results keyed by ticker and query."""
+
+    def __init__(self, path: str = ":memory:", clock: Callable[[], float] = time.time):
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Database file, or ":memory:" for a per-process cache
+            clock: Time source in seconds, overridable for tests
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS search_results ("
+                " ticker TEXT NOT NULL,"
+                " query TEXT NOT NULL,"
+                " category TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " results TEXT NOT NULL,"
+                " PRIMARY KEY (ticker, query))"
+            )
+
+    def get(self, ticker: str, query: str, max_age: float) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results no older than max_age seconds, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fetched_at, results FROM search_results WHERE ticker = ? AND query = ?",
+                (ticker.upper(), normalize_query(query)),
+            ).fetchone()
+        if row is None or self._clock() - row[0] > max_age:
+            return None
+        return json.loads(row[1])
+
+    def put(self, ticker: str, query: str, category: str, results: List[Dict[str, Any]]):
+        """Store results, replacing any older entry for the same key."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO search_results VALUES (?, ?, ?, ?, ?)",
+                (
+                    ticker.upper(),
+                    normalize_query(query),
+                    category,
+                    self._clock(),
+                    json.dumps(results, default=str),
+                ),
+            )
+
+    def purge(self, freshness: Dict[str, float] = DEFAULT_FRESHNESS) -> int:
+        """Delete entries past their category's freshness window.
+
+        Returns:
+            Number of entries deleted
+        """
+        now = self._clock()
+        deleted = 0
+        with self._lock, self._db:
+            for category, max_age in freshness.items():
+                deleted += self._db.execute(
+                    "DELETE FROM search_results WHERE category = ? AND fetched_at < ?",
+                    (category, now - max_age),
+                ).rowcount
+        return deleted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM search_results").fetchone()[0]
+
+    def close(self):
+        self._db.close()
+
+
+class CachedSearch:
+    """Search backend fronted by a SearchCache with per-category freshness."""
+
+    def __init__(
+        self,
+        backend: SearchBackend,
+        cache: Optional[SearchCache] = None,
+        freshness: Optional[Dict[str, float]] = None,
+    ):
+        self.backend = backend
+        self.cache = cache if cache is not None else SearchCache()
+        self.freshness = dict(DEFAULT_FRESHNESS)
+        self.freshness.update(freshness or {})
+        self.hits = 0
+        self.misses = 0
+
+    def search(self, query: str, ticker: str = "") -> Tuple[List[Dict[str, Any]], bool]:
+        """Return results for a query and whether they came from the cache."""
+        category = classify_query(query)
+        cached = self.cache.get(ticker, query, self.freshness[category])
+        if cached is not None:
+            self.hits += 1
+            return cached, True
+
+        self.misses += 1
+        results = self.backend.search(query)
+        self.cache.put(ticker, query, category, results)
+        return results, False
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.cache),
+        }
+
+
+def make_search_tool(
+    cached_search: CachedSearch,
+) -> Callable[[str, str], Awaitable[Dict[str, Any]]]:
+    """Wrap a CachedSearch as a function tool for the data analyst.
+
+    The backend request and the SQLite lookups block, so the tool runs
+    them on a worker thread to keep the event loop free for other agents.
+    """
+
+    async def web_search(query: str, ticker: str) -> Dict[str, Any]:
+        """Search the web for information about a stock.
+
+        Args:
+            query: The search query, e.g. "AAPL 10-Q filing" or "AAPL analyst ratings".
+            ticker: The stock ticker symbol the query is about, e.g. "AAPL".
+
+        Returns:
+            A dict with the list of "results" (title, url, snippet) and
+            whether they were served from the cache.
+        """
+        results, cached = await asyncio.to_thread(cached_search.search, query, ticker)
+        return {"results": results, "cached": cached}
+
+    return web_search
+
+
+def as_cached_search(search_backend: Any) -> CachedSearch:
+    """Put a SearchBackend behind an in-memory cache; CachedSearch passes through."""
+    if isinstance(search_backend, CachedSearch):
+        return search_backend
+    return CachedSearch(search_backend)
+
+
+def search_backend_from_env(environ: Optional[Dict[str, str]] = None) -> Optional[CachedSearch]:
+    """Build the search configured by the environment, if any.
+
+    FINANCIAL_ADVISOR_SEARCH_BACKEND names a SearchBackend subclass by
+    import path ("package.module.ClassName"); it is built without
+    arguments. FINANCIAL_ADVISOR_SEARCH_CACHE is the SQLite file shared
+    across sessions and restarts, defaulting to DEFAULT_CACHE_PATH; set it
+    to ":memory:" for a cache that lasts only as long as the process.
+
+    Returns:
+        The cached search, or None to keep the built-in google_search
+    """
+    environ = os.environ if environ is None else environ
+    class_path = environ.get("FINANCIAL_ADVISOR_SEARCH_BACKEND")
+    if not class_path:
+        return None
+
+    module_name, _, class_name = class_path.rpartition(".")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    cache = SearchCache(environ.get("FINANCIAL_ADVISOR_SEARCH_CACHE", DEFAULT_CACHE_PATH))
+    return CachedSearch(backend_class(), cache)
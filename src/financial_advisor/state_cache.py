@@ -0,0 +1,205 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Snapshot cache for pipeline outputs, so follow-up sessions can resume
+from upstream results instead of rerunning the analysts"""
+
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from .callbacks import add_callback
+
+# The session-state inputs each output depends on. The current date is
+# always part of the key too, so nothing is reused across days.
+SNAPSHOT_DIMENSIONS = {
+    "market_data_analysis_output": ("provided_ticker",),
+    "proposed_trading_strategies_output": (
+        "provided_ticker",
+        "user_risk_attitude",
+        "user_investment_period",
+    ),
+    "execution_plan_output": (
+        "provided_ticker",
+        "user_risk_attitude",
+        "user_investment_period",
+        "user_execution_preferences",
+    ),
+    "final_risk_assessment_output": (
+        "provided_ticker",
+        "user_risk_attitude",
+        "user_investment_period",
+        "user_execution_preferences",
+    ),
+}
+
+
+def _today() -> str:
+    return datetime.date.today().isoformat()
+
+
+def snapshot_key(
+    output_key: str,
+    state: Dict[str, Any],
+    today: Callable[[], str] = _today,
+) -> Optional[str]:
+    """Return the store key for an output given the session state.
+
+    Returns None when the output is not cacheable or one of the inputs it
+    depends on is missing from state.
+    """
+    dimensions = SNAPSHOT_DIMENSIONS.get(output_key)
+    if dimensions is None:
+        return None
+
+    values = []
+    for name in dimensions:
+        value = state.get(name)
+        if value is None or value == "":
+            return None
+        values.append(" ".join(str(value).lower().split()))
+    return json.dumps([output_key, today()] + values)
+
+
+class StateSnapshotStore:
+    """SQLite-backed store of state values keyed by snapshot_key."""
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        today: Callable[[], str] = _today,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open (and create if needed) the snapshot database.
+
+        Args:
+            path: Database file, or ":memory:" for a per-process store
+            today: Returns the date that scopes snapshots
+            clock: Time source recorded with each snapshot
+        """
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._today = today
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS state_snapshots ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " stored_at REAL NOT NULL)"
+            )
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, output_key: str, state: Dict[str, Any]) -> Optional[Any]:
+        """Return the snapshot of output_key for this state, if any."""
+        key = snapshot_key(output_key, state, self._today)
+        if key is None:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM state_snapshots WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def save(self, output_key: str, state: Dict[str, Any]) -> bool:
+        """Store state[output_key] under its snapshot key.
+
+        Returns:
+            True if a snapshot was written
+        """
+        key = snapshot_key(output_key, state, self._today)
+        value = state.get(output_key)
+        if key is None or value is None:
+            return False
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO state_snapshots VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=str), self._clock()),
+            )
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM state_snapshots").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self):
+        self._db.close()
+
+
+def state_store_from_env(
+    environ: Optional[Mapping[str, str]] = None,
+) -> Optional[StateSnapshotStore]:
+    """Open the snapshot store configured by the environment, if any.
+
+    FINANCIAL_ADVISOR_STATE_CACHE is the SQLite file the pipeline keeps
+    its step outputs in across sessions, or ":memory:" for a per-process
+    store. Snapshots are opt-in: without it every run calls the analysts.
+
+    Returns:
+        The store, or None to run without snapshots
+    """
+    environ = os.environ if environ is None else environ
+    path = environ.get("FINANCIAL_ADVISOR_STATE_CACHE")
+    if not path:
+        return None
+    return StateSnapshotStore(path)
+
+
+def snapshot_callbacks(store: StateSnapshotStore, output_key: str) -> Tuple[Callable, Callable]:
+    """Build before/after agent callbacks that reuse and record an output.
+
+    The before callback restores a cached value into state and returns it
+    as the agent's reply, which makes ADK skip the agent. The after
+    callback saves whatever the agent wrote to output_key.
+    """
+
+    def before_agent_callback(callback_context):
+        value = store.load(output_key, callback_context.state)
+        if value is None:
+            return None
+        from google.genai import types
+
+        callback_context.state[output_key] = value
+        text = value if isinstance(value, str) else json.dumps(value)
+        return types.Content(role="model", parts=[types.Part(text=text)])
+
+    def after_agent_callback(callback_context):
+        store.save(output_key, callback_context.state)
+        return None
+
+    return before_agent_callback, after_agent_callback
+
+
+def attach_state_cache(agent, store: StateSnapshotStore):
+    """Make an agent reuse snapshots of its output_key from the store."""
+    if agent.output_key not in SNAPSHOT_DIMENSIONS:
+        raise ValueError(f"Agent {agent.name} output {agent.output_key} is not cacheable")
+    before, after = snapshot_callbacks(store, agent.output_key)
+    add_callback(agent, "before_agent_callback", before)
+    add_callback(agent, "after_agent_callback", after)
+    return agent
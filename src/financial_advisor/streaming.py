@@ -0,0 +1,106 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Stream partial model output from the financial_advisor agents to callers"""
+
+from typing import Any, AsyncIterator, Dict, NamedTuple, Optional, Set
+
+
+class StreamChunk(NamedTuple):
+    """A piece of an agent's reply.
+
+    text is new text since the previous chunk from the same author; done
+    marks the author's last chunk for the current reply.
+    """
+
+    author: str
+    text: str
+    done: bool
+
+
+def _event_text(event: Any) -> str:
+    content = getattr(event, "content", None)
+    parts = getattr(content, "parts", None) or []
+    return "".join(getattr(part, "text", None) or "" for part in parts)
+
+
+async def text_chunks(events: AsyncIterator[Any]) -> AsyncIterator[StreamChunk]:
+    """Turn ADK events into incremental text chunks.
+
+    In SSE mode ADK emits partial events with new text, then one final
+    event repeating the whole reply. The final event is reduced to an
+    empty done chunk when its text was already streamed, so callers can
+    simply concatenate chunk texts.
+    """
+    streamed: Set[str] = set()
+    async for event in events:
+        text = _event_text(event)
+        author = getattr(event, "author", "") or ""
+        if getattr(event, "partial", False):
+            if text:
+                streamed.add(author)
+                yield StreamChunk(author, text, False)
+            continue
+
+        if not text:
+            continue
+        if author in streamed:
+            streamed.discard(author)
+            yield StreamChunk(author, "", True)
+        else:
+            yield StreamChunk(author, text, True)
+
+
+async def stream_advice(
+    agent: Any,
+    message: str,
+    user_id: str = "user",
+    session_id: Optional[str] = None,
+    state: Optional[Dict[str, Any]] = None,
+    runner: Any = None,
+) -> AsyncIterator[StreamChunk]:
+    """Run an agent on a message and yield its reply as it is generated.
+
+    Agents run inside a workflow (the pipeline) stream their own tokens
+    too. Sub-agents called through an AgentTool only report their final
+    result to the coordinator, which then streams its own reply.
+
+    Args:
+        agent: Agent to run, e.g. root_agent or a pipeline agent
+        message: The user's message
+        user_id: Session owner
+        session_id: Existing session to continue, or None for a new one
+        state: Initial state for a new session, e.g. provided_ticker
+        runner: Runner to use, defaults to an InMemoryRunner for agent
+    """
+    from google.adk.agents.run_config import RunConfig, StreamingMode
+    from google.adk.runners import InMemoryRunner
+    from google.genai import types
+
+    if runner is None:
+        runner = InMemoryRunner(agent=agent, app_name=agent.name)
+    if session_id is None:
+        session = await runner.session_service.create_session(
+            app_name=runner.app_name, user_id=user_id, state=state or {}
+        )
+        session_id = session.id
+
+    events = runner.run_async(
+        user_id=user_id,
+        session_id=session_id,
+        new_message=types.Content(role="user", parts=[types.Part(text=message)]),
+        run_config=RunConfig(streaming_mode=StreamingMode.SSE),
+    )
+    async for chunk in text_chunks(events):
+        yield chunk
@@ -14,4 +14,11 @@
 
 """data_analyst_agent for finding information using google search"""
 
-from .agent import data_analyst_agent
+from . import agent
+from .agent import create_data_analyst_agent
+
+
+def __getattr__(name):
+    if name == "data_analyst_agent":
+        return agent.data_analyst_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,17 +14,53 @@
 
 """data_analyst_agent for finding information using google search"""
 
-from google.adk import Agent
-from google.adk.tools import google_search
-
 from . import prompt
+from ... import configure_environment
+from ...model_routing import router
+from ...rate_limits import before_model_callback
+
+
+def create_data_analyst_agent(search_backend=None):
+    """Build a new data analyst agent.
+
+    Args:
+        search_backend: SearchBackend (or CachedSearch) searched through a
+            cached web_search tool instead of the built-in google_search.
+    """
+    configure_environment()
+    from google.adk import Agent
+
+    if search_backend is None:
+        from google.adk.tools import google_search
+
+        search_tool = google_search
+        instruction = prompt.DATA_ANALYST_PROMPT
+    else:
+        from ...search_cache import as_cached_search, make_search_tool
+
+        search_tool = make_search_tool(as_cached_search(search_backend))
+        instruction = prompt.data_analyst_prompt(
+            "web_search (arguments: query, ticker)"
+        )
+
+    return Agent(
+        model=router.primary_model("data_analyst_agent"),
+        name="data_analyst_agent",
+        instruction=instruction,
+        before_model_callback=[
+            router.before_model_callback,
+            before_model_callback,
+            router.start_latency_clock,
+        ],
+        after_model_callback=router.after_model_callback,
+        on_model_error_callback=router.on_model_error_callback,
+        output_key="market_data_analysis_output",
+        tools=[search_tool],
+    )
 
-MODEL = "gemini-1.5-pro"
 
-data_analyst_agent = Agent(
-    model=MODEL,
-    name="data_analyst_agent",
-    instruction=prompt.DATA_ANALYST_PROMPT,
-    output_key="market_data_analysis_output",
-    tools=[google_search],
-)
+def __getattr__(name):
+    if name == "data_analyst_agent":
+        agent = globals()[name] = create_data_analyst_agent()
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
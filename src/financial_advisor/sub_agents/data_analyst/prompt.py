@@ -86,3 +86,10 @@ The data_analyst must return a single, comprehensive report object or string wit
      * **Date Published:** [Publication Date of Article]
      * **Brief Relevance:** (1-2 sentences on why this source was key to the analysis)
 """
+
+
+def data_analyst_prompt(search_tool: str = "Google Search") -> str:
+    """Return the prompt for a data analyst searching with the named tool."""
+    return DATA_ANALYST_PROMPT.replace(
+        "the Google Search tool", f"the {search_tool} tool"
+    )
@@ -14,4 +14,11 @@
 
 """Execution_analyst_agent for finding the ideal execution strategy"""
 
-from .agent import execution_analyst_agent
+from . import agent
+from .agent import create_execution_analyst_agent
+
+
+def __getattr__(name):
+    if name == "execution_analyst_agent":
+        return agent.execution_analyst_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,15 +14,34 @@
 
 """Execution_analyst_agent for finding the ideal execution strategy"""
 
-from google.adk import Agent
-
 from . import prompt
+from ... import configure_environment
+from ...model_routing import router
+from ...rate_limits import before_model_callback
+
+
+def create_execution_analyst_agent():
+    """Build a new execution analyst agent."""
+    configure_environment()
+    from google.adk import Agent
+
+    return Agent(
+        model=router.primary_model("execution_analyst_agent"),
+        name="execution_analyst_agent",
+        instruction=prompt.EXECUTION_ANALYST_PROMPT,
+        before_model_callback=[
+            router.before_model_callback,
+            before_model_callback,
+            router.start_latency_clock,
+        ],
+        after_model_callback=router.after_model_callback,
+        on_model_error_callback=router.on_model_error_callback,
+        output_key="execution_plan_output",
+    )
 
-MODEL = "gemini-1.5-pro"
 
-execution_analyst_agent = Agent(
-    model=MODEL,
-    name="execution_analyst_agent",
-    instruction=prompt.EXECUTION_ANALYST_PROMPT,
-    output_key="execution_plan_output",
-)
+def __getattr__(name):
+    if name == "execution_analyst_agent":
+        agent = globals()[name] = create_execution_analyst_agent()
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
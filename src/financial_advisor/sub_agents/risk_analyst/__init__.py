@@ -14,4 +14,11 @@
 
 """Risk Analysis Agent for providing the final risk evaluation"""
 
-from .agent import risk_analyst_agent
+from . import agent
+from .agent import create_risk_analyst_agent
+
+
+def __getattr__(name):
+    if name == "risk_analyst_agent":
+        return agent.risk_analyst_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
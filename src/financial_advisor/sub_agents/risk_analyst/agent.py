@@ -14,15 +14,34 @@
 
 """Risk Analysis Agent for providing the final risk evaluation"""
 
-from google.adk import Agent
-
 from . import prompt
+from ... import configure_environment
+from ...model_routing import router
+from ...rate_limits import before_model_callback
+
+
+def create_risk_analyst_agent():
+    """Build a new risk analyst agent."""
+    configure_environment()
+    from google.adk import Agent
+
+    return Agent(
+        model=router.primary_model("risk_analyst_agent"),
+        name="risk_analyst_agent",
+        instruction=prompt.RISK_ANALYST_PROMPT,
+        before_model_callback=[
+            router.before_model_callback,
+            before_model_callback,
+            router.start_latency_clock,
+        ],
+        after_model_callback=router.after_model_callback,
+        on_model_error_callback=router.on_model_error_callback,
+        output_key="final_risk_assessment_output",
+    )
 
-MODEL="gemini-1.5-pro"
 
-risk_analyst_agent = Agent(
-    model=MODEL,
-    name="risk_analyst_agent",
-    instruction=prompt.RISK_ANALYST_PROMPT,
-    output_key="final_risk_assessment_output",
-)
+def __getattr__(name):
+    if name == "risk_analyst_agent":
+        agent = globals()[name] = create_risk_analyst_agent()
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
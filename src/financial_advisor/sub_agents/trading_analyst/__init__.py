@@ -14,4 +14,11 @@
 
 """trading_analyst_agent for proposing trading strategies"""
 
-from .agent import trading_analyst_agent
+from . import agent
+from .agent import create_trading_analyst_agent
+
+
+def __getattr__(name):
+    if name == "trading_analyst_agent":
+        return agent.trading_analyst_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,203 @@
+"""
+Agent History Storage
+
+This module provides the fixed-capacity buffer and compact record type
+used to hold agent history.
+"""
+
+import hashlib
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional
+
+DEFAULT_HISTORY_SIZE = 500
+
+# How much of each input/output payload a history entry keeps
+PAYLOAD_MODES = ("full", "length", "hash")
+
+_ENTRY_FIELDS = frozenset(("input", "output", "timestamp"))
+
+
+def summarize_payload(value: Any, mode: str = "full") -> Any:
+    """
+    Reduce a payload according to the history payload mode.
+
+    Args:
+        value: The input or output to record
+        mode: "full" keeps the value, "length" keeps len(str(value)) and
+            "hash" keeps a 64-bit digest of str(value)
+
+    Returns:
+        The value to store in the history entry
+    """
+    if mode == "full":
+        return value
+    if mode == "length":
+        return len(str(value))
+    if mode == "hash":
+        digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8)
+        return int.from_bytes(digest.digest(), "big")
+    raise ValueError(
+        f"Unknown history payload mode {mode!r}, expected one of {PAYLOAD_MODES}"
+    )
+
+
+class HistoryEntry:
+    """
+    Compact record of a single processed input.
+
+    Uses __slots__ instead of a per-entry dict and supports read-only
+    mapping access (entry["output"], entry.get(...)) so code written
+    against dict entries keeps working.
+    """
+
+    __slots__ = ("input", "output", "timestamp")
+
+    def __init__(self, input: Any, output: Any, timestamp: Optional[float] = None):
+        """
+        Initialize the entry.
+
+        Args:
+            input: The processed input, or its summary
+            output: The produced output, or its summary
+            timestamp: When the input was processed
+        """
+        self.input = input
+        self.output = output
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_dict(cls, entry: Dict[str, Any], payload: str = "full") -> "HistoryEntry":
+        """
+        Build an entry from an {"input", "output", "timestamp"} dict.
+
+        Args:
+            entry: Dictionary containing the history entry
+            payload: Payload mode applied to input and output
+
+        Returns:
+            Compact history entry
+        """
+        return cls(
+            summarize_payload(entry["input"], payload),
+            summarize_payload(entry["output"], payload),
+            entry.get("timestamp")
+        )
+
+    @staticmethod
+    def accepts(entry: Any) -> bool:
+        """Return True if a dict entry can be stored as a HistoryEntry."""
+        return (
+            isinstance(entry, dict)
+            and "input" in entry
+            and "output" in entry
+            and _ENTRY_FIELDS.issuperset(entry)
+        )
+
+    def keys(self):
+        return self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the entry as a plain dictionary."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, HistoryEntry):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"HistoryEntry(input={self.input!r}, output={self.output!r}, "
+            f"timestamp={self.timestamp!r})"
+        )
+
+
+class HistoryBuffer(Sequence):
+    """
+    Fixed-capacity ring buffer of history entries.
+
+    Appending is O(1); once the buffer is full each new entry overwrites
+    the oldest one in place, so memory stays flat regardless of how many
+    entries an agent records. Indexing and iteration run oldest to newest
+    like a list.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE):
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of entries retained
+        """
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+
+        self.capacity = capacity
+        self._items: List[Any] = [None] * capacity
+        self._start = 0
+        self._size = 0
+
+    def append(self, item: Any):
+        """
+        Add an entry, evicting the oldest one if the buffer is full.
+
+        Args:
+            item: The entry to add
+        """
+        if self._size < self.capacity:
+            self._items[(self._start + self._size) % self.capacity] = item
+            self._size += 1
+        else:
+            self._items[self._start] = item
+            self._start = (self._start + 1) % self.capacity
+
+    def clear(self):
+        """Remove all entries."""
+        self._items = [None] * self.capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("history index out of range")
+
+        return self._items[(self._start + index) % self.capacity]
+
+    def __iter__(self) -> Iterator[Any]:
+        for offset in range(self._size):
+            yield self._items[(self._start + offset) % self.capacity]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (HistoryBuffer, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"HistoryBuffer({list(self)!r}, capacity={self.capacity})"
@@ -0,0 +1,269 @@
+"""
+History Journal
+
+This module provides an append-only, on-disk journal for agent history,
+so full audit history can be kept without holding it in memory.
+"""
+
+import asyncio
+import atexit
+import json
+import mmap
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+
+# Journals with buffered entries, closed at interpreter exit so they are
+# not lost when the owner never calls close()
+_open_journals: "weakref.WeakSet[HistoryJournal]" = weakref.WeakSet()
+
+
+def _close_open_journals():
+    for journal in list(_open_journals):
+        journal.close()
+
+
+atexit.register(_close_open_journals)
+
+
+class HistoryJournal:
+    """
+    Append-only journal of history entries split into segment files.
+
+    Entries are buffered in memory and written in batches by a single
+    background thread, so appending never blocks the event loop on file
+    I/O. A batch is written once batch_size entries are buffered or the
+    oldest buffered entry is flush_interval seconds old, and anything
+    still buffered is written at interpreter exit. Each segment is a JSON-lines file; once it grows past
+    segment_max_bytes a new segment is started. Reads memory-map the
+    segments and skip any that fall entirely outside the requested time
+    range.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        batch_size: int = 100,
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        flush_interval: Optional[float] = 1.0
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            directory: Directory holding the segment files
+            batch_size: Number of buffered entries that triggers a write
+            segment_max_bytes: Size after which a new segment is started
+            flush_interval: Seconds an entry may wait in the buffer before
+                the next append writes it, or None to write only full
+                batches
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.directory = directory
+        self.batch_size = batch_size
+        self.segment_max_bytes = segment_max_bytes
+        self.flush_interval = flush_interval
+
+        os.makedirs(directory, exist_ok=True)
+        segments = self._segment_paths()
+        self._segment_index = (
+            self._index_of(segments[-1]) if segments else 0
+        )
+
+        self._buffer: List[str] = []
+        self._buffered_since = 0.0
+        self._write_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_write: Optional[Future] = None
+
+    def append(self, entry: Any, timestamp: Optional[float] = None):
+        """
+        Buffer an entry for writing.
+
+        Args:
+            entry: The history entry (a dict or anything with to_dict)
+            timestamp: Wall-clock time of the entry, defaults to now
+        """
+        if hasattr(entry, "to_dict"):
+            entry = entry.to_dict()
+
+        record = {
+            "ts": time.time() if timestamp is None else timestamp,
+            "entry": entry
+        }
+        if not self._buffer:
+            self._buffered_since = time.monotonic()
+            _open_journals.add(self)
+        self._buffer.append(json.dumps(record, default=str))
+
+        if len(self._buffer) >= self.batch_size or (
+            self.flush_interval is not None
+            and time.monotonic() - self._buffered_since >= self.flush_interval
+        ):
+            self.flush(wait=False)
+
+    def flush(self, wait: bool = True):
+        """
+        Write all buffered entries.
+
+        Args:
+            wait: Block until the data is on disk. Pass False from
+                event-loop code to hand the write to the background thread.
+        """
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="history-journal"
+                )
+            self._last_write = self._executor.submit(self._write_batch, batch)
+
+        if wait and self._last_write is not None:
+            self._last_write.result()
+
+    async def aflush(self):
+        """Write all buffered entries without blocking the event loop."""
+        self.flush(wait=False)
+        if self._last_write is not None:
+            await asyncio.wrap_future(self._last_write)
+
+    def close(self):
+        """Flush buffered entries and stop the background writer."""
+        # Written on the calling thread: at interpreter exit the writer
+        # thread no longer accepts work
+        batch, self._buffer = self._buffer, []
+        if self._last_write is not None:
+            self._last_write.result()
+        if batch:
+            self._write_batch(batch)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        _open_journals.discard(self)
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Return journaled records within a time range.
+
+        Buffered entries are flushed first so the result is complete.
+        This blocks on file I/O; use aquery from event-loop code.
+
+        Args:
+            start: Earliest timestamp to include, or None for no lower bound
+            end: Latest timestamp to include, or None for no upper bound
+
+        Returns:
+            List of {"ts", "entry"} records in write order
+        """
+        self.flush()
+        return list(self._iter_records(start, end))
+
+    async def aquery(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Return journaled records within a time range without blocking the
+        event loop.
+
+        Args:
+            start: Earliest timestamp to include, or None for no lower bound
+            end: Latest timestamp to include, or None for no upper bound
+
+        Returns:
+            List of {"ts", "entry"} records in write order
+        """
+        await self.aflush()
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, lambda: list(self._iter_records(start, end))
+        )
+
+    def _iter_records(
+        self,
+        start: Optional[float],
+        end: Optional[float]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield records in range, skipping segments outside it."""
+        segments = self._segment_paths()
+        first_stamps = [self._first_timestamp(path) for path in segments]
+
+        for i, path in enumerate(segments):
+            first = first_stamps[i]
+            if first is None:
+                continue
+            if end is not None and first > end:
+                break
+            # Segments are written in time order, so the next segment's
+            # first entry bounds everything in this one
+            following = first_stamps[i + 1] if i + 1 < len(first_stamps) else None
+            if start is not None and following is not None and following < start:
+                continue
+
+            for record in self._read_segment(path):
+                ts = record["ts"]
+                if start is not None and ts < start:
+                    continue
+                if end is not None and ts > end:
+                    continue
+                yield record
+
+    def _write_batch(self, batch: List[str]):
+        """Append a batch of serialized records to the current segment."""
+        data = ("\n".join(batch) + "\n").encode("utf-8")
+        with self._write_lock:
+            path = self._segment_path(self._segment_index)
+            if os.path.exists(path) and os.path.getsize(path) >= self.segment_max_bytes:
+                self._segment_index += 1
+                path = self._segment_path(self._segment_index)
+            with open(path, "ab") as f:
+                f.write(data)
+
+    def _read_segment(self, path: str) -> Iterator[Dict[str, Any]]:
+        """Yield the records of one segment via a memory map."""
+        if os.path.getsize(path) == 0:
+            return
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    if line.strip():
+                        yield json.loads(line)
+
+    def _first_timestamp(self, path: str) -> Optional[float]:
+        """Return the timestamp of the first record in a segment."""
+        with open(path, "rb") as f:
+            line = f.readline()
+        if not line.strip():
+            return None
+        return json.loads(line)["ts"]
+
+    def _segment_paths(self) -> List[str]:
+        """Return segment paths in write order."""
+        names = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        )
+        return [os.path.join(self.directory, name) for name in names]
+
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(
+            self.directory, f"{SEGMENT_PREFIX}{index:08d}{SEGMENT_SUFFIX}"
+        )
+
+    @staticmethod
+    def _index_of(path: str) -> int:
+        name = os.path.basename(path)
+        return int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
@@ -0,0 +1,224 @@
+"""
+Agent Metrics
+
+This module provides lightweight per-agent call metrics (counters, an
+in-flight gauge and latency histograms) with a Prometheus text exporter.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+# Latency bucket upper bounds in seconds
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+OUTCOMES = ("ok", "error", "timeout", "cancelled")
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Recording a sample is a bisect plus two additions, so it is cheap
+    enough to run on every call. Percentiles are estimated by linear
+    interpolation inside the bucket that holds the requested rank.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets: Increasing bucket upper bounds in seconds
+        """
+        self.buckets = tuple(sorted(buckets))
+        # One extra slot for samples above the last bound (+Inf)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float):
+        """
+        Record one sample.
+
+        Args:
+            seconds: Observed latency
+        """
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate a latency percentile.
+
+        Args:
+            q: Quantile between 0 and 1 (0.99 for p99)
+
+        Returns:
+            Estimated latency in seconds, or None with no samples
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count == 0:
+                continue
+            if cumulative + bucket_count >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i]
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+
+        return self.buckets[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return count, sum and p50/p95/p99 estimates."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99)
+        }
+
+
+class AgentMetrics:
+    """Call counters, in-flight gauge and latency histogram for one agent."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the metrics.
+
+        Args:
+            buckets: Latency bucket upper bounds in seconds
+        """
+        self.calls = 0
+        self.in_flight = 0
+        self.outcomes: Dict[str, int] = {outcome: 0 for outcome in OUTCOMES}
+        self.latency = LatencyHistogram(buckets)
+
+    def start(self):
+        """Record that a call has started."""
+        self.calls += 1
+        self.in_flight += 1
+
+    def finish(self, seconds: float, outcome: str = "ok"):
+        """
+        Record that a call has finished.
+
+        Args:
+            seconds: Time the call took
+            outcome: One of "ok", "error", "timeout" or "cancelled"
+        """
+        self.in_flight -= 1
+        self.outcomes[outcome] += 1
+        self.latency.observe(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current metric values."""
+        return {
+            "calls": self.calls,
+            "errors": self.outcomes["error"],
+            "timeouts": self.outcomes["timeout"],
+            "cancelled": self.outcomes["cancelled"],
+            "in_flight": self.in_flight,
+            "latency": self.latency.snapshot()
+        }
+
+
+class MetricsRegistry:
+    """Collection of per-agent metrics."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the registry.
+
+        Args:
+            buckets: Latency bucket upper bounds used for every agent
+        """
+        self.buckets = tuple(buckets)
+        self.agents: Dict[str, AgentMetrics] = {}
+
+    def for_agent(self, agent_name: str) -> AgentMetrics:
+        """
+        Get the metrics for an agent, creating them on first use.
+
+        Args:
+            agent_name: Name of the agent
+
+        Returns:
+            The agent's metrics
+        """
+        metrics = self.agents.get(agent_name)
+        if metrics is None:
+            metrics = self.agents[agent_name] = AgentMetrics(self.buckets)
+        return metrics
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the current metric values for every agent."""
+        return {name: metrics.snapshot() for name, metrics in self.agents.items()}
+
+    def to_prometheus(self, prefix: str = "agent") -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text, ending with a newline
+        """
+        lines: List[str] = []
+
+        lines.append(f"# HELP {prefix}_calls_total Agent calls started.")
+        lines.append(f"# TYPE {prefix}_calls_total counter")
+        for name, metrics in self.agents.items():
+            lines.append(f"{prefix}_calls_total{{agent=\"{_escape(name)}\"}} {metrics.calls}")
+
+        lines.append(f"# HELP {prefix}_call_outcomes_total Agent calls finished, by outcome.")
+        lines.append(f"# TYPE {prefix}_call_outcomes_total counter")
+        for name, metrics in self.agents.items():
+            for outcome, count in metrics.outcomes.items():
+                lines.append(
+                    f"{prefix}_call_outcomes_total"
+                    f"{{agent=\"{_escape(name)}\",outcome=\"{outcome}\"}} {count}"
+                )
+
+        lines.append(f"# HELP {prefix}_in_flight Agent calls currently running.")
+        lines.append(f"# TYPE {prefix}_in_flight gauge")
+        for name, metrics in self.agents.items():
+            lines.append(f"{prefix}_in_flight{{agent=\"{_escape(name)}\"}} {metrics.in_flight}")
+
+        lines.append(f"# HELP {prefix}_latency_seconds Agent call latency.")
+        lines.append(f"# TYPE {prefix}_latency_seconds histogram")
+        for name, metrics in self.agents.items():
+            label = _escape(name)
+            histogram = metrics.latency
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(
+                    f"{prefix}_latency_seconds_bucket"
+                    f"{{agent=\"{label}\",le=\"{bound}\"}} {cumulative}"
+                )
+            lines.append(
+                f"{prefix}_latency_seconds_bucket"
+                f"{{agent=\"{label}\",le=\"+Inf\"}} {histogram.count}"
+            )
+            lines.append(f"{prefix}_latency_seconds_sum{{agent=\"{label}\"}} {histogram.total}")
+            lines.append(f"{prefix}_latency_seconds_count{{agent=\"{label}\"}} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
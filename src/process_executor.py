@@ -0,0 +1,200 @@
+"""
+Process Executor
+
+This module runs CPU-bound agents in a pool of worker processes so they
+do not starve the event loop shared by I/O-bound agents.
+"""
+
+import asyncio
+import importlib
+import json
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+
+from src.base_agent import BaseAgent
+
+# Agents and event loop owned by the current worker process
+_worker_agents: Dict[Tuple[str, str, str, str], BaseAgent] = {}
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class ProcessAgentError(RuntimeError):
+    """Raised when an agent fails inside a worker process."""
+
+    def __init__(self, agent_name: str, error_type: str, message: str):
+        """
+        Initialize the error.
+
+        Args:
+            agent_name: Name of the agent that failed
+            error_type: Class name of the exception raised in the worker
+            message: The exception message
+        """
+        super().__init__(f"Agent {agent_name} failed in worker: {error_type}: {message}")
+        self.agent_name = agent_name
+        self.error_type = error_type
+
+
+def _write_shared(payload: bytes) -> Tuple[str, int]:
+    """Copy bytes into a new shared memory block and return its name and size."""
+    block = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+    try:
+        block.buf[:len(payload)] = payload
+        return block.name, len(payload)
+    finally:
+        block.close()
+
+
+def _read_shared(name: str, size: int, unlink: bool) -> bytes:
+    """Copy bytes out of a shared memory block, optionally releasing it."""
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(block.buf[:size])
+    finally:
+        block.close()
+        if unlink:
+            block.unlink()
+
+
+def _unlink_shared(name: str):
+    """Release a shared memory block if it still exists."""
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def _run_in_worker(
+    module: str,
+    qualname: str,
+    agent_name: str,
+    config_json: str,
+    input_name: str,
+    input_size: int,
+    method: str = "process"
+) -> Tuple[str, int]:
+    """
+    Run one agent call inside a worker process.
+
+    The agent is built once per worker and reused. Only shared memory block
+    names cross the process boundary; the input and the outcome travel as
+    JSON through the blocks themselves.
+
+    Returns:
+        Name and size of the shared memory block holding the outcome
+    """
+    global _worker_loop
+
+    key = (module, qualname, agent_name, config_json)
+    agent = _worker_agents.get(key)
+    if agent is None:
+        agent_class = getattr(importlib.import_module(module), qualname)
+        agent = agent_class(agent_name, json.loads(config_json))
+        agent.start()
+        _worker_agents[key] = agent
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+
+    try:
+        input_data = json.loads(_read_shared(input_name, input_size, unlink=False))
+        result = _worker_loop.run_until_complete(getattr(agent, method)(input_data))
+        outcome = {"ok": True, "result": result}
+    except Exception as e:
+        outcome = {"ok": False, "error_type": type(e).__name__, "message": str(e)}
+
+    return _write_shared(json.dumps(outcome, default=str).encode("utf-8"))
+
+
+class ProcessAgentExecutor:
+    """
+    Runs agent.process and agent.process_batch calls in a pool of worker
+    processes.
+
+    Inputs and results must be JSON-serializable. They are exchanged
+    through shared memory blocks rather than pickled through the pool.
+    Each worker builds its own copy of the agent from its class and
+    config, so state such as history lives in the worker, not in the
+    agent registered with the manager. A call that times out keeps running
+    in its worker; its result is discarded.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, mp_context: Any = None):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count)
+            mp_context: Optional multiprocessing context for the pool
+        """
+        self.max_workers = max_workers
+        self._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    async def run(
+        self,
+        agent: BaseAgent,
+        input_data: Any,
+        method: str = "process"
+    ) -> Any:
+        """
+        Process data with an agent in a worker process.
+
+        Args:
+            agent: The agent whose class and config are used in the worker
+            input_data: JSON-serializable data to process
+            method: Agent coroutine method to call, "process" or
+                "process_batch"
+
+        Returns:
+            The agent's result
+
+        Raises:
+            ProcessAgentError: If the agent raised in the worker
+        """
+        agent_class = type(agent)
+        input_name, input_size = _write_shared(
+            json.dumps(input_data).encode("utf-8")
+        )
+
+        job = self._pool.submit(
+            _run_in_worker,
+            agent_class.__module__,
+            agent_class.__qualname__,
+            agent.name,
+            json.dumps(agent.config, sort_keys=True, default=str),
+            input_name,
+            input_size,
+            method
+        )
+        try:
+            output_name, output_size = await asyncio.wrap_future(job)
+        except asyncio.CancelledError:
+            # The worker may still finish; release whatever it produces
+            job.add_done_callback(_discard_output)
+            raise
+        finally:
+            _unlink_shared(input_name)
+
+        outcome = json.loads(_read_shared(output_name, output_size, unlink=True))
+        if not outcome["ok"]:
+            raise ProcessAgentError(agent.name, outcome["error_type"], outcome["message"])
+        return outcome["result"]
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the worker processes.
+
+        Args:
+            wait: Block until running calls have finished
+        """
+        self._pool.shutdown(wait=wait)
+
+
+def _discard_output(job: Future):
+    """Release the output block of a call nobody is waiting for."""
+    if job.cancelled() or job.exception() is not None:
+        return
+    output_name, _ = job.result()
+    _unlink_shared(output_name)
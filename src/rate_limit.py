@@ -0,0 +1,263 @@
+"""
+Rate Limiting
+
+This module provides async token-bucket rate limiting keyed per agent and
+per upstream model, usable from AgentManager and from ADK agent callbacks.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def agent_key(agent_name: str) -> str:
+    """Return the rate limit key for an agent."""
+    return f"agent:{agent_name}"
+
+
+def model_key(model: str) -> str:
+    """Return the rate limit key for an upstream model."""
+    return f"model:{model}"
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Tokens refill continuously at rate per second up to capacity. Callers
+    that find the bucket empty wait in FIFO order until enough tokens have
+    accumulated, rather than failing and retrying.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size, defaults to max(rate, 1)
+            clock: Time source, overridable for tests
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity is not None and capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock: Optional[asyncio.Lock] = None
+        self.acquired = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens if they are available right now.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken
+        """
+        self._refill()
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        self.acquired += 1
+        return True
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, waiting until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        if tokens > self.capacity:
+            raise ValueError("cannot acquire more tokens than the bucket holds")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        started = self._clock()
+        # Time spent queued behind other waiters counts as a wait too
+        throttled = self._lock.locked()
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                throttled = True
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+        self.acquired += 1
+        waited = self._clock() - started if throttled else 0.0
+        if waited > 0:
+            self.waits += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the bucket's configuration and queue-wait figures."""
+        self._refill()
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "available": self._tokens,
+            "acquired": self.acquired,
+            "waits": self.waits,
+            "total_wait": self.total_wait,
+            "max_wait": self.max_wait
+        }
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Set of token buckets keyed by strings such as "agent:<name>" and
+    "model:<model>".
+
+    A call acquires every key that applies to it, so one limiter can cap
+    both each agent and the upstream models the agents share.
+    """
+
+    def __init__(self):
+        """Initialize an empty limiter; keys without a limit are not throttled."""
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.default_limits: Dict[str, Tuple[float, Optional[float]]] = {}
+
+    def set_limit(self, key: str, rate: float, burst: Optional[float] = None):
+        """
+        Limit a key to rate calls per second.
+
+        Args:
+            key: Key from agent_key or model_key (or any custom key)
+            rate: Calls per second
+            burst: Calls allowed back to back, defaults to max(rate, 1)
+        """
+        self.buckets[key] = TokenBucket(rate, burst)
+
+    def set_default_limit(
+        self,
+        kind: str,
+        rate: float,
+        burst: Optional[float] = None
+    ):
+        """
+        Limit every key of a kind that has no limit of its own.
+
+        Each key gets its own bucket on first use, so for example every
+        model is held to the same quota without being listed up front.
+
+        Args:
+            kind: Key prefix, "agent" or "model"
+            rate: Calls per second
+            burst: Calls allowed back to back, defaults to max(rate, 1)
+        """
+        # Build one bucket now so bad settings fail here, not on first use
+        TokenBucket(rate, burst)
+        self.default_limits[kind] = (rate, burst)
+
+    def remove_limit(self, key: str):
+        """
+        Stop limiting a key.
+
+        Args:
+            key: Key to stop limiting
+        """
+        self.buckets.pop(key, None)
+
+    async def acquire(self, *keys: Optional[str], cost: float = 1.0) -> float:
+        """
+        Wait until every limited key allows a call of the given cost.
+
+        A cost larger than a bucket's burst is taken in burst-sized
+        installments, so a batch is paced at the key's rate instead of
+        being refused.
+
+        Args:
+            *keys: Keys that apply to the call; None and unlimited keys
+                are ignored
+            cost: Tokens to take from each key, e.g. the size of a batch
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        for key in keys:
+            bucket = self._bucket(key) if key is not None else None
+            if bucket is None:
+                continue
+            remaining = cost
+            while remaining > 0:
+                tokens = min(remaining, bucket.capacity)
+                waited += await bucket.acquire(tokens)
+                remaining -= tokens
+        return waited
+
+    def keys_for(self, agent_name: str, model: Optional[str] = None) -> List[str]:
+        """
+        Return the keys that apply to a call.
+
+        Args:
+            agent_name: Name of the calling agent
+            model: Upstream model the call uses, if any
+
+        Returns:
+            List of rate limit keys
+        """
+        keys = [agent_key(agent_name)]
+        if model:
+            keys.append(model_key(model))
+        return keys
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-key bucket figures."""
+        return {key: bucket.stats() for key, bucket in self.buckets.items()}
+
+    def _bucket(self, key: str) -> Optional[TokenBucket]:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            default = self.default_limits.get(key.split(":", 1)[0])
+            if default is not None:
+                bucket = self.buckets[key] = TokenBucket(*default)
+        return bucket
+
+
+def model_rate_limit_callback(limiter: RateLimiter) -> Callable[..., Any]:
+    """
+    Build an ADK before_model_callback that throttles model calls.
+
+    Each model request waits for both the calling agent's key and the
+    requested model's key, including keys covered by set_default_limit.
+
+    Args:
+        limiter: The limiter to acquire from
+
+    Returns:
+        Async callback suitable for LlmAgent(before_model_callback=...)
+    """
+    async def before_model_callback(callback_context: Any, llm_request: Any) -> None:
+        await limiter.acquire(
+            *limiter.keys_for(callback_context.agent_name, llm_request.model)
+        )
+        return None
+
+    return before_model_callback
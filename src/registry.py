@@ -0,0 +1,85 @@
+"""
+Agent Class Registry
+
+This module maps the class names used in agent configuration files to
+agent classes, so managers can be built from config without hardcoding
+imports.
+"""
+
+import importlib
+from typing import Callable, Dict, Optional, Type
+
+from src.base_agent import BaseAgent
+
+_registry: Dict[str, Type[BaseAgent]] = {}
+
+# Modules whose agent classes register themselves on import; loaded the
+# first time a short name is not found
+_BUILTIN_MODULES = ("src.example_agent",)
+
+
+def register_agent_class(
+    agent_class: Optional[Type[BaseAgent]] = None,
+    name: Optional[str] = None
+) -> Callable[[Type[BaseAgent]], Type[BaseAgent]]:
+    """
+    Register an agent class under a short name.
+
+    Usable as a plain decorator, as a decorator with a name, or called
+    directly.
+
+    Args:
+        agent_class: The class to register
+        name: Name used in config files, defaults to the class name
+
+    Returns:
+        The class itself, or a decorator when agent_class is omitted
+    """
+    def register(cls: Type[BaseAgent]) -> Type[BaseAgent]:
+        if not (isinstance(cls, type) and issubclass(cls, BaseAgent)):
+            raise TypeError(f"{cls!r} is not a BaseAgent subclass")
+        _registry[name or cls.__name__] = cls
+        return cls
+
+    if agent_class is None:
+        return register
+    return register(agent_class)
+
+
+def resolve_agent_class(class_name: str) -> Type[BaseAgent]:
+    """
+    Look up an agent class by registered name or dotted import path.
+
+    Args:
+        class_name: A registered name such as "ExampleAgent", or a path
+            such as "mypackage.agents.SearchAgent"
+
+    Returns:
+        The agent class
+
+    Raises:
+        KeyError: If the name is not registered and cannot be imported
+    """
+    agent_class = _registry.get(class_name)
+    if agent_class is not None:
+        return agent_class
+
+    if "." not in class_name:
+        for module in _BUILTIN_MODULES:
+            importlib.import_module(module)
+        agent_class = _registry.get(class_name)
+        if agent_class is None:
+            raise KeyError(f"Agent class {class_name} is not registered")
+        return agent_class
+
+    module_name, _, attribute = class_name.rpartition(".")
+    try:
+        agent_class = getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as e:
+        raise KeyError(f"Agent class {class_name} cannot be imported: {e}") from e
+    return register_agent_class(agent_class, class_name)
+
+
+def registered_agent_classes() -> Dict[str, Type[BaseAgent]]:
+    """Return a copy of the registry."""
+    return dict(_registry)
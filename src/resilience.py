@@ -0,0 +1,213 @@
+"""
+Resilience Policies
+
+This module provides retry with jittered exponential backoff and a
+per-agent circuit breaker for agent calls.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Callable, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def default_retryable(exc: BaseException) -> bool:
+    """Retry timeouts and connection problems, which are usually transient."""
+    return isinstance(exc, (asyncio.TimeoutError, ConnectionError))
+
+
+class RetryPolicy:
+    """
+    Retry policy with capped exponential backoff and full jitter.
+
+    The delay before retry n is a random value between 0 and
+    min(max_delay, base_delay * multiplier ** (n - 1)), which spreads out
+    retries from many callers instead of synchronizing them.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 5.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        retryable: Callable[[BaseException], bool] = default_retryable,
+        rng: Callable[[], float] = random.random
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts: Total attempts including the first call
+            base_delay: Backoff cap before the first retry, in seconds
+            max_delay: Upper bound on any single backoff, in seconds
+            multiplier: Growth factor of the backoff cap per attempt
+            jitter: Randomize delays between 0 and the cap
+            retryable: Predicate deciding which exceptions are retried
+            rng: Random source returning values in [0, 1)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retryable = retryable
+        self._rng = rng
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        """
+        Decide whether a failed attempt should be retried.
+
+        Args:
+            exc: The exception raised by the attempt
+            attempt: Number of the attempt that failed, starting at 1
+
+        Returns:
+            True if another attempt should be made
+        """
+        return attempt < self.max_attempts and self.retryable(exc)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Return the delay before retrying a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed, starting at 1
+
+        Returns:
+            Delay in seconds
+        """
+        cap = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return self._rng() * cap if self.jitter else cap
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an agent whose circuit breaker is open."""
+
+    def __init__(self, agent_name: str, retry_after: float):
+        """
+        Initialize the error.
+
+        Args:
+            agent_name: Name of the agent that is failing fast
+            retry_after: Seconds until a trial call will be allowed
+        """
+        super().__init__(
+            f"Circuit open for agent {agent_name}, retry after {retry_after:.2f}s"
+        )
+        self.agent_name = agent_name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one agent.
+
+    After failure_threshold consecutive failures the circuit opens and
+    calls fail fast. Once recovery_timeout has passed, up to
+    half_open_max_calls trial calls are let through: a success closes the
+    circuit, a failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open
+            half_open_max_calls: Concurrent trial calls while half open
+            clock: Time source, overridable for tests
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self.rejected_calls = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half open once the timeout passes."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._trial_calls = 0
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may proceed, reserving a trial slot if half open.
+
+        Returns:
+            True if the call may be made
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+            self._trial_calls += 1
+            return True
+
+        self.rejected_calls += 1
+        return False
+
+    def retry_after(self) -> float:
+        """Return seconds until the circuit will admit a trial call."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (self._clock() - self._opened_at))
+
+    def record_success(self):
+        """Record a successful call, closing the circuit."""
+        self.consecutive_failures = 0
+        self._trial_calls = 0
+        self._state = CLOSED
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit if needed."""
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def release(self):
+        """Give back a trial slot for a call that ended without an outcome."""
+        if self._trial_calls > 0:
+            self._trial_calls -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the breaker's state and counters."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected_calls": self.rejected_calls,
+            "retry_after": self.retry_after()
+        }
+
+    def _open(self):
+        if self._state != OPEN:
+            self.times_opened += 1
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._trial_calls = 0
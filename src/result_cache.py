@@ -0,0 +1,174 @@
+"""
+Result Cache
+
+This module provides memoization of agent results keyed on the agent,
+its configuration and the normalized input.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.base_agent import BaseAgent
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Return a stable digest of a JSON-like value.
+
+    Args:
+        value: Value to fingerprint (dict keys are sorted)
+
+    Returns:
+        Hex digest that changes whenever the value changes
+    """
+    encoded = json.dumps(value, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def normalize_input(input_data: Any) -> str:
+    """
+    Return a canonical string form of an agent input.
+
+    Args:
+        input_data: Data passed to agent.process
+
+    Returns:
+        String that is equal for equal inputs, independent of dict order
+    """
+    return json.dumps(input_data, sort_keys=True, default=repr)
+
+
+def make_cache_key(agent: BaseAgent, input_data: Any) -> Tuple[str, str, str]:
+    """
+    Build the cache key for an agent call.
+
+    Args:
+        agent: The agent that will process the input
+        input_data: Data to process
+
+    Returns:
+        (agent name, config fingerprint, normalized input) tuple
+    """
+    return (agent.name, fingerprint(agent.config), normalize_input(input_data))
+
+
+class ResultCache:
+    """
+    LRU cache of agent results with optional time-to-live.
+
+    Keys are the tuples built by make_cache_key. Hit, miss and eviction
+    counters are kept per agent. Any object providing lookup, store,
+    invalidate and stats with the same signatures can be used in its place.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept
+            ttl: Seconds a result stays valid, or None to keep until evicted
+            clock: Time source, overridable for tests
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        # key -> (expiry time or None, result), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def lookup(self, key: Tuple[str, ...]) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Key built by make_cache_key
+
+        Returns:
+            (True, result) on a hit, (False, None) on a miss
+        """
+        stats = self._stats_for(key[0])
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > self._clock():
+                self._entries.move_to_end(key)
+                stats["hits"] += 1
+                return True, value
+
+            del self._entries[key]
+            stats["expired"] += 1
+
+        stats["misses"] += 1
+        return False, None
+
+    def store(self, key: Tuple[str, ...], value: Any):
+        """
+        Cache a result, evicting the least recently used one if full.
+
+        Args:
+            key: Key built by make_cache_key
+            value: Result to cache
+        """
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._stats_for(evicted[0])["evictions"] += 1
+
+    def invalidate(self, agent_name: Optional[str] = None):
+        """
+        Drop cached results.
+
+        Args:
+            agent_name: Only drop this agent's results, or None for all
+        """
+        if agent_name is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] == agent_name]:
+            del self._entries[key]
+
+    def stats(self, agent_name: Optional[str] = None) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Args:
+            agent_name: Counters for one agent, or None for totals
+
+        Returns:
+            Dictionary with hits, misses, expired, evictions and size
+        """
+        if agent_name is not None:
+            counters = dict(self._stats_for(agent_name))
+            counters["size"] = sum(1 for key in self._entries if key[0] == agent_name)
+            return counters
+
+        totals = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+        for counters in self._stats.values():
+            for name, count in counters.items():
+                totals[name] += count
+        totals["size"] = len(self._entries)
+        return totals
+
+    def _stats_for(self, agent_name: str) -> Dict[str, int]:
+        if agent_name not in self._stats:
+            self._stats[agent_name] = {
+                "hits": 0, "misses": 0, "expired": 0, "evictions": 0
+            }
+        return self._stats[agent_name]
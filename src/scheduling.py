@@ -0,0 +1,242 @@
+"""
+Task Scheduling
+
+This module provides the priority-aware, weighted-fair task queue used by
+AgentManager's worker pool.
+"""
+
+import asyncio
+import collections
+import heapq
+import itertools
+from enum import IntEnum
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+class Priority(IntEnum):
+    """Priority classes, served strictly in order (lower value first)."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+class FairQueue:
+    """
+    Task queue with priority classes and weighted fair queuing.
+
+    Items in a higher priority class are always dequeued before items in
+    a lower one. Within a class, items are tagged with a virtual finish
+    time per flow (an agent or tenant), so flows share the workers in
+    proportion to their weights and one flow's backlog cannot starve the
+    others. The interface mirrors asyncio.Queue.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of queued items, or 0 for no limit
+        """
+        self.maxsize = maxsize
+        self._heap: List[Tuple[int, float, int, Hashable, Any]] = []
+        self._seq = itertools.count()
+        self._virtual_time: Dict[int, float] = {}
+        self._last_finish: Dict[Tuple[int, Hashable], float] = {}
+        self._weights: Dict[Hashable, float] = {}
+        self._getters: collections.deque = collections.deque()
+        self._putters: collections.deque = collections.deque()
+        self._unfinished_tasks = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def set_weight(self, flow: Hashable, weight: float):
+        """
+        Set a flow's share of the workers relative to other flows.
+
+        Args:
+            flow: Flow identifier (agent or tenant name)
+            weight: Positive weight, 1.0 by default
+        """
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._weights[flow] = weight
+
+    def qsize(self) -> int:
+        """Return the number of queued items."""
+        return len(self._heap)
+
+    def empty(self) -> bool:
+        """Return True if no items are queued."""
+        return not self._heap
+
+    def full(self) -> bool:
+        """Return True if the queue has reached maxsize."""
+        return self.maxsize > 0 and len(self._heap) >= self.maxsize
+
+    def put_nowait(
+        self,
+        item: Any,
+        priority: int = Priority.NORMAL,
+        flow: Hashable = None,
+        cost: float = 1.0
+    ):
+        """
+        Queue an item without waiting.
+
+        Args:
+            item: The item to queue
+            priority: Priority class of the item
+            flow: Flow the item is accounted to
+            cost: Relative cost of the item within its flow
+
+        Raises:
+            asyncio.QueueFull: If the queue is full
+        """
+        if self.full():
+            raise asyncio.QueueFull
+
+        priority = int(priority)
+        start = max(
+            self._virtual_time.get(priority, 0.0),
+            self._last_finish.get((priority, flow), 0.0)
+        )
+        finish = start + cost / self._weights.get(flow, 1.0)
+        self._last_finish[(priority, flow)] = finish
+
+        heapq.heappush(self._heap, (priority, finish, next(self._seq), flow, item))
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    async def put(
+        self,
+        item: Any,
+        priority: int = Priority.NORMAL,
+        flow: Hashable = None,
+        cost: float = 1.0
+    ):
+        """
+        Queue an item, waiting for a free slot if the queue is full.
+
+        Args:
+            item: The item to queue
+            priority: Priority class of the item
+            flow: Flow the item is accounted to
+            cost: Relative cost of the item within its flow
+        """
+        while self.full():
+            putter = asyncio.get_event_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                try:
+                    self._putters.remove(putter)
+                except ValueError:
+                    pass
+                if not self.full() and not putter.cancelled():
+                    self._wakeup_next(self._putters)
+                raise
+        self.put_nowait(item, priority, flow, cost)
+
+    def pop_oldest(self, min_priority: int = Priority.INTERACTIVE) -> Any:
+        """
+        Remove the oldest item of the least important queued class.
+
+        Used to shed load. The removed item counts as processed, so callers
+        must not call task_done for it.
+
+        Args:
+            min_priority: Only shed from classes at or below this importance
+                (numerically greater or equal)
+
+        Returns:
+            The removed item, or None if no eligible item is queued
+        """
+        if not self._heap:
+            return None
+
+        lowest = max(entry[0] for entry in self._heap)
+        if lowest < int(min_priority):
+            return None
+
+        oldest = min(
+            (i for i, entry in enumerate(self._heap) if entry[0] == lowest),
+            key=lambda i: self._heap[i][2]
+        )
+        item = self._heap[oldest][4]
+        self._heap[oldest] = self._heap[-1]
+        self._heap.pop()
+        heapq.heapify(self._heap)
+
+        self.task_done()
+        self._wakeup_next(self._putters)
+        return item
+
+    def get_nowait(self) -> Any:
+        """
+        Remove and return the next item without waiting.
+
+        Raises:
+            asyncio.QueueEmpty: If no items are queued
+        """
+        if not self._heap:
+            raise asyncio.QueueEmpty
+
+        priority, finish, _, _, item = heapq.heappop(self._heap)
+        self._virtual_time[priority] = finish
+        if not self._heap:
+            # Every flow has been served up to the virtual clock, so the
+            # per-flow finish tags carry no more information
+            self._last_finish.clear()
+            self._virtual_time.clear()
+
+        self._wakeup_next(self._putters)
+        return item
+
+    async def get(self) -> Any:
+        """Remove and return the next item, waiting until one is queued."""
+        while not self._heap:
+            getter = asyncio.get_event_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if self._heap and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    def task_done(self):
+        """
+        Mark a previously dequeued item as processed.
+
+        Raises:
+            ValueError: If called more times than items were queued
+        """
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0:
+            self._finished.set()
+
+    async def join(self):
+        """Wait until every queued item has been processed."""
+        if self._unfinished_tasks > 0:
+            await self._finished.wait()
+
+    def _wakeup_next(self, waiters: collections.deque):
+        """Wake the first waiter that is still waiting."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
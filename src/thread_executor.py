@@ -0,0 +1,167 @@
+"""
+Thread Executor
+
+This module provides the bounded thread pool used to keep blocking agent
+code (synchronous file I/O, synchronous SDK clients) off the event loop.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+def call_in_new_loop(async_func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a coroutine function to completion on a fresh event loop.
+
+    Used to run an agent's process coroutine inside a pool thread.
+
+    Args:
+        async_func: Coroutine function to call
+        *args: Arguments passed to it
+
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run(async_func(*args))
+
+
+class ThreadPoolDispatcher:
+    """
+    Bounded thread pool with saturation metrics.
+
+    Tracks how many calls are queued, running and completed and how long
+    calls wait for a free thread, so pool saturation is visible before it
+    turns into loop latency.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_workers: Maximum number of threads
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Set while the current thread is running a call for this pool
+        self._local = threading.local()
+        self.submitted = 0
+        self.active = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.peak_active = 0
+        self.total_wait = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking callable in the pool.
+
+        A call made from one of the pool's own threads (a blocking agent
+        awaiting one of its @blocking methods) runs inline on that thread,
+        since waiting for another worker could deadlock a full pool.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The callable's result
+        """
+        if getattr(self._local, "running", False):
+            return func(*args, **kwargs)
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="agent-blocking"
+            )
+
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self.submitted += 1
+
+        def call():
+            with self._lock:
+                self.active += 1
+                self.peak_active = max(self.peak_active, self.active)
+                self.total_wait += time.perf_counter() - submitted_at
+            self._local.running = True
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.running = False
+                with self._lock:
+                    self.active -= 1
+                    self.completed += 1
+
+        future = self._pool.submit(call)
+        future.add_done_callback(self._count_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _count_cancelled(self, future: Future):
+        """Account for a call cancelled while still waiting for a thread."""
+        if future.cancelled():
+            with self._lock:
+                self.cancelled += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool usage.
+
+        Returns:
+            Dictionary with worker, queue and saturation figures
+        """
+        with self._lock:
+            started = self.active + self.completed
+            return {
+                "max_workers": self.max_workers,
+                "active": self.active,
+                "queued": self.submitted - started - self.cancelled,
+                "completed": self.completed,
+                "cancelled": self.cancelled,
+                "peak_active": self.peak_active,
+                "saturation": self.active / self.max_workers,
+                "average_wait": self.total_wait / started if started else 0.0
+            }
+
+    def to_prometheus(self, prefix: str = "agent_thread_pool") -> str:
+        """
+        Render pool usage in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text, ending with a newline
+        """
+        stats = self.stats()
+        lines: List[str] = []
+        for name, kind in (
+            ("max_workers", "gauge"),
+            ("active", "gauge"),
+            ("queued", "gauge"),
+            ("saturation", "gauge"),
+        ):
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.append(f"{prefix}_{name} {stats[name]}")
+        lines.append(f"# TYPE {prefix}_completed_total counter")
+        lines.append(f"{prefix}_completed_total {stats['completed']}")
+        return "\n".join(lines) + "\n"
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the pool threads. A later run call starts a new pool.
+
+        Args:
+            wait: Block until running calls have finished
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
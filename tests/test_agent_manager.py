@@ -0,0 +1,661 @@
+"""
+Test cases for the AgentManager class.
+"""
+
+import pytest
+import asyncio
+import threading
+import time
+import sys
+import os
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.base_agent import BaseAgent, blocking
+from src.example_agent import ExampleAgent
+from src.agent_manager import (
+    AgentManager, AgentTimeoutError, TaskCancelledError, TaskRejectedError
+)
+from src.scheduling import Priority
+from src.process_executor import ProcessAgentError
+
+
+class CountingAgent(BaseAgent):
+    """Test agent that tracks how many calls run concurrently."""
+
+    def __init__(self, name, delay=0.01, config=None):
+        super().__init__(name, config)
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def process(self, input_data):
+        """Sleep for the configured delay and echo the input."""
+        self.calls += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if input_data == "boom":
+            raise ValueError("boom")
+        return f"{self.name}: {input_data}"
+
+
+class FailingAgent(BaseAgent):
+    """Test agent that always raises."""
+
+    async def process(self, input_data):
+        """Raise a ValueError mentioning the input."""
+        raise ValueError(f"cannot process {input_data}")
+
+
+class SleepyAgent(BaseAgent):
+    """Test agent whose process blocks its thread."""
+
+    runs_blocking = True
+
+    async def process(self, input_data):
+        """Block with time.sleep and report the thread used."""
+        time.sleep(0.05)
+        return threading.current_thread().name
+
+
+class NestedBlockingAgent(BaseAgent):
+    """Test agent whose offloaded process awaits a @blocking method."""
+
+    runs_blocking = True
+
+    @blocking
+    def read(self, input_data):
+        """Block briefly and report the thread used."""
+        time.sleep(0.01)
+        return threading.current_thread().name
+
+    async def process(self, input_data):
+        """Delegate to the blocking method."""
+        return await self.read(input_data)
+
+
+def make_manager(*agents, **kwargs):
+    """Create a manager with the given agents registered and started."""
+    manager = AgentManager("TestManager", **kwargs)
+    for agent in agents:
+        manager.register_agent(agent)
+    manager.start_all_agents()
+    return manager
+
+
+class TestWorkerPool:
+    """Test cases for the queued worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_submit_and_get_result(self):
+        """Test that submitted tasks are processed by workers."""
+        manager = make_manager(CountingAgent("A"))
+        await manager.start()
+
+        task_id = await manager.submit("A", "hello")
+        assert await manager.get_result(task_id) == "A: hello"
+        assert task_id not in manager.results
+
+        await manager.stop()
+        assert manager.is_running == False
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrent_tasks run at once."""
+        agent = CountingAgent("A")
+        manager = make_manager(agent, max_concurrent_tasks=3)
+        await manager.start()
+
+        results = await asyncio.gather(
+            *(manager.run_task("A", i) for i in range(20))
+        )
+
+        assert results == [f"A: {i}" for i in range(20)]
+        assert agent.peak == 3
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_task_errors_are_propagated(self):
+        """Test that agent exceptions surface from get_result."""
+        manager = make_manager(CountingAgent("A"))
+        await manager.start()
+
+        task_id = await manager.submit("A", "boom")
+        with pytest.raises(ValueError):
+            await manager.get_result(task_id)
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_submit_unknown_agent(self):
+        """Test that submitting to an unknown agent fails immediately."""
+        manager = make_manager()
+
+        with pytest.raises(KeyError):
+            await manager.submit("missing", "data")
+
+    @pytest.mark.asyncio
+    async def test_stop_without_drain_cancels_queued_tasks(self):
+        """Test that stopping without draining cancels pending work."""
+        manager = make_manager(CountingAgent("A", delay=1), max_concurrent_tasks=1)
+        await manager.start()
+
+        task_ids = [await manager.submit("A", i) for i in range(3)]
+        await asyncio.sleep(0)
+        await manager.stop(drain=False)
+
+        for task_id in task_ids:
+            with pytest.raises(TaskCancelledError):
+                await manager.get_result(task_id)
+        assert manager.task_queue.empty()
+        assert manager.results == {}
+
+    @pytest.mark.asyncio
+    async def test_uncollected_results_expire(self):
+        """Test that fire-and-forget results do not accumulate."""
+        manager = make_manager(CountingAgent("A", delay=0), result_ttl=0.05)
+        await manager.start()
+
+        kept = await manager.submit("A", "kept")
+        for i in range(5):
+            await manager.submit("A", i)
+        assert await manager.get_result(kept) == "A: kept"
+        await asyncio.sleep(0.1)
+        await manager.stop()
+
+        assert manager.results == {}
+        assert manager.get_manager_status()["expired_results"] == 5
+
+
+class TestTimeouts:
+    """Test cases for deadline enforcement."""
+
+    @pytest.mark.asyncio
+    async def test_process_with_agent_timeout(self):
+        """Test that a slow agent is cancelled and raises a typed error."""
+        agent = CountingAgent("Slow", delay=1)
+        manager = make_manager(agent)
+
+        with pytest.raises(AgentTimeoutError) as exc_info:
+            await manager.process_with_agent("Slow", "data", timeout=0.01)
+
+        assert exc_info.value.agent_name == "Slow"
+        assert exc_info.value.timeout == 0.01
+        assert agent.running == 0
+
+    def test_timeout_precedence(self):
+        """Test that call, agent and manager deadlines apply in order."""
+        manager = make_manager(task_timeout=30)
+        agent = CountingAgent("A", config={"timeout": 5})
+
+        assert manager._resolve_timeout(agent, 1) == 1
+        assert manager._resolve_timeout(agent, None) == 5
+        assert manager._resolve_timeout(CountingAgent("B"), None) == 30
+
+    @pytest.mark.asyncio
+    async def test_broadcast_is_not_held_by_slow_agent(self):
+        """Test that one stuck agent only times out its own result."""
+        manager = make_manager(
+            CountingAgent("Fast"),
+            CountingAgent("Stuck", delay=10, config={"timeout": 0.05}),
+        )
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        results = await manager.process_with_all_agents("data")
+
+        assert loop.time() - started < 1
+        assert results["Fast"] == "Fast: data"
+        assert isinstance(results["Stuck"], AgentTimeoutError)
+
+
+class TestStreaming:
+    """Test cases for as-completed broadcast results."""
+
+    @pytest.mark.asyncio
+    async def test_results_arrive_in_completion_order(self):
+        """Test that faster agents are yielded first."""
+        manager = make_manager(
+            CountingAgent("Slow", delay=0.1),
+            CountingAgent("Fast", delay=0.01),
+        )
+
+        pairs = [pair async for pair in manager.stream_with_all_agents("x")]
+
+        assert pairs == [("Fast", "Fast: x"), ("Slow", "Slow: x")]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_yielded(self):
+        """Test that a failing agent yields its exception."""
+        manager = make_manager(CountingAgent("A"))
+
+        pairs = [pair async for pair in manager.stream_with_all_agents("boom")]
+
+        assert pairs[0][0] == "A"
+        assert isinstance(pairs[0][1], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_pending_agents(self):
+        """Test that abandoning the stream cancels slower agents."""
+        slow = CountingAgent("Slow", delay=10)
+        manager = make_manager(CountingAgent("Fast"), slow)
+
+        stream = manager.stream_with_all_agents("x")
+        assert await stream.__anext__() == ("Fast", "Fast: x")
+        await stream.aclose()
+        await asyncio.sleep(0)
+
+        assert slow.running == 0
+
+
+class TestBatches:
+    """Test cases for batch dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_process_batch_with_agent(self):
+        """Test that a batch pays the processing delay once."""
+        agent = ExampleAgent("Batcher", {"processing_delay": 0.05, "prefix": "> "})
+        manager = make_manager(agent)
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        results = await manager.process_batch_with_agent("Batcher", range(20))
+
+        assert loop.time() - started < 0.5
+        assert results == [f"> {i}" for i in range(20)]
+        assert len(agent.history) == 20
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Test that an empty batch returns without calling the agent."""
+        manager = make_manager(CountingAgent("A"))
+
+        assert await manager.process_batch_with_agent("A", []) == []
+
+    @pytest.mark.asyncio
+    async def test_batch_timeout(self):
+        """Test that the deadline covers the whole batch."""
+        manager = make_manager(CountingAgent("Slow", delay=1))
+
+        with pytest.raises(AgentTimeoutError):
+            await manager.process_batch_with_agent("Slow", [1, 2], timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_blocking_batch_runs_off_loop(self):
+        """Test that a blocking agent's batch runs on the thread pool."""
+        manager = make_manager(SleepyAgent("Sleepy"))
+
+        try:
+            threads = await manager.process_batch_with_agent("Sleepy", range(3))
+        finally:
+            manager.shutdown_executors()
+
+        assert len(threads) == 3
+        assert all(name.startswith("agent-blocking") for name in threads)
+        assert manager.thread_dispatcher.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_mode_batch_runs_in_worker(self):
+        """Test that a process-mode agent's batch runs in a worker process."""
+        agent = ExampleAgent("Cpu", {"executor": "process", "processing_delay": 0})
+        manager = make_manager(agent, max_process_workers=1)
+
+        try:
+            results = await manager.process_batch_with_agent("Cpu", [1, 2])
+        finally:
+            manager.shutdown_executors()
+
+        assert results == ["Processed: 1", "Processed: 2"]
+        assert len(agent.history) == 0
+
+
+class TestCoalescing:
+    """Test cases for single-flight request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_share_one_invocation(self):
+        """Test that a burst of identical calls runs the agent once."""
+        agent = CountingAgent("A", delay=0.05)
+        manager = make_manager(agent, coalesce_requests=True)
+
+        results = await asyncio.gather(
+            *(manager.process_with_agent("A", "same") for _ in range(10))
+        )
+
+        assert results == ["A: same"] * 10
+        assert agent.calls == 1
+        assert manager._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_inputs_are_not_coalesced(self):
+        """Test that only identical inputs share a call."""
+        agent = CountingAgent("A")
+        manager = make_manager(agent, coalesce_requests=True)
+
+        await asyncio.gather(
+            manager.process_with_agent("A", "one"),
+            manager.process_with_agent("A", "two"),
+        )
+
+        assert agent.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self):
+        """Test that a shared failure is raised to all callers."""
+        agent = CountingAgent("A")
+        manager = make_manager(agent, coalesce_requests=True)
+
+        results = await asyncio.gather(
+            *(manager.process_with_agent("A", "boom") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert agent.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self):
+        """Test that one caller giving up leaves the shared call running."""
+        agent = CountingAgent("A", delay=0.05)
+        manager = make_manager(agent, coalesce_requests=True)
+
+        impatient = asyncio.ensure_future(manager.process_with_agent("A", "x"))
+        patient = asyncio.ensure_future(manager.process_with_agent("A", "x"))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+
+        assert await patient == "A: x"
+        assert agent.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_short_deadline_does_not_join_untimed_call(self):
+        """Test that a timed caller keeps its deadline next to an untimed call."""
+        agent = CountingAgent("A", delay=0.3)
+        manager = make_manager(agent, coalesce_requests=True)
+
+        untimed = asyncio.ensure_future(manager.process_with_agent("A", "x"))
+        await asyncio.sleep(0.01)
+        started = time.monotonic()
+        with pytest.raises(AgentTimeoutError):
+            await manager.process_with_agent("A", "x", timeout=0.1)
+
+        assert time.monotonic() - started < 0.25
+        assert await untimed == "A: x"
+
+    @pytest.mark.asyncio
+    async def test_untimed_caller_does_not_inherit_short_deadline(self):
+        """Test that an untimed caller is not failed by a timed call's deadline."""
+        agent = CountingAgent("A", delay=0.3)
+        manager = make_manager(agent, coalesce_requests=True)
+
+        timed = asyncio.ensure_future(
+            manager.process_with_agent("A", "x", timeout=0.1)
+        )
+        await asyncio.sleep(0.01)
+        untimed = await manager.process_with_agent("A", "x")
+
+        assert untimed == "A: x"
+        with pytest.raises(AgentTimeoutError):
+            await timed
+
+
+class TestMetrics:
+    """Test cases for call instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_calls_are_recorded(self):
+        """Test that successes, errors and timeouts are counted."""
+        manager = make_manager(CountingAgent("A"))
+
+        await manager.process_with_agent("A", "ok")
+        with pytest.raises(ValueError):
+            await manager.process_with_agent("A", "boom")
+        with pytest.raises(AgentTimeoutError):
+            await manager.process_with_agent("A", "slow", timeout=0.001)
+
+        metrics = manager.get_manager_status()["metrics"]["A"]
+        assert metrics["calls"] == 3
+        assert metrics["errors"] == 1
+        assert metrics["timeouts"] == 1
+        assert metrics["in_flight"] == 0
+        assert metrics["latency"]["count"] == 3
+        assert 'agent_calls_total{agent="A"} 3' in manager.export_prometheus()
+
+
+class TestProcessExecutor:
+    """Test cases for agents running in worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_agent_runs_in_worker_process(self):
+        """Test that a process-mode agent returns results from a worker."""
+        agent = ExampleAgent("Cpu", {
+            "executor": "process",
+            "processing_delay": 0,
+            "prefix": "# "
+        })
+        manager = make_manager(agent, max_process_workers=2)
+
+        try:
+            results = await asyncio.gather(
+                *(manager.process_with_agent("Cpu", {"n": i}) for i in range(4))
+            )
+            broadcast = await manager.process_with_all_agents([1, 2])
+        finally:
+            manager.shutdown_executors()
+
+        assert results == [f"# {{'n': {i}}}" for i in range(4)]
+        assert broadcast == {"Cpu": "# [1, 2]"}
+        # History is kept by the worker's copy of the agent
+        assert len(agent.history) == 0
+
+    @pytest.mark.asyncio
+    async def test_worker_errors_are_raised(self):
+        """Test that an exception in the worker surfaces in the caller."""
+        manager = make_manager(FailingAgent("Bad", {"executor": "process"}))
+
+        try:
+            with pytest.raises(ProcessAgentError) as exc_info:
+                await manager.process_with_agent("Bad", "x")
+        finally:
+            manager.shutdown_executors()
+
+        assert exc_info.value.error_type == "ValueError"
+        assert "cannot process x" in str(exc_info.value)
+
+
+class TestThreadOffload:
+    """Test cases for blocking agents on the thread pool."""
+
+    @pytest.mark.asyncio
+    async def test_blocking_agent_runs_off_loop(self):
+        """Test that blocking agents run concurrently on pool threads."""
+        manager = make_manager(SleepyAgent("Sleepy"), max_blocking_workers=4)
+
+        try:
+            threads = await asyncio.gather(
+                *(manager.process_with_agent("Sleepy", i) for i in range(4))
+            )
+        finally:
+            manager.shutdown_executors()
+
+        assert all(name.startswith("agent-blocking") for name in threads)
+        pool = manager.get_manager_status()["thread_pool"]
+        assert pool["completed"] == 4
+        assert pool["active"] == 0
+        assert pool["peak_active"] == 4
+
+    @pytest.mark.asyncio
+    async def test_executor_config_selects_thread_pool(self):
+        """Test that "executor": "thread" offloads a regular agent."""
+        agent = ExampleAgent("A", {"executor": "thread", "processing_delay": 0})
+        manager = make_manager(agent)
+
+        try:
+            result = await manager.process_with_agent("A", "x")
+        finally:
+            manager.shutdown_executors()
+
+        assert result == "Processed: x"
+        assert manager.thread_dispatcher.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_nested_blocking_call_does_not_deadlock(self):
+        """Test that a pool thread's own blocking calls run inline."""
+        manager = make_manager(
+            NestedBlockingAgent("Nested"),
+            max_blocking_workers=1
+        )
+
+        try:
+            threads = await asyncio.gather(
+                *(manager.process_with_agent("Nested", i, timeout=2) for i in range(2))
+            )
+        finally:
+            manager.shutdown_executors()
+
+        assert all(name.startswith("agent-blocking") for name in threads)
+        assert manager.thread_dispatcher.stats()["completed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_saturation_is_reported(self):
+        """Test that queued calls show up when the pool is full."""
+        manager = make_manager(SleepyAgent("Sleepy"), max_blocking_workers=1)
+
+        calls = [
+            asyncio.ensure_future(manager.process_with_agent("Sleepy", i))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.02)
+        stats = manager.thread_dispatcher.stats()
+        await asyncio.gather(*calls)
+        manager.shutdown_executors()
+
+        assert stats["active"] == 1
+        assert stats["queued"] == 2
+        assert stats["saturation"] == 1.0
+        assert "agent_thread_pool_saturation" in manager.export_prometheus()
+
+    @pytest.mark.asyncio
+    async def test_calls_cancelled_while_queued_leave_the_queue(self):
+        """Test that timed-out calls that never started are not counted as queued."""
+        manager = make_manager(SleepyAgent("Sleepy"), max_blocking_workers=1)
+
+        results = await asyncio.gather(
+            *(manager.process_with_agent("Sleepy", i, timeout=0.02) for i in range(3)),
+            return_exceptions=True
+        )
+        await asyncio.sleep(0.1)
+        stats = manager.thread_dispatcher.stats()
+        manager.shutdown_executors()
+
+        assert all(isinstance(result, AgentTimeoutError) for result in results)
+        assert stats["queued"] == 0
+        assert stats["cancelled"] == 2
+        assert stats["completed"] == 1
+
+
+class TestBackpressure:
+    """Test cases for queue limits and overflow policies."""
+
+    @pytest.mark.asyncio
+    async def test_reject_policy(self):
+        """Test that a full queue refuses new tasks."""
+        manager = make_manager(
+            CountingAgent("A"), max_queue_size=2, overflow_policy="reject"
+        )
+        await manager.submit("A", 1)
+        await manager.submit("A", 2)
+
+        assert manager.is_overloaded
+        with pytest.raises(TaskRejectedError) as exc_info:
+            await manager.submit("A", 3)
+        assert exc_info.value.reason == "rejected"
+        assert manager.get_load()["rejected_tasks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shed_oldest_policy(self):
+        """Test that the oldest least important task is dropped."""
+        manager = make_manager(
+            CountingAgent("A"), max_queue_size=2, overflow_policy="shed_oldest"
+        )
+        oldest = await manager.submit("A", "old", priority=Priority.BULK)
+        kept = await manager.submit("A", "urgent", priority=Priority.INTERACTIVE)
+        newest = await manager.submit("A", "new", priority=Priority.BULK)
+
+        with pytest.raises(TaskRejectedError) as exc_info:
+            await manager.get_result(oldest)
+        assert exc_info.value.reason == "shed"
+
+        await manager.start()
+        assert await manager.get_result(kept) == "A: urgent"
+        assert await manager.get_result(newest) == "A: new"
+        await manager.stop()
+        assert manager.get_load()["shed_tasks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shedding_never_drops_more_important_work(self):
+        """Test that bulk work cannot displace interactive work."""
+        manager = make_manager(
+            CountingAgent("A"), max_queue_size=1, overflow_policy="shed_oldest"
+        )
+        await manager.submit("A", "urgent", priority=Priority.INTERACTIVE)
+
+        with pytest.raises(TaskRejectedError):
+            await manager.submit("A", "bulk", priority=Priority.BULK)
+
+    @pytest.mark.asyncio
+    async def test_block_policy_waits_for_space(self):
+        """Test that the default policy waits for a free slot."""
+        manager = make_manager(CountingAgent("A"), max_queue_size=1)
+        await manager.submit("A", 1)
+
+        blocked = asyncio.ensure_future(manager.submit("A", 2))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        await manager.start()
+        task_id = await blocked
+        assert await manager.get_result(task_id) == "A: 2"
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_blocked_submit_leaves_no_result(self):
+        """Test that giving up on a blocked submit does not leak its future."""
+        manager = make_manager(CountingAgent("A"), max_queue_size=1)
+        await manager.submit("A", 1)
+
+        blocked = asyncio.ensure_future(manager.submit("A", 2))
+        await asyncio.sleep(0.01)
+        blocked.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await blocked
+
+        assert manager.get_manager_status()["pending_results"] == 1
+
+    @pytest.mark.asyncio
+    async def test_load_signal(self):
+        """Test the load factor reported to callers."""
+        manager = make_manager(CountingAgent("A"), max_concurrent_tasks=2, max_queue_size=10)
+        for i in range(4):
+            await manager.submit("A", i)
+
+        load = manager.get_load()
+        assert load["queued_tasks"] == 4
+        assert load["load_factor"] == 2.0
+        assert load["queue_utilization"] == 0.4
+        assert load["overloaded"] == False
+
+    def test_invalid_policy(self):
+        """Test that unknown overflow policies are rejected."""
+        with pytest.raises(ValueError):
+            AgentManager(overflow_policy="drop_everything")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
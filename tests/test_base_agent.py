@@ -8,10 +8,11 @@ from unittest.mock import patch, MagicMock
 import sys
 import os
 
-# Add the src directory to the path
+# Add the src directory and the repository root to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from base_agent import BaseAgent
+from base_agent import BaseAgent, blocking
 
 
 class TestAgent(BaseAgent):
@@ -22,6 +23,16 @@ class TestAgent(BaseAgent):
         return f"processed: {input_data}"
 
 
+class BlockingAgent(TestAgent):
+    """Test agent with a blocking helper method."""
+    
+    @blocking
+    def read_file(self, filepath):
+        """Read a file synchronously."""
+        with open(filepath) as f:
+            return f.read()
+
+
 class TestBaseAgent:
     """Test cases for BaseAgent functionality."""
     
@@ -66,6 +77,14 @@ class TestBaseAgent:
         result = await agent.process("test input")
         assert result == "processed: test input"
     
+    @pytest.mark.asyncio
+    async def test_process_batch(self):
+        """Test the default batch processing."""
+        agent = TestAgent("TestAgent")
+        
+        results = await agent.process_batch(["a", "b", "c"])
+        assert results == ["processed: a", "processed: b", "processed: c"]
+    
     def test_get_status(self):
         """Test status reporting."""
         config = {"test": "config"}
@@ -118,6 +137,27 @@ class TestBaseAgent:
         assert agent.history[0]["entry"] == 700  # 1200 - 500 = 700
         assert agent.history[-1]["entry"] == 1199
     
+    def test_history_size_from_config(self):
+        """Test that the history capacity can be configured."""
+        agent = TestAgent("TestAgent", {"history_size": 10})
+        
+        for i in range(25):
+            agent.add_to_history({"entry": i})
+        
+        assert len(agent.history) == 10
+        assert agent.history[0]["entry"] == 15
+        assert agent.get_status()["history_length"] == 10
+    
+    def test_history_payload_mode(self):
+        """Test that processed entries can drop their payloads."""
+        agent = TestAgent("TestAgent", {"history_payload": "length"})
+        
+        agent.add_to_history({"input": "abc", "output": "abcdef", "timestamp": 1.0})
+        
+        assert agent.history[0]["input"] == 3
+        assert agent.history[0]["output"] == 6
+        assert agent.history[0]["timestamp"] == 1.0
+    
     def test_save_load_config(self, tmp_path):
         """Test configuration save and load."""
         config = {"setting1": "value1", "setting2": 42}
@@ -132,6 +172,28 @@ class TestBaseAgent:
         
         assert loaded_agent.name == "OriginalAgent"
         assert loaded_agent.config == config
+    
+    @pytest.mark.asyncio
+    async def test_blocking_method(self, tmp_path):
+        """Test that blocking methods are awaited off the event loop."""
+        path = tmp_path / "data.txt"
+        path.write_text("contents")
+        agent = BlockingAgent("BlockingAgent")
+        
+        assert BlockingAgent.read_file.blocking == True
+        assert await agent.read_file(str(path)) == "contents"
+    
+    @pytest.mark.asyncio
+    async def test_save_load_config_async(self, tmp_path):
+        """Test the non-blocking configuration save and load."""
+        agent = TestAgent("AsyncAgent", {"setting": 1})
+        config_file = str(tmp_path / "config.json")
+        
+        await agent.save_config_async(config_file)
+        loaded_agent = await TestAgent.load_config_async(config_file)
+        
+        assert loaded_agent.name == "AsyncAgent"
+        assert loaded_agent.config == {"setting": 1}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,231 @@
+"""
+Test cases for the agent class registry and AgentManager.from_config.
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.agent_manager import AgentManager
+from src.base_agent import BaseAgent
+from src.example_agent import ExampleAgent
+from src.registry import register_agent_class, resolve_agent_class
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'agents.yaml')
+
+
+class ConstructionCountingAgent(BaseAgent):
+    """Agent that counts how many instances were built."""
+
+    instances = 0
+
+    def __init__(self, name, config=None):
+        super().__init__(name, config)
+        ConstructionCountingAgent.instances += 1
+
+    async def process(self, input_data):
+        return f"{self.name}:{input_data}"
+
+
+class TestRegistry:
+    """Test cases for resolving agent classes."""
+
+    def test_builtin_name(self):
+        """Test that ExampleAgent resolves by its short name."""
+        assert resolve_agent_class("ExampleAgent") is ExampleAgent
+
+    def test_dotted_path(self):
+        """Test that classes resolve by import path."""
+        assert resolve_agent_class("src.example_agent.ExampleAgent") is ExampleAgent
+
+    def test_unknown_name(self):
+        """Test that unknown classes raise KeyError."""
+        with pytest.raises(KeyError):
+            resolve_agent_class("NoSuchAgent")
+        with pytest.raises(KeyError):
+            resolve_agent_class("src.example_agent.NoSuchAgent")
+
+    def test_register_rejects_non_agents(self):
+        """Test that only BaseAgent subclasses can be registered."""
+        with pytest.raises(TypeError):
+            register_agent_class(dict)
+
+
+class TestFromConfig:
+    """Test cases for building a manager from YAML."""
+
+    def test_shipped_config(self):
+        """Test loading config/agents.yaml."""
+        manager = AgentManager.from_config(CONFIG_PATH)
+
+        assert manager.name == "DefaultAgentManager"
+        assert manager.task_timeout == 30
+        status = manager.get_manager_status()
+        assert status["total_agents"] == 2
+        assert status["pending_agents"] == 2
+        assert manager.agents == {}
+
+    @pytest.mark.asyncio
+    async def test_agents_are_built_on_first_use(self):
+        """Test that only invoked agents are constructed, with merged config."""
+        manager = AgentManager.from_config(CONFIG_PATH)
+
+        result = await manager.process_with_agent("text_processor", "hello")
+
+        assert result == "📝 Processed: hello"
+        agent = manager.agents["text_processor"]
+        assert agent.is_active
+        assert agent.config["log_level"] == "INFO"
+        assert agent.config["max_length"] == 500
+        assert "data_analyzer" not in manager.agents
+        assert manager.get_agent_status("data_analyzer")["instantiated"] is False
+
+    @pytest.mark.asyncio
+    async def test_many_agents_stay_lazy(self, tmp_path):
+        """Test that hundreds of configured agents cost nothing until used."""
+        class_path = f"{__name__}.ConstructionCountingAgent"
+        lines = ["agents:"]
+        for i in range(300):
+            lines.append(f"  agent_{i}:\n    class: \"{class_path}\"")
+        path = tmp_path / "agents.yaml"
+        path.write_text("\n".join(lines))
+        ConstructionCountingAgent.instances = 0
+
+        manager = AgentManager.from_config(str(path), max_concurrent_tasks=2)
+        assert ConstructionCountingAgent.instances == 0
+
+        await manager.start()
+        assert await manager.run_task("agent_7", "x") == "agent_7:x"
+        await manager.stop()
+        assert ConstructionCountingAgent.instances == 1
+
+    @pytest.mark.asyncio
+    async def test_broadcast_builds_pending_agents(self):
+        """Test that broadcasts include agents that were still lazy."""
+        manager = AgentManager.from_config(CONFIG_PATH)
+
+        results = await manager.process_with_all_agents("x")
+
+        assert set(results) == {"text_processor", "data_analyzer"}
+
+    def test_lazy_agent_lifecycle(self):
+        """Test unregistering and stopping agents that were never built."""
+        manager = AgentManager.from_config(CONFIG_PATH)
+
+        assert manager.stop_agent("data_analyzer")
+        assert manager._get_agent("data_analyzer").is_active is False
+        assert manager.unregister_agent("text_processor")
+        assert not manager.register_agent(ExampleAgent("data_analyzer"))
+        assert manager.get_manager_status()["agent_names"] == ["data_analyzer"]
+
+
+def write_config(path, agents):
+    """Write an agents section with the given prefix per agent."""
+    lines = ["agents:"]
+    for name, prefix in agents.items():
+        lines.append(
+            f"  {name}:\n    class: \"ExampleAgent\"\n    config:\n"
+            f"      prefix: \"{prefix}\"\n      processing_delay: 0.05"
+        )
+    path.write_text("\n".join(lines))
+
+
+class TestHotReload:
+    """Test cases for reloading the config file."""
+
+    @pytest.mark.asyncio
+    async def test_config_is_updated_in_place(self, tmp_path):
+        """Test that running agents pick up new settings without restarting."""
+        path = tmp_path / "agents.yaml"
+        write_config(path, {"a": "old: "})
+        manager = AgentManager.from_config(str(path))
+        agent = manager._get_agent("a")
+
+        write_config(path, {"a": "new: "})
+        changes = await manager.reload_config()
+
+        assert changes == {"added": [], "updated": ["a"], "removed": []}
+        assert manager.agents["a"] is agent
+        assert await manager.process_with_agent("a", "x") == "new: x"
+        assert agent.config["max_length"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_agents_are_added_and_removed(self, tmp_path):
+        """Test that removed agents drain their in-flight calls first."""
+        path = tmp_path / "agents.yaml"
+        write_config(path, {"a": "a: ", "b": "b: "})
+        manager = AgentManager.from_config(str(path))
+        running = asyncio.ensure_future(manager.process_with_agent("a", "x"))
+        await asyncio.sleep(0.01)
+        agent = manager.agents["a"]
+
+        write_config(path, {"b": "b: ", "c": "c: "})
+        changes = await manager.reload_config()
+
+        assert changes == {"added": ["c"], "updated": [], "removed": ["a"]}
+        assert await running == "a: x"
+        assert not agent.is_active
+        with pytest.raises(KeyError):
+            await manager.process_with_agent("a", "x")
+        assert await manager.process_with_agent("c", "x") == "c: x"
+
+    @pytest.mark.asyncio
+    async def test_class_change_drains_only_the_old_instance(self, tmp_path):
+        """Test that calls on a same-named replacement do not delay the drain."""
+        path = tmp_path / "agents.yaml"
+        write_config(path, {"a": "a: "})
+        manager = AgentManager.from_config(str(path))
+        old_agent = manager._get_agent("a")
+
+        path.write_text(
+            "agents:\n  a:\n    class: \"src.example_agent.ExampleAgent\"\n"
+            "    config:\n      processing_delay: 0.5"
+        )
+        reload = asyncio.ensure_future(manager.reload_config(drain_timeout=5))
+        await asyncio.sleep(0)
+        new_agent = manager._get_agent("a")
+        slow = asyncio.ensure_future(manager.process_with_agent("a", "x"))
+        await asyncio.sleep(0.01)
+
+        changes = await asyncio.wait_for(reload, 0.3)
+
+        assert changes == {"added": ["a"], "updated": [], "removed": ["a"]}
+        assert new_agent is not old_agent
+        assert not old_agent.is_active
+        assert not slow.done()
+        await slow
+
+    @pytest.mark.asyncio
+    async def test_broken_file_keeps_running_config(self, tmp_path):
+        """Test that a reload failure changes nothing."""
+        path = tmp_path / "agents.yaml"
+        write_config(path, {"a": "a: "})
+        manager = AgentManager.from_config(str(path))
+
+        path.write_text("agents:\n  a:\n    config: {}\n")
+        with pytest.raises(ValueError):
+            await manager.reload_config()
+
+        assert await manager.process_with_agent("a", "x") == "a: x"
+
+    @pytest.mark.asyncio
+    async def test_watcher_reloads_on_change(self, tmp_path):
+        """Test that the watcher applies edits to the file."""
+        path = tmp_path / "agents.yaml"
+        write_config(path, {"a": "a: "})
+        manager = AgentManager.from_config(str(path))
+        manager.start_config_watch(interval=0.01)
+
+        write_config(path, {"a": "a2: "})
+        os.utime(path, ns=(0, 10 ** 18))
+        for _ in range(100):
+            if manager.get_agent_status("a")["config"]["prefix"] == "a2: ":
+                break
+            await asyncio.sleep(0.01)
+        await manager.stop_config_watch()
+
+        assert await manager.process_with_agent("a", "x") == "a2: x"
@@ -0,0 +1,120 @@
+"""
+Test cases for the financial_advisor package's import behavior and
+pipeline planning.
+
+These run without google-adk or credentials installed.
+"""
+
+import pytest
+import importlib
+import subprocess
+import sys
+import os
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import src.financial_advisor as financial_advisor
+from src.financial_advisor.pipeline import STEPS, Step, external_inputs, plan_stages
+
+
+class TestLazyImport:
+    """Test cases for side-effect-free imports."""
+
+    def test_import_does_not_touch_google(self):
+        """Test that importing the package and its modules needs no google libraries."""
+        importlib.import_module("src.financial_advisor.agent")
+        importlib.import_module("src.financial_advisor.sub_agents.data_analyst")
+
+        assert "google.auth" not in sys.modules
+        assert "google.adk" not in sys.modules
+
+    def test_builders_are_exposed(self):
+        """Test that agent builders are reachable without building anything."""
+        from src.financial_advisor.sub_agents.risk_analyst import create_risk_analyst_agent
+
+        assert callable(financial_advisor.agent.create_financial_coordinator)
+        assert callable(create_risk_analyst_agent)
+
+    def test_imports_as_top_level_package(self):
+        """Test that the package imports with only src/ on the path, as adk web loads it."""
+        src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+        code = (
+            "import sys; sys.path[:] = [p for p in sys.path if p not in ('', '.')]; "
+            f"sys.path.insert(0, {os.path.abspath(src_dir)!r}); "
+            "import financial_advisor, financial_advisor.rate_limits, "
+            "financial_advisor.agent, financial_advisor.pipeline, "
+            "financial_advisor.sub_agents.data_analyst"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_unknown_attribute(self):
+        """Test that the lazy __getattr__ still raises AttributeError."""
+        assert not hasattr(financial_advisor, "no_such_agent")
+
+
+class TestEnvironment:
+    """Test cases for deferred Google Cloud configuration."""
+
+    def test_existing_project_skips_credential_lookup(self, monkeypatch):
+        """Test that a configured project avoids calling google.auth."""
+        monkeypatch.setattr(financial_advisor, "_environment_configured", False)
+        monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
+        monkeypatch.delenv("GOOGLE_CLOUD_LOCATION", raising=False)
+        monkeypatch.delenv("GOOGLE_GENAI_USE_VERTEXAI", raising=False)
+
+        financial_advisor.configure_environment()
+
+        assert "google.auth" not in sys.modules
+        assert os.environ["GOOGLE_CLOUD_LOCATION"] == "global"
+        assert os.environ["GOOGLE_GENAI_USE_VERTEXAI"] == "True"
+
+
+def step(name, output_key, *inputs):
+    """Build a pipeline step that is never instantiated."""
+    return Step(name, None, output_key, tuple(inputs))
+
+
+class TestPipelinePlanning:
+    """Test cases for grouping pipeline steps into stages."""
+
+    def test_analyst_steps_form_a_chain(self):
+        """Test that the current prompt contracts leave no step independent."""
+        stages = plan_stages(STEPS)
+
+        assert [[s.name for s in stage] for stage in stages] == [
+            ["data_analyst"], ["trading_analyst"], ["execution_analyst"], ["risk_analyst"]
+        ]
+        assert external_inputs(STEPS) == [
+            "provided_ticker",
+            "user_risk_attitude",
+            "user_investment_period",
+            "user_execution_preferences",
+        ]
+
+    def test_independent_steps_share_a_stage(self):
+        """Test that steps reading only earlier outputs run together."""
+        steps = [
+            step("data", "market", "ticker"),
+            step("news", "sentiment", "market"),
+            step("trading", "strategy", "market"),
+            step("risk", "assessment", "strategy", "sentiment"),
+        ]
+
+        stages = plan_stages(steps)
+
+        assert [[s.name for s in stage] for stage in stages] == [
+            ["data"], ["news", "trading"], ["risk"]
+        ]
+
+    def test_cycles_and_duplicate_outputs_are_rejected(self):
+        """Test that invalid graphs raise ValueError."""
+        with pytest.raises(ValueError):
+            plan_stages([step("a", "x", "y"), step("b", "y", "x")])
+        with pytest.raises(ValueError):
+            plan_stages([step("a", "x"), step("b", "x")])
@@ -0,0 +1,200 @@
+"""
+Test cases for agent history storage.
+"""
+
+import pytest
+import subprocess
+import sys
+import os
+import time
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.history import HistoryBuffer, HistoryEntry, summarize_payload
+from src.history_journal import HistoryJournal
+
+
+class TestHistoryBuffer:
+    """Test cases for the ring buffer."""
+
+    def test_append_and_index(self):
+        """Test list-like access before the buffer wraps."""
+        buffer = HistoryBuffer(3)
+        buffer.append("a")
+        buffer.append("b")
+
+        assert len(buffer) == 2
+        assert buffer[0] == "a"
+        assert buffer[-1] == "b"
+        assert buffer == ["a", "b"]
+
+    def test_overwrites_oldest_when_full(self):
+        """Test that the oldest entries are evicted first."""
+        buffer = HistoryBuffer(3)
+        for i in range(7):
+            buffer.append(i)
+
+        assert len(buffer) == 3
+        assert list(buffer) == [4, 5, 6]
+        assert buffer[0] == 4
+        assert buffer[-1] == 6
+        assert buffer[1:] == [5, 6]
+
+    def test_index_out_of_range(self):
+        """Test that indexing past the end raises IndexError."""
+        buffer = HistoryBuffer(2)
+        buffer.append("a")
+
+        with pytest.raises(IndexError):
+            buffer[1]
+        with pytest.raises(IndexError):
+            buffer[-2]
+
+    def test_clear(self):
+        """Test that clearing empties the buffer."""
+        buffer = HistoryBuffer(2)
+        buffer.append("a")
+        buffer.append("b")
+        buffer.append("c")
+        buffer.clear()
+
+        assert len(buffer) == 0
+        assert buffer == []
+        buffer.append("d")
+        assert buffer == ["d"]
+
+    def test_invalid_capacity(self):
+        """Test that a non-positive capacity is rejected."""
+        with pytest.raises(ValueError):
+            HistoryBuffer(0)
+
+
+class TestHistoryEntry:
+    """Test cases for compact history records."""
+
+    def test_mapping_access(self):
+        """Test that entries read like the dicts they replace."""
+        entry = HistoryEntry.from_dict(
+            {"input": "in", "output": "out", "timestamp": 1.5}
+        )
+
+        assert entry["input"] == "in"
+        assert entry.get("output") == "out"
+        assert entry.get("missing", "default") == "default"
+        assert entry == {"input": "in", "output": "out", "timestamp": 1.5}
+        with pytest.raises(KeyError):
+            entry["missing"]
+
+    def test_has_no_instance_dict(self):
+        """Test that entries are slotted."""
+        entry = HistoryEntry("in", "out", 0.0)
+
+        assert not hasattr(entry, "__dict__")
+
+    def test_accepts(self):
+        """Test which dict entries are converted."""
+        assert HistoryEntry.accepts({"input": 1, "output": 2})
+        assert HistoryEntry.accepts({"input": 1, "output": 2, "timestamp": 3})
+        assert not HistoryEntry.accepts({"action": "test"})
+        assert not HistoryEntry.accepts({"input": 1, "output": 2, "extra": 3})
+
+    def test_payload_modes(self):
+        """Test that payloads can be reduced to lengths or hashes."""
+        assert summarize_payload("hello", "full") == "hello"
+        assert summarize_payload("hello", "length") == 5
+        assert summarize_payload("hello", "hash") == summarize_payload("hello", "hash")
+        assert isinstance(summarize_payload("hello", "hash"), int)
+        with pytest.raises(ValueError):
+            summarize_payload("hello", "bogus")
+
+
+class TestHistoryJournal:
+    """Test cases for the on-disk history journal."""
+
+    def test_entries_are_batched(self, tmp_path):
+        """Test that nothing is written until a batch fills up."""
+        journal = HistoryJournal(str(tmp_path), batch_size=3)
+        journal.append({"n": 1}, timestamp=1.0)
+        journal.append({"n": 2}, timestamp=2.0)
+
+        assert list(tmp_path.iterdir()) == []
+
+        journal.append({"n": 3}, timestamp=3.0)
+        journal.close()
+
+        assert [r["entry"]["n"] for r in journal.query()] == [1, 2, 3]
+
+    def test_old_entries_are_flushed_on_append(self, tmp_path):
+        """Test that a partial batch is written once it is flush_interval old."""
+        journal = HistoryJournal(str(tmp_path), batch_size=100, flush_interval=0.05)
+        journal.append({"n": 1}, timestamp=1.0)
+        time.sleep(0.06)
+        journal.append({"n": 2}, timestamp=2.0)
+        journal._last_write.result()
+
+        assert len(list(tmp_path.iterdir())) == 1
+        journal.close()
+
+    def test_buffered_entries_survive_exit_without_close(self, tmp_path):
+        """Test that the atexit hook writes what is still buffered."""
+        root = os.path.join(os.path.dirname(__file__), '..')
+        code = (
+            f"import sys; sys.path.insert(0, {os.path.abspath(root)!r}); "
+            "from src.history_journal import HistoryJournal; "
+            f"journal = HistoryJournal({str(tmp_path)!r}, batch_size=2); "
+            "journal.append({'n': 1}); journal.append({'n': 2}); journal.append({'n': 3})"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+        assert [r["entry"]["n"] for r in HistoryJournal(str(tmp_path)).query()] == [1, 2, 3]
+
+    def test_query_by_time_range(self, tmp_path):
+        """Test time-range queries across several segments."""
+        journal = HistoryJournal(str(tmp_path), batch_size=2, segment_max_bytes=64)
+        for i in range(20):
+            journal.append(HistoryEntry(i, i, None), timestamp=float(i))
+
+        records = journal.query(start=5, end=8)
+
+        assert [r["ts"] for r in records] == [5.0, 6.0, 7.0, 8.0]
+        assert records[0]["entry"]["input"] == 5
+        assert len(list(tmp_path.iterdir())) > 1
+        journal.close()
+
+    def test_reopen_appends_to_existing_segments(self, tmp_path):
+        """Test that a new journal continues an existing directory."""
+        first = HistoryJournal(str(tmp_path))
+        first.append({"n": 1}, timestamp=1.0)
+        first.close()
+
+        second = HistoryJournal(str(tmp_path))
+        second.append({"n": 2}, timestamp=2.0)
+
+        assert [r["entry"]["n"] for r in second.query()] == [1, 2]
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_agent_journals_history(self, tmp_path):
+        """Test that an agent keeps journaled history beyond its buffer."""
+        from src.example_agent import ExampleAgent
+
+        agent = ExampleAgent("Journaled", {
+            "processing_delay": 0,
+            "history_size": 2,
+            "history_journal": str(tmp_path)
+        })
+        agent.start()
+        for i in range(5):
+            await agent.process(i)
+        agent.stop()
+
+        assert len(agent.history) == 2
+        records = await agent.aquery_history()
+        assert [r["entry"]["input"] for r in records] == ["0", "1", "2", "3", "4"]
+        assert agent.query_history(start=records[2]["ts"]) == records[2:]
+        agent.journal.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,82 @@
+"""
+Test cases for agent call metrics.
+"""
+
+import pytest
+import sys
+import os
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics import LatencyHistogram, MetricsRegistry
+
+
+class TestLatencyHistogram:
+    """Test cases for the latency histogram."""
+
+    def test_empty_histogram(self):
+        """Test that percentiles are undefined without samples."""
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(0.5) is None
+        assert histogram.snapshot()["count"] == 0
+
+    def test_percentiles(self):
+        """Test percentile estimates from bucketed samples."""
+        histogram = LatencyHistogram(buckets=(1, 2, 3, 4))
+        for _ in range(90):
+            histogram.observe(0.5)
+        for _ in range(10):
+            histogram.observe(3.5)
+
+        assert 0 < histogram.percentile(0.50) <= 1
+        assert 3 < histogram.percentile(0.99) <= 4
+        assert histogram.count == 100
+
+    def test_overflow_bucket(self):
+        """Test that samples above the last bound are counted."""
+        histogram = LatencyHistogram(buckets=(1,))
+        histogram.observe(100)
+
+        assert histogram.counts == [0, 1]
+        assert histogram.percentile(0.99) == 1
+
+
+class TestMetricsRegistry:
+    """Test cases for the per-agent registry."""
+
+    def test_snapshot(self):
+        """Test call, outcome and in-flight tracking."""
+        registry = MetricsRegistry()
+        metrics = registry.for_agent("A")
+        metrics.start()
+        metrics.start()
+        metrics.finish(0.01, "ok")
+
+        snapshot = registry.snapshot()["A"]
+        assert snapshot["calls"] == 2
+        assert snapshot["in_flight"] == 1
+        assert snapshot["errors"] == 0
+        assert snapshot["latency"]["count"] == 1
+
+    def test_prometheus_export(self):
+        """Test the Prometheus text exposition."""
+        registry = MetricsRegistry(buckets=(0.1, 1))
+        metrics = registry.for_agent('my"agent')
+        metrics.start()
+        metrics.finish(0.5, "error")
+
+        text = registry.to_prometheus()
+
+        assert '# TYPE agent_calls_total counter' in text
+        assert 'agent_calls_total{agent="my\\"agent"} 1' in text
+        assert 'agent_call_outcomes_total{agent="my\\"agent",outcome="error"} 1' in text
+        assert 'agent_latency_seconds_bucket{agent="my\\"agent",le="0.1"} 0' in text
+        assert 'agent_latency_seconds_bucket{agent="my\\"agent",le="1"} 1' in text
+        assert 'agent_latency_seconds_bucket{agent="my\\"agent",le="+Inf"} 1' in text
+        assert text.endswith("\n")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,149 @@
+"""
+Test cases for financial_advisor model routing.
+"""
+
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.financial_advisor.model_routing import ModelRouter
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def call(router, clock, agent_name, seconds, invocation="inv"):
+    """Route one model call that takes the given time and return its model."""
+    context = SimpleNamespace(agent_name=agent_name, invocation_id=invocation)
+    request = SimpleNamespace(model=None)
+    router.before_model_callback(context, request)
+    router.start_latency_clock(context, request)
+    clock.now += seconds
+    router.after_model_callback(context, None)
+    return request.model
+
+
+class TestTierSelection:
+    """Test cases for static tier configuration."""
+
+    def test_defaults(self):
+        """Test that the coordinator is fast and the analysts strong."""
+        router = ModelRouter()
+
+        assert router.model_for("financial_coordinator") == "gemini-1.5-flash"
+        assert router.model_for("risk_analyst_agent") == "gemini-1.5-pro"
+        assert router.model_for("unknown_agent") == "gemini-1.5-pro"
+
+    def test_from_env(self):
+        """Test tier models, agent tiers and SLOs from the environment."""
+        router = ModelRouter.from_env({
+            "FINANCIAL_ADVISOR_FAST_MODEL": "gemini-2.0-flash",
+            "FINANCIAL_ADVISOR_DATA_ANALYST_AGENT_TIER": "fast",
+            "FINANCIAL_ADVISOR_STRONG_SLO_SECONDS": "5",
+        })
+
+        assert router.model_for("data_analyst_agent") == "gemini-2.0-flash"
+        assert router.latency_slo["strong"] == 5.0
+
+    def test_unknown_tier(self):
+        """Test that agents cannot be assigned a tier without a model."""
+        with pytest.raises(ValueError):
+            ModelRouter(agent_tiers={"risk_analyst_agent": "huge"})
+
+
+class TestFallback:
+    """Test cases for falling back on latency SLO breaches."""
+
+    def test_slow_tier_falls_back_and_recovers(self):
+        """Test that a breached SLO routes to the fallback for the cooldown."""
+        clock = FakeClock()
+        router = ModelRouter(
+            latency_slo={"strong": 1.0, "fast": 1.0}, window=3, cooldown=60, clock=clock
+        )
+
+        models = [call(router, clock, "risk_analyst_agent", 2.0) for _ in range(4)]
+
+        assert models == ["gemini-1.5-pro"] * 3 + ["gemini-1.5-flash"]
+        assert router.stats()["degraded"] == ["strong"]
+        assert router.fallback_calls == 1
+
+        clock.now += 60
+        assert call(router, clock, "risk_analyst_agent", 0.1) == "gemini-1.5-pro"
+
+    def test_fast_calls_keep_primary_tier(self):
+        """Test that calls within the SLO never fall back."""
+        clock = FakeClock()
+        router = ModelRouter(window=2, clock=clock)
+
+        models = {call(router, clock, "trading_analyst_agent", 1.0) for _ in range(5)}
+
+        assert models == {"gemini-1.5-pro"}
+        assert router.stats()["median_latency"]["strong"] == 1.0
+
+    def test_only_first_streamed_chunk_counts(self):
+        """Test that later after-callbacks of a streamed call are ignored."""
+        clock = FakeClock()
+        router = ModelRouter(window=1, clock=clock)
+        context = SimpleNamespace(agent_name="data_analyst_agent", invocation_id="inv")
+        request = SimpleNamespace(model=None)
+        router.before_model_callback(context, request)
+        router.start_latency_clock(context, request)
+        clock.now += 1.0
+        router.after_model_callback(context, None)
+        clock.now += 100.0
+        router.after_model_callback(context, None)
+
+        assert router.stats()["median_latency"]["strong"] == 1.0
+
+    def test_rate_limit_wait_is_not_latency(self):
+        """Test that time before start_latency_clock is not held against the tier."""
+        clock = FakeClock()
+        router = ModelRouter(latency_slo={"strong": 1.0}, window=1, clock=clock)
+        context = SimpleNamespace(agent_name="risk_analyst_agent", invocation_id="inv")
+        request = SimpleNamespace(model=None)
+
+        router.before_model_callback(context, request)
+        clock.now += 30.0  # throttled by the rate limiter
+        router.start_latency_clock(context, request)
+        clock.now += 0.5
+        router.after_model_callback(context, None)
+
+        assert router.stats()["median_latency"]["strong"] == 0.5
+        assert router.stats()["degraded"] == []
+
+
+class TestPendingCalls:
+    """Test cases for cleaning up calls that never complete."""
+
+    def test_failed_calls_are_forgotten(self):
+        """Test that the error callback drops the call's entry."""
+        router = ModelRouter()
+        context = SimpleNamespace(agent_name="data_analyst_agent", invocation_id="inv")
+        request = SimpleNamespace(model=None)
+        router.before_model_callback(context, request)
+        router.start_latency_clock(context, request)
+
+        router.on_model_error_callback(context, request, RuntimeError("quota"))
+
+        assert router._pending == {}
+        assert router.stats()["median_latency"] == {}
+
+    def test_pending_calls_are_bounded(self):
+        """Test that abandoned calls cannot grow the table without limit."""
+        router = ModelRouter(max_pending=3)
+        for i in range(10):
+            context = SimpleNamespace(agent_name="data_analyst_agent", invocation_id=str(i))
+            router.before_model_callback(context, SimpleNamespace(model=None))
+
+        assert [invocation for invocation, _ in router._pending] == ["7", "8", "9"]
@@ -0,0 +1,133 @@
+"""
+Test cases for financial_advisor token budget profiling.
+"""
+
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import src.financial_advisor as financial_advisor
+from src.financial_advisor.pipeline import inject_state_inputs
+from src.financial_advisor.profiling import (
+    TokenProfiler,
+    budget_report,
+    compact_text,
+    estimate_tokens,
+)
+
+REPORT = "\n".join(
+    ["**Market Analysis Report for: AAPL**", "Intro paragraph. " * 20]
+    + [f"**{n}. Section**\n" + "Long detail sentence. " * 40 for n in range(1, 8)]
+)
+
+
+def content(text):
+    return SimpleNamespace(parts=[SimpleNamespace(text=text)])
+
+
+class TestBudgets:
+    """Test cases for static budget reports."""
+
+    def test_estimate_tokens(self):
+        """Test the character-based estimate."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcdefgh") == 2
+
+    def test_compact_keeps_structure_within_limit(self):
+        """Test that compaction keeps headings and respects the size."""
+        compacted = compact_text(REPORT, max_chars=300)
+
+        assert len(compacted) < 400
+        assert compacted.startswith("**Market Analysis Report for: AAPL**")
+        assert "**1. Section**" in compacted
+        assert compact_text("short") == "short"
+
+    def test_report_counts_only_keys_an_agent_reads(self):
+        """Test per-agent state accounting and the compact mode saving."""
+        state = {"provided_ticker": "AAPL", "market_data_analysis_output": REPORT}
+
+        rows = {row["agent"]: row for row in budget_report(state)}
+        compact_rows = {row["agent"]: row for row in budget_report(state, compact=True, max_chars=300)}
+
+        assert rows["data_analyst_agent"]["state_breakdown"] == {"provided_ticker": 1}
+        assert rows["trading_analyst_agent"]["state_tokens"] > 1000
+        assert compact_rows["trading_analyst_agent"]["state_tokens"] < 150
+        assert rows["financial_coordinator"]["instruction_tokens"] > 0
+
+
+class TestTokenProfiler:
+    """Test cases for the per-call profiling callback."""
+
+    def test_records_calls_and_compacts_history(self):
+        """Test that calls are recorded and earlier turns are compacted."""
+        profiler = TokenProfiler(compact=True, max_chars=300)
+        history, current = content(REPORT), content("Now assess the risk.")
+        request = SimpleNamespace(
+            contents=[history, current],
+            config=SimpleNamespace(system_instruction="You are a risk analyst."),
+        )
+
+        result = profiler.before_model_callback(
+            SimpleNamespace(agent_name="risk_analyst_agent"), request
+        )
+
+        assert result is None
+        assert len(history.parts[0].text) < 400
+        assert current.parts[0].text == "Now assess the risk."
+        row = profiler.report()[0]
+        assert row["agent"] == "risk_analyst_agent"
+        assert row["calls"] == 1
+        assert row["instruction_tokens"] == estimate_tokens("You are a risk analyst.")
+
+    def test_attach_walks_agent_tools(self):
+        """Test that attaching reaches agents wrapped in AgentTools."""
+        child = SimpleNamespace(before_model_callback=None, sub_agents=[], tools=[])
+        root = SimpleNamespace(
+            before_model_callback=print, sub_agents=[], tools=[SimpleNamespace(agent=child)]
+        )
+        profiler = TokenProfiler()
+
+        profiler.attach(root)
+
+        assert root.before_model_callback == [print, profiler.before_model_callback]
+        assert child.before_model_callback == profiler.before_model_callback
+
+    def test_attach_to_pipeline(self, monkeypatch):
+        """Test that workflow agents are walked through rather than profiled."""
+        pytest.importorskip("google.adk")
+        from src.financial_advisor.pipeline import create_pipeline_agent
+        from src.financial_advisor.search_cache import FakeSearchBackend
+
+        monkeypatch.setattr(financial_advisor, "_environment_configured", True)
+        pipeline = create_pipeline_agent(search_backend=FakeSearchBackend())
+        profiler = TokenProfiler()
+
+        profiler.attach(pipeline)
+
+        for step in pipeline.sub_agents:
+            assert step.before_model_callback[-1] == profiler.before_model_callback
+
+
+class TestPipelineCompaction:
+    """Test cases for compacting the inputs rendered into step instructions."""
+
+    def test_long_inputs_are_compacted(self):
+        """Test that max_chars shortens upstream outputs but not short inputs."""
+        state = {"market_data_analysis_output": REPORT, "user_risk_attitude": "Balanced"}
+        context = SimpleNamespace(state=state)
+
+        def render(max_chars):
+            agent = SimpleNamespace(instruction="Propose strategies.")
+            inject_state_inputs(agent, list(state), max_chars)
+            return agent.instruction(context)
+
+        full, compacted = render(None), render(300)
+
+        assert REPORT in full
+        assert len(compacted) < len(full) - 1000
+        assert "**Market Analysis Report for: AAPL**" in compacted
+        assert "user_risk_attitude:\nBalanced" in compacted
@@ -0,0 +1,205 @@
+"""
+Test cases for token-bucket rate limiting.
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.agent_manager import AgentManager
+from src.example_agent import ExampleAgent
+from src.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    agent_key,
+    model_key,
+    model_rate_limit_callback,
+)
+from src.financial_advisor.rate_limits import limiter_from_env
+
+
+class TestTokenBucket:
+    """Test cases for a single bucket."""
+
+    def test_burst_then_empty(self):
+        """Test that the bucket allows a burst up to capacity."""
+        bucket = TokenBucket(rate=1, capacity=3)
+
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        """Test that callers wait instead of failing when empty."""
+        bucket = TokenBucket(rate=50, capacity=1)
+
+        assert await bucket.acquire() == 0
+        waited = await bucket.acquire()
+
+        assert 0.01 < waited < 0.1
+        stats = bucket.stats()
+        assert stats["acquired"] == 2
+        assert stats["waits"] == 1
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter:
+    """Test cases for keyed limits."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_keys_do_not_wait(self):
+        """Test that keys without a limit pass straight through."""
+        limiter = RateLimiter()
+
+        assert await limiter.acquire("agent:a", None) == 0
+
+    @pytest.mark.asyncio
+    async def test_model_limit_is_shared_between_agents(self):
+        """Test that agents using one model share its quota."""
+        limiter = RateLimiter()
+        limiter.set_limit(model_key("m"), rate=20, burst=1)
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        await asyncio.gather(
+            limiter.acquire(*limiter.keys_for("a", "m")),
+            limiter.acquire(*limiter.keys_for("b", "m")),
+            limiter.acquire(*limiter.keys_for("c", "m")),
+        )
+
+        assert loop.time() - started >= 0.09
+        assert limiter.stats()[model_key("m")]["acquired"] == 3
+
+    @pytest.mark.asyncio
+    async def test_adk_callback(self):
+        """Test the before_model_callback used by ADK agents."""
+        limiter = RateLimiter()
+        limiter.set_limit(model_key("gemini"), rate=100, burst=1)
+        callback = model_rate_limit_callback(limiter)
+
+        result = await callback(
+            SimpleNamespace(agent_name="analyst"),
+            SimpleNamespace(model="gemini"),
+        )
+
+        assert result is None
+        assert limiter.stats()[model_key("gemini")]["acquired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_default_limit_applies_per_key(self):
+        """Test that unlisted keys of a kind each get their own bucket."""
+        limiter = RateLimiter()
+        limiter.set_default_limit("model", rate=100, burst=1)
+
+        await limiter.acquire(model_key("a"), model_key("b"), agent_key("x"))
+
+        assert sorted(limiter.stats()) == [model_key("a"), model_key("b")]
+
+    def test_invalid_limits_are_rejected(self):
+        """Test that settings that could never admit a call fail up front."""
+        limiter = RateLimiter()
+
+        with pytest.raises(ValueError):
+            limiter.set_default_limit("model", rate=0)
+        with pytest.raises(ValueError):
+            limiter.set_limit(model_key("m"), rate=1, burst=0)
+
+
+class TestManagerRateLimits:
+    """Test cases for rate limits in AgentManager."""
+
+    @pytest.mark.asyncio
+    async def test_agent_calls_are_throttled(self):
+        """Test that manager calls wait on the agent's bucket."""
+        limiter = RateLimiter()
+        limiter.set_limit(agent_key("A"), rate=20, burst=1)
+        manager = AgentManager(rate_limiter=limiter)
+        manager.register_agent(ExampleAgent("A", {"processing_delay": 0}))
+        manager.start_all_agents()
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        for i in range(3):
+            await manager.process_with_agent("A", i)
+
+        assert loop.time() - started >= 0.09
+        status = manager.get_manager_status()["rate_limits"]
+        assert status[agent_key("A")]["waits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_batches_take_one_token_per_input(self):
+        """Test that a batch cannot get around the agent's rate limit."""
+        limiter = RateLimiter()
+        limiter.set_limit(agent_key("A"), rate=100, burst=2)
+        manager = AgentManager(rate_limiter=limiter)
+        manager.register_agent(ExampleAgent("A", {"processing_delay": 0}))
+        manager.start_all_agents()
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        results = await manager.process_batch_with_agent("A", range(10))
+
+        assert len(results) == 10
+        assert loop.time() - started >= 0.07
+        assert limiter.stats()[agent_key("A")]["acquired"] == 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+class TestFinancialAdvisorLimits:
+    """Test cases for the financial_advisor model call limits."""
+
+    @pytest.mark.asyncio
+    async def test_calls_wait_per_agent_and_model(self):
+        """Test that the callback throttles each agent and each model."""
+        limiter = limiter_from_env({
+            "FINANCIAL_ADVISOR_MODEL_RPM": "6000",
+            "FINANCIAL_ADVISOR_MODEL_BURST": "1",
+            "FINANCIAL_ADVISOR_AGENT_RPM": "3000",
+            "FINANCIAL_ADVISOR_AGENT_BURST": "1",
+        })
+        callback = model_rate_limit_callback(limiter)
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        for agent in ("data_analyst", "risk_analyst"):
+            for _ in range(2):
+                await callback(
+                    SimpleNamespace(agent_name=agent),
+                    SimpleNamespace(model="gemini"),
+                )
+
+        assert loop.time() - started >= 0.035
+        stats = limiter.stats()
+        assert stats[model_key("gemini")]["acquired"] == 4
+        assert stats[model_key("gemini")]["waits"] >= 1
+        assert stats[agent_key("data_analyst")]["waits"] == 1
+        assert stats[agent_key("risk_analyst")]["waits"] == 1
+
+    def test_agents_are_unlimited_by_default(self):
+        """Test that only models are limited without agent settings."""
+        limiter = limiter_from_env({})
+
+        assert set(limiter.default_limits) == {"model"}
+        assert limiter.default_limits["model"] == (1.0, 5.0)
+
+    @pytest.mark.parametrize("name, value", [
+        ("FINANCIAL_ADVISOR_MODEL_RPM", "0"),
+        ("FINANCIAL_ADVISOR_MODEL_RPM", "fast"),
+        ("FINANCIAL_ADVISOR_MODEL_BURST", "0.5"),
+        ("FINANCIAL_ADVISOR_AGENT_RPM", "-1"),
+    ])
+    def test_invalid_settings_are_rejected(self, name, value):
+        """Test that settings that would divide by zero or hang raise ValueError."""
+        with pytest.raises(ValueError, match=name):
+            limiter_from_env({name: value})
@@ -0,0 +1,251 @@
+"""
+Test cases for retry policies and circuit breakers.
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.agent_manager import AgentManager, AgentTimeoutError
+from src.base_agent import BaseAgent
+from src.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class FlakyAgent(BaseAgent):
+    """Agent that fails a fixed number of times before succeeding."""
+
+    def __init__(self, name, failures, error=ConnectionError, config=None):
+        super().__init__(name, config)
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def process(self, input_data):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error("transient")
+        return input_data
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_manager(agent, **kwargs):
+    manager = AgentManager(**kwargs)
+    manager.register_agent(agent)
+    agent.start()
+    return manager
+
+
+class TestRetryPolicy:
+    """Test cases for backoff and retry decisions."""
+
+    def test_backoff_grows_and_is_capped(self):
+        """Test exponential growth up to max_delay without jitter."""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3, jitter=False)
+
+        assert [policy.backoff(n) for n in (1, 2, 3)] == pytest.approx([0.1, 0.2, 0.3])
+
+    def test_jitter_stays_below_cap(self):
+        """Test that full jitter scales the cap by the random value."""
+        policy = RetryPolicy(base_delay=1.0, rng=lambda: 0.25)
+
+        assert policy.backoff(2) == pytest.approx(0.5)
+
+    def test_should_retry(self):
+        """Test the attempt limit and the retryable predicate."""
+        policy = RetryPolicy(max_attempts=2)
+
+        assert policy.should_retry(ConnectionError(), 1)
+        assert not policy.should_retry(ConnectionError(), 2)
+        assert not policy.should_retry(ValueError(), 1)
+
+
+class TestCircuitBreaker:
+    """Test cases for breaker state transitions."""
+
+    def test_opens_after_threshold_and_recovers(self):
+        """Test closed -> open -> half open -> closed."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+        clock.now = 10
+        assert breaker.allow()
+        assert not breaker.allow()  # only one trial call
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_trial_reopens(self):
+        """Test that a failing half-open trial opens the circuit again."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 5
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert breaker.retry_after() == 5
+        assert breaker.stats()["times_opened"] == 2
+
+
+class TestManagerResilience:
+    """Test cases for retries and breakers in AgentManager."""
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_retried(self):
+        """Test that retryable errors are retried until success."""
+        agent = FlakyAgent("flaky", failures=2)
+        manager = make_manager(
+            agent, retry_policy=RetryPolicy(max_attempts=3, base_delay=0.001)
+        )
+
+        assert await manager.process_with_agent("flaky", "x") == "x"
+        assert agent.calls == 3
+        assert manager.get_manager_status()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_backoff_counts_as_in_flight(self):
+        """Test that a call waiting to retry still counts against its agent."""
+        agent = FlakyAgent("flaky", failures=1)
+        manager = make_manager(
+            agent, retry_policy=RetryPolicy(base_delay=0.1, jitter=False)
+        )
+
+        call = asyncio.ensure_future(manager.process_with_agent("flaky", "x"))
+        await asyncio.sleep(0.05)
+
+        assert agent.calls == 1
+        assert agent.calls_in_flight == 1
+        assert await call == "x"
+        assert agent.calls_in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_errors_fail_immediately(self):
+        """Test that errors rejected by the predicate are not retried."""
+        agent = FlakyAgent("flaky", failures=1, error=ValueError)
+        manager = make_manager(agent, retry_policy=RetryPolicy(base_delay=0.001))
+
+        with pytest.raises(ValueError):
+            await manager.process_with_agent("flaky", "x")
+        assert agent.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_upstream_timeouts_are_retried(self):
+        """Test that a timeout raised by the agent itself is retried."""
+        agent = FlakyAgent("slow", failures=1, error=asyncio.TimeoutError)
+        manager = make_manager(
+            agent, task_timeout=1, retry_policy=RetryPolicy(base_delay=0.001)
+        )
+
+        assert await manager.process_with_agent("slow", "x") == "x"
+        assert agent.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_deadline_bounds_all_attempts(self):
+        """Test that timeout= is an upper bound even when retries are on."""
+        class HangingAgent(FlakyAgent):
+            async def process(self, input_data):
+                self.calls += 1
+                await asyncio.sleep(1)
+
+        agent = HangingAgent("hang", failures=0)
+        manager = make_manager(agent, retry_policy=RetryPolicy())
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        with pytest.raises(AgentTimeoutError):
+            await manager.process_with_agent("hang", "x", timeout=0.2)
+
+        assert loop.time() - started < 0.3
+        assert agent.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_share_the_deadline(self):
+        """Test that retries only get the time left by earlier attempts."""
+        agent = FlakyAgent("flaky", failures=100)
+        manager = make_manager(
+            agent,
+            retry_policy=RetryPolicy(max_attempts=100, base_delay=0.05, jitter=False)
+        )
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        with pytest.raises(ConnectionError):
+            await manager.process_with_agent("flaky", "x", timeout=0.12)
+
+        assert loop.time() - started < 0.12
+        assert agent.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        """Test that an unhealthy agent is not called once its circuit opens."""
+        agent = FlakyAgent("dead", failures=100)
+        manager = make_manager(
+            agent, circuit_breaker={"failure_threshold": 2, "recovery_timeout": 60}
+        )
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await manager.process_with_agent("dead", "x")
+        with pytest.raises(CircuitOpenError):
+            await manager.process_with_agent("dead", "x")
+
+        assert agent.calls == 2
+        status = manager.get_agent_status("dead")
+        assert status["circuit"]["state"] == "open"
+        assert status["circuit"]["rejected_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_agent_can_opt_out_of_breaker(self):
+        """Test that "circuit_breaker": False disables the breaker."""
+        agent = FlakyAgent("dead", failures=100, config={"circuit_breaker": False})
+        manager = make_manager(agent, circuit_breaker={"failure_threshold": 1})
+
+        for _ in range(3):
+            with pytest.raises(ConnectionError):
+                await manager.process_with_agent("dead", "x")
+        assert agent.calls == 3
+        assert "circuit" not in manager.get_agent_status("dead")
+
+    @pytest.mark.asyncio
+    async def test_broadcast_returns_circuit_errors(self):
+        """Test that open circuits surface as exceptions in broadcasts."""
+        agent = FlakyAgent("dead", failures=100)
+        manager = make_manager(agent, circuit_breaker={"failure_threshold": 1})
+
+        await manager.process_with_all_agents("x")
+        results = await manager.process_with_all_agents("x")
+
+        assert isinstance(results["dead"], CircuitOpenError)
+
+    @pytest.mark.asyncio
+    async def test_batches_pass_the_breaker(self):
+        """Test that failing batches open the circuit and are then refused."""
+        agent = FlakyAgent("dead", failures=100)
+        manager = make_manager(agent, circuit_breaker={"failure_threshold": 1})
+
+        with pytest.raises(ConnectionError):
+            await manager.process_batch_with_agent("dead", ["x", "y"])
+        with pytest.raises(CircuitOpenError):
+            await manager.process_batch_with_agent("dead", ["x", "y"])
+
+        assert agent.calls == 2
@@ -0,0 +1,114 @@
+"""
+Test cases for the agent result cache.
+"""
+
+import pytest
+import sys
+import os
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.agent_manager import AgentManager
+from src.example_agent import ExampleAgent
+from src.result_cache import ResultCache, make_cache_key
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache:
+    """Test cases for LRU and TTL behaviour."""
+
+    def test_hit_and_miss(self):
+        """Test that stored results are returned and counted."""
+        cache = ResultCache()
+        key = ("agent", "cfg", "input")
+
+        assert cache.lookup(key) == (False, None)
+        cache.store(key, "result")
+        assert cache.lookup(key) == (True, "result")
+
+        stats = cache.stats("agent")
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used result is evicted."""
+        cache = ResultCache(max_entries=2)
+        cache.store(("a", "", "1"), 1)
+        cache.store(("a", "", "2"), 2)
+        cache.lookup(("a", "", "1"))
+        cache.store(("a", "", "3"), 3)
+
+        assert cache.lookup(("a", "", "2")) == (False, None)
+        assert cache.lookup(("a", "", "1")) == (True, 1)
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test that results expire after the TTL."""
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, clock=clock)
+        cache.store(("a", "", "x"), "value")
+
+        clock.now = 9
+        assert cache.lookup(("a", "", "x")) == (True, "value")
+        clock.now = 11
+        assert cache.lookup(("a", "", "x")) == (False, None)
+        assert cache.stats("a")["expired"] == 1
+
+    def test_key_tracks_config_and_input(self):
+        """Test that keys ignore dict order but not config changes."""
+        agent = ExampleAgent("A")
+        key = make_cache_key(agent, {"x": 1, "y": 2})
+
+        assert key == make_cache_key(agent, {"y": 2, "x": 1})
+        assert key != make_cache_key(agent, {"x": 1, "y": 3})
+        agent.config["prefix"] = "changed"
+        assert key != make_cache_key(agent, {"x": 1, "y": 2})
+
+
+class TestManagerCaching:
+    """Test cases for caching in AgentManager."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_are_served_from_cache(self):
+        """Test that a repeated call does not reach the agent."""
+        agent = ExampleAgent("A", {"processing_delay": 0})
+        manager = AgentManager(result_cache=ResultCache())
+        manager.register_agent(agent)
+        manager.start_all_agents()
+
+        first = await manager.process_with_agent("A", "hello")
+        second = await manager.process_with_agent("A", "hello")
+
+        assert first == second
+        assert len(agent.history) == 1
+        cache_stats = manager.get_agent_status("A")["cache"]
+        assert cache_stats["hits"] == 1
+        assert cache_stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_agents_can_opt_out(self):
+        """Test that "cache": False bypasses the cache."""
+        agent = ExampleAgent("A", {"processing_delay": 0, "cache": False})
+        manager = AgentManager(result_cache=ResultCache())
+        manager.register_agent(agent)
+        manager.start_all_agents()
+
+        await manager.process_with_agent("A", "hello")
+        await manager.process_with_agent("A", "hello")
+
+        assert len(agent.history) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,130 @@
+"""
+Test cases for priority and fair scheduling.
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.base_agent import BaseAgent
+from src.agent_manager import AgentManager
+from src.scheduling import FairQueue, Priority
+
+
+class RecordingAgent(BaseAgent):
+    """Test agent that records the order inputs are processed in."""
+
+    def __init__(self, name, order):
+        super().__init__(name)
+        self.order = order
+
+    async def process(self, input_data):
+        """Record the input and return it."""
+        self.order.append(input_data)
+        await asyncio.sleep(0)
+        return input_data
+
+
+def drain(queue):
+    """Return every queued item in dequeue order."""
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+        queue.task_done()
+    return items
+
+
+class TestFairQueue:
+    """Test cases for the fair queue."""
+
+    def test_priority_classes_are_strict(self):
+        """Test that higher priority items always come first."""
+        queue = FairQueue()
+        queue.put_nowait("bulk", priority=Priority.BULK)
+        queue.put_nowait("normal", priority=Priority.NORMAL)
+        queue.put_nowait("interactive", priority=Priority.INTERACTIVE)
+
+        assert drain(queue) == ["interactive", "normal", "bulk"]
+
+    def test_fifo_within_a_flow(self):
+        """Test that a single flow keeps submission order."""
+        queue = FairQueue()
+        for i in range(5):
+            queue.put_nowait(i, flow="a")
+
+        assert drain(queue) == [0, 1, 2, 3, 4]
+
+    def test_flows_are_interleaved(self):
+        """Test that a backlog in one flow does not starve another."""
+        queue = FairQueue()
+        for i in range(4):
+            queue.put_nowait(f"a{i}", flow="a")
+        for i in range(2):
+            queue.put_nowait(f"b{i}", flow="b")
+
+        assert drain(queue) == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+    def test_weights(self):
+        """Test that a flow with twice the weight gets twice the share."""
+        queue = FairQueue()
+        queue.set_weight("heavy", 2)
+        for i in range(6):
+            queue.put_nowait("heavy", flow="heavy")
+            queue.put_nowait("light", flow="light")
+
+        first_six = drain(queue)[:6]
+        assert first_six.count("heavy") == 4
+        assert first_six.count("light") == 2
+
+    def test_maxsize(self):
+        """Test that a bounded queue rejects items when full."""
+        queue = FairQueue(maxsize=1)
+        queue.put_nowait("a")
+
+        assert queue.full()
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait("b")
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_items(self):
+        """Test that get blocks until an item is queued."""
+        queue = FairQueue()
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        queue.put_nowait("item")
+        assert await getter == "item"
+        queue.task_done()
+        await queue.join()
+
+
+class TestManagerPriorities:
+    """Test cases for priorities in the manager's worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_jumps_ahead_of_bulk(self):
+        """Test that interactive work runs before a queued backfill."""
+        order = []
+        manager = AgentManager(max_concurrent_tasks=1)
+        manager.register_agent(RecordingAgent("A", order))
+        manager.start_all_agents()
+
+        for i in range(5):
+            await manager.submit("A", f"bulk{i}", priority=Priority.BULK, tenant="backfill")
+        task_id = await manager.submit("A", "urgent", priority=Priority.INTERACTIVE)
+
+        await manager.start()
+        assert await manager.get_result(task_id) == "urgent"
+        await manager.stop()
+
+        assert order[0] == "urgent"
+        assert order[1:] == [f"bulk{i}" for i in range(5)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
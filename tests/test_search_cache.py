@@ -0,0 +1,181 @@
+"""
+Test cases for the financial_advisor search-result cache.
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+import threading
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import src.financial_advisor as financial_advisor
+from src.financial_advisor.search_cache import (
+    DEFAULT_CACHE_PATH,
+    CachedSearch,
+    FakeSearchBackend,
+    SearchBackend,
+    SearchCache,
+    classify_query,
+    make_search_tool,
+    search_backend_from_env,
+)
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestClassification:
+    """Test cases for query categories."""
+
+    def test_categories(self):
+        """Test that queries map to their freshness category."""
+        assert classify_query("AAPL 10-Q filing") == "filings"
+        assert classify_query("AAPL analyst price target") == "analyst"
+        assert classify_query("AAPL latest news") == "news"
+        assert classify_query("AAPL revenue by segment") == "general"
+
+
+class TestCachedSearch:
+    """Test cases for cached lookups."""
+
+    def test_repeat_queries_hit_the_cache(self):
+        """Test that equivalent queries for a ticker reach the backend once."""
+        backend = FakeSearchBackend()
+        search = CachedSearch(backend)
+
+        first, cached_first = search.search("AAPL SEC filings", "aapl")
+        second, cached_second = search.search("  aapl sec   FILINGS ", "AAPL")
+
+        assert first == second
+        assert (cached_first, cached_second) == (False, True)
+        assert backend.queries == ["AAPL SEC filings"]
+        assert search.stats()["hit_rate"] == 0.5
+
+    def test_freshness_depends_on_category(self):
+        """Test that news expires long before filings do."""
+        clock = FakeClock()
+        backend = FakeSearchBackend()
+        search = CachedSearch(backend, SearchCache(clock=clock))
+        search.search("MSFT news", "MSFT")
+        search.search("MSFT 10-K", "MSFT")
+
+        clock.now += 2 * 3600
+        _, news_cached = search.search("MSFT news", "MSFT")
+        _, filing_cached = search.search("MSFT 10-K", "MSFT")
+
+        assert not news_cached
+        assert filing_cached
+        assert search.cache.purge() == 0
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Test that a file-backed cache survives reopening."""
+        path = str(tmp_path / "cache" / "search.db")
+        CachedSearch(FakeSearchBackend(), SearchCache(path)).search("GOOGL analyst ratings", "GOOGL")
+
+        backend = FakeSearchBackend()
+        _, cached = CachedSearch(backend, SearchCache(path)).search("GOOGL analyst ratings", "GOOGL")
+
+        assert cached
+        assert backend.queries == []
+
+    @pytest.mark.asyncio
+    async def test_tool_function(self):
+        """Test the function tool handed to the data analyst."""
+        backend = FakeSearchBackend({"NVDA news": [{"title": "t", "url": "u", "snippet": "s"}]})
+        tool = make_search_tool(CachedSearch(backend))
+
+        assert await tool("NVDA news", "NVDA") == {
+            "results": [{"title": "t", "url": "u", "snippet": "s"}],
+            "cached": False,
+        }
+        assert (await tool("NVDA news", "NVDA"))["cached"] is True
+
+    @pytest.mark.asyncio
+    async def test_tool_does_not_block_the_loop(self):
+        """Test that a slow backend runs off the event loop thread."""
+        started = threading.Event()
+        release = threading.Event()
+
+        class SlowBackend(FakeSearchBackend):
+            def search(self, query):
+                self.thread = threading.current_thread()
+                started.set()
+                release.wait(5)
+                return super().search(query)
+
+        backend = SlowBackend()
+        search = asyncio.ensure_future(make_search_tool(CachedSearch(backend))("AAPL news", "AAPL"))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+
+        # The loop is still free to run other work while the search waits
+        assert not search.done()
+        release.set()
+        assert (await search)["cached"] is False
+        assert backend.thread is not threading.current_thread()
+
+    def test_backend_is_abstract(self):
+        """Test that a backend must implement search."""
+        with pytest.raises(TypeError):
+            SearchBackend()
+
+
+class TestWiring:
+    """Test cases for handing a search backend to the agents."""
+
+    def test_backend_from_env(self, tmp_path):
+        """Test that the environment selects the backend class and cache file."""
+        path = str(tmp_path / "search.db")
+        search = search_backend_from_env({
+            "FINANCIAL_ADVISOR_SEARCH_BACKEND": "src.financial_advisor.search_cache.FakeSearchBackend",
+            "FINANCIAL_ADVISOR_SEARCH_CACHE": path,
+        })
+
+        search.search("AAPL 10-K", "AAPL")
+
+        assert isinstance(search.backend, FakeSearchBackend)
+        assert len(SearchCache(path)) == 1
+        assert search_backend_from_env({}) is None
+
+    def test_env_cache_defaults_to_a_file(self, monkeypatch, tmp_path):
+        """Test that an env-configured search persists unless asked not to."""
+        path = str(tmp_path / "default" / "search.db")
+        monkeypatch.setattr(
+            "src.financial_advisor.search_cache.DEFAULT_CACHE_PATH", path
+        )
+        backend = {"FINANCIAL_ADVISOR_SEARCH_BACKEND": "src.financial_advisor.search_cache.FakeSearchBackend"}
+
+        search_backend_from_env(backend).search("AAPL 10-K", "AAPL")
+        memory = search_backend_from_env({**backend, "FINANCIAL_ADVISOR_SEARCH_CACHE": ":memory:"})
+
+        assert len(SearchCache(path)) == 1
+        assert len(memory.cache) == 0
+        assert DEFAULT_CACHE_PATH.endswith("search_cache.db")
+
+    def test_builders_use_the_backend(self, monkeypatch):
+        """Test that the coordinator and pipeline swap google_search for web_search."""
+        pytest.importorskip("google.adk")
+        from src.financial_advisor.agent import create_financial_coordinator
+        from src.financial_advisor.pipeline import create_pipeline_agent
+
+        monkeypatch.setattr(financial_advisor, "_environment_configured", True)
+        backend = FakeSearchBackend()
+
+        coordinator_analyst = create_financial_coordinator(backend).tools[0].agent
+        pipeline_analyst = create_pipeline_agent(search_backend=backend).sub_agents[0]
+
+        for analyst in (coordinator_analyst, pipeline_analyst):
+            assert analyst.name == "data_analyst_agent"
+            assert [tool.__name__ for tool in analyst.tools] == ["web_search"]
+        assert "the web_search (arguments: query, ticker) tool" in coordinator_analyst.instruction
+        assert "Google Search" not in coordinator_analyst.instruction
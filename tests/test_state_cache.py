@@ -0,0 +1,137 @@
+"""
+Test cases for the financial_advisor state snapshot cache.
+"""
+
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.financial_advisor.state_cache import (
+    StateSnapshotStore,
+    attach_state_cache,
+    snapshot_callbacks,
+    snapshot_key,
+    state_store_from_env,
+)
+
+STATE = {
+    "provided_ticker": "AAPL",
+    "user_risk_attitude": "moderate",
+    "user_investment_period": "long-term",
+    "user_execution_preferences": "limit orders",
+}
+
+
+def today():
+    return "2025-01-02"
+
+
+class TestSnapshotKeys:
+    """Test cases for keying outputs on their inputs."""
+
+    def test_market_data_ignores_risk_profile(self):
+        """Test that market data is shared across risk profiles."""
+        other = dict(STATE, user_risk_attitude="aggressive")
+
+        assert snapshot_key("market_data_analysis_output", STATE, today) == \
+            snapshot_key("market_data_analysis_output", other, today)
+        assert snapshot_key("proposed_trading_strategies_output", STATE, today) != \
+            snapshot_key("proposed_trading_strategies_output", other, today)
+
+    def test_keys_are_scoped_to_the_day(self):
+        """Test that the date is part of every key."""
+        assert snapshot_key("market_data_analysis_output", STATE, today) != \
+            snapshot_key("market_data_analysis_output", STATE, lambda: "2025-01-03")
+
+    def test_missing_inputs_disable_caching(self):
+        """Test that outputs are not cached without all their inputs."""
+        assert snapshot_key("execution_plan_output", {"provided_ticker": "AAPL"}, today) is None
+        assert snapshot_key("financial_coordinator_output", STATE, today) is None
+
+
+class TestSnapshotStore:
+    """Test cases for storing and restoring outputs."""
+
+    def test_same_ticker_different_risk_profile(self, tmp_path):
+        """Test that a follow-up session reuses market data but not strategies."""
+        path = str(tmp_path / "snapshots.db")
+        store = StateSnapshotStore(path, today=today)
+        state = dict(STATE, market_data_analysis_output="report",
+                     proposed_trading_strategies_output="strategies")
+        assert store.save("market_data_analysis_output", state)
+        assert store.save("proposed_trading_strategies_output", state)
+
+        follow_up = StateSnapshotStore(path, today=today)
+        new_state = dict(STATE, user_risk_attitude="conservative")
+
+        assert follow_up.load("market_data_analysis_output", new_state) == "report"
+        assert follow_up.load("proposed_trading_strategies_output", new_state) is None
+        assert follow_up.stats() == {"hits": 1, "misses": 1, "entries": 2}
+
+    def test_after_callback_records_output(self):
+        """Test that the after callback saves what the agent wrote."""
+        store = StateSnapshotStore(today=today)
+        before, after = snapshot_callbacks(store, "market_data_analysis_output")
+        context = SimpleNamespace(state=dict(STATE))
+
+        assert before(context) is None
+        context.state["market_data_analysis_output"] = "report"
+        assert after(context) is None
+
+        assert store.load("market_data_analysis_output", STATE) == "report"
+
+    def test_attach_keeps_existing_callbacks(self):
+        """Test that attaching chains onto callbacks already set."""
+        existing = object()
+        agent = SimpleNamespace(
+            name="risk_analyst_agent",
+            output_key="final_risk_assessment_output",
+            before_agent_callback=existing,
+            after_agent_callback=None,
+        )
+
+        attach_state_cache(agent, StateSnapshotStore(today=today))
+
+        assert agent.before_agent_callback[0] is existing
+        assert len(agent.before_agent_callback) == 2
+        assert callable(agent.after_agent_callback)
+
+
+class TestWiring:
+    """Test cases for configuring snapshots from the environment."""
+
+    def test_store_from_env(self, tmp_path):
+        """Test that the environment opts in to a file-backed store."""
+        path = str(tmp_path / "state" / "snapshots.db")
+
+        store = state_store_from_env({"FINANCIAL_ADVISOR_STATE_CACHE": path})
+
+        assert isinstance(store, StateSnapshotStore)
+        assert os.path.exists(path)
+        assert state_store_from_env({}) is None
+
+    def test_pipeline_root_agent_uses_the_store(self, monkeypatch, tmp_path):
+        """Test that pipeline mode attaches the configured store to every step."""
+        pytest.importorskip("google.adk")
+        import src.financial_advisor as financial_advisor
+        from src.financial_advisor import agent as agent_module
+
+        monkeypatch.setattr(financial_advisor, "_environment_configured", True)
+        monkeypatch.setenv("FINANCIAL_ADVISOR_MODE", "pipeline")
+        monkeypatch.setenv("FINANCIAL_ADVISOR_STATE_CACHE", str(tmp_path / "snapshots.db"))
+        monkeypatch.delenv("FINANCIAL_ADVISOR_SEARCH_BACKEND", raising=False)
+        monkeypatch.delitem(vars(agent_module), "root_agent", raising=False)
+
+        try:
+            root_agent = agent_module.root_agent
+        finally:
+            # Do not leave the pipeline cached as the module's root_agent
+            vars(agent_module).pop("root_agent", None)
+
+        for step in root_agent.sub_agents:
+            assert step.before_agent_callback is not None
+            assert step.after_agent_callback is not None
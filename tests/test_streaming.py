@@ -0,0 +1,129 @@
+"""
+Test cases for streaming financial_advisor output.
+"""
+
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the repository root to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import src.financial_advisor as financial_advisor
+from src.financial_advisor.callbacks import add_callback
+from src.financial_advisor.model_routing import router
+from src.financial_advisor.streaming import StreamChunk, stream_advice, text_chunks
+
+
+def event(author, text, partial):
+    return SimpleNamespace(
+        author=author,
+        partial=partial,
+        content=SimpleNamespace(parts=[SimpleNamespace(text=text)]) if text is not None else None,
+    )
+
+
+async def replay(*events):
+    for item in events:
+        yield item
+
+
+class TestTextChunks:
+    """Test cases for turning events into chunks."""
+
+    @pytest.mark.asyncio
+    async def test_partials_stream_and_final_is_not_repeated(self):
+        """Test that callers can concatenate chunks without duplication."""
+        events = replay(
+            event("data_analyst_agent", "**Market ", True),
+            event("data_analyst_agent", "Analysis**", True),
+            event("data_analyst_agent", "**Market Analysis**", False),
+            event("trading_analyst_agent", None, False),
+            event("trading_analyst_agent", "Strategy", False),
+        )
+
+        chunks = [chunk async for chunk in text_chunks(events)]
+
+        assert chunks == [
+            StreamChunk("data_analyst_agent", "**Market ", False),
+            StreamChunk("data_analyst_agent", "Analysis**", False),
+            StreamChunk("data_analyst_agent", "", True),
+            StreamChunk("trading_analyst_agent", "Strategy", True),
+        ]
+        assert "".join(c.text for c in chunks if c.author == "data_analyst_agent") == \
+            "**Market Analysis**"
+
+
+class TestPipelineRun:
+    """Test cases for a whole pipeline run against the stub model."""
+
+    @pytest.mark.asyncio
+    async def test_state_inputs_reach_the_analysts(self, monkeypatch):
+        """Test that the state seeded into the session is in every step's instruction."""
+        pytest.importorskip("google.adk")
+        from src.financial_advisor.pipeline import STEPS, create_pipeline_agent
+        from src.financial_advisor.search_cache import FakeSearchBackend
+        from src.financial_advisor.sub_agents.data_analyst import create_data_analyst_agent
+
+        monkeypatch.setattr(financial_advisor, "_environment_configured", True)
+        monkeypatch.setitem(router.tiers, "fast", "stub-fast")
+        monkeypatch.setitem(router.tiers, "strong", "stub-strong")
+
+        instructions = {}
+        contents = {}
+
+        def capture(callback_context, llm_request):
+            instructions[callback_context.agent_name] = llm_request.config.system_instruction
+            contents[callback_context.agent_name] = [
+                part.text for content in llm_request.contents
+                for part in content.parts or [] if part.text
+            ]
+
+        def capturing(build):
+            def build_with_capture():
+                agent = build()
+                add_callback(agent, "before_model_callback", capture)
+                return agent
+            return build_with_capture
+
+        steps = [
+            step._replace(build=capturing(
+                (lambda: create_data_analyst_agent(FakeSearchBackend()))
+                if step.name == "data_analyst" else step.build
+            ))
+            for step in STEPS
+        ]
+        state = {
+            "provided_ticker": "AAPL",
+            "user_risk_attitude": "Balanced",
+            "user_investment_period": "5 years",
+            "user_execution_preferences": "limit orders",
+        }
+
+        chunks = [
+            chunk async for chunk in stream_advice(
+                create_pipeline_agent(steps), "Analyze AAPL", state=state
+            )
+        ]
+
+        assert [chunk.author for chunk in chunks if chunk.done] == [
+            "data_analyst_agent",
+            "trading_analyst_agent",
+            "execution_analyst_agent",
+            "risk_analyst_agent",
+        ]
+        assert "provided_ticker:\nAAPL" in instructions["data_analyst_agent"]
+        trading = instructions["trading_analyst_agent"]
+        assert "user_risk_attitude:\nBalanced" in trading
+        assert "user_investment_period:\n5 years" in trading
+        assert "market_data_analysis_output:\n[stub-strong] Analyze AAPL" in trading
+        assert "user_execution_preferences:\nlimit orders" in instructions["risk_analyst_agent"]
+
+        # Upstream outputs arrive through the instruction only, not also as
+        # quoted replies in the request history
+        assert contents["data_analyst_agent"] == ["Analyze AAPL"]
+        for name in ("trading_analyst_agent", "execution_analyst_agent", "risk_analyst_agent"):
+            assert contents[name] == []
+        request = trading + "".join(contents["trading_analyst_agent"])
+        assert request.count("[stub-strong] Analyze AAPL") == 1